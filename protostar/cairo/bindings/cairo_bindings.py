@@ -25,6 +25,15 @@ class TestCollectorOutput:
     collected_tests: list[tuple[str, AvailableGas]]
 
 
+def get_compiler_fingerprint() -> str:
+    """
+    Identifies the loaded compiler bindings build. Used for invalidating compilation caches.
+    """
+    bindings_path = Path(cairo_python_bindings.__file__)  # pyright: ignore
+    bindings_stat = bindings_path.stat()
+    return f"{bindings_path}:{bindings_stat.st_size}:{bindings_stat.st_mtime_ns}"
+
+
 def compile_starknet_contract_to_casm_from_path(
     input_path: Path,
     output_path: Optional[Path] = None,
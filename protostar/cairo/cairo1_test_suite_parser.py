@@ -1,6 +1,7 @@
 # pylint: disable="protected-access"
+import json
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Union
 
 from starkware.cairo.lang.compiler.program import Program
 from starkware.starkware_utils.marshmallow_dataclass_fields import IntAsHex
@@ -37,6 +38,9 @@ class ProtostarCasm:
     program: Program
     offset_map: dict[TestName, Offset]
 
+    _MAGIC = b"PSCASM01"
+    _FELT_SIZE = 32
+
     @classmethod
     def from_json(cls, casm_json: dict):
         prime: int = IntAsHex()._deserialize(casm_json["prime"], None, None)  # pylint
@@ -45,7 +49,68 @@ class ProtostarCasm:
         ]
         instruction_pc_to_hint = build_instruction_pc_to_hint(casm_json)
 
-        program = Program(
+        offset_map = {
+            case["name"]: int(case["offset"]) for case in casm_json["test_entry_points"]
+        }
+        return cls(
+            program=cls._build_program(prime, data, instruction_pc_to_hint),
+            offset_map=offset_map,
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the CASM into a compact binary form: a JSON header with prime, hints and offsets,
+        followed by the bytecode packed as fixed-size big-endian felts.
+        """
+        header = json.dumps(
+            {
+                "prime": hex(self.program.prime),
+                "hints": [
+                    [pc, [hint.code for hint in hints]]
+                    for pc, hints in self.program.hints.items()
+                ],
+                "offset_map": self.offset_map,
+            }
+        ).encode("utf-8")
+        bytecode = b"".join(
+            word.to_bytes(self._FELT_SIZE, "big") for word in self.program.data
+        )
+        return self._MAGIC + len(header).to_bytes(4, "little") + header + bytecode
+
+    @classmethod
+    def from_bytes(cls, buffer: Union[bytes, memoryview]):
+        buffer = memoryview(buffer)
+        magic_length = len(cls._MAGIC)
+        if bytes(buffer[:magic_length]) != cls._MAGIC:
+            raise ValueError("Not a serialized ProtostarCasm")
+        header_start = magic_length + 4
+        header_length = int.from_bytes(buffer[magic_length:header_start], "little")
+        bytecode_start = header_start + header_length
+        header = json.loads(bytes(buffer[header_start:bytecode_start]))
+
+        felt_size = cls._FELT_SIZE
+        data = [
+            int.from_bytes(buffer[offset : offset + felt_size], "big")
+            for offset in range(bytecode_start, len(buffer), felt_size)
+        ]
+        instruction_pc_to_hint = {
+            int(pc): [CairoHintCode(code, [None], None) for code in codes]
+            for pc, codes in header["hints"]
+        }
+        return cls(
+            program=cls._build_program(
+                int(header["prime"], 16), data, instruction_pc_to_hint
+            ),
+            offset_map=header["offset_map"],
+        )
+
+    @staticmethod
+    def _build_program(
+        prime: int,
+        data: list[int],
+        instruction_pc_to_hint: dict[InstructionPc, list[CairoHintCode]],
+    ) -> Program:
+        return Program(
             prime=prime,
             data=data,
             hints=instruction_pc_to_hint,
@@ -57,7 +122,3 @@ class ProtostarCasm:
             attributes=[],
             debug_info=None,
         )  # type: ignore
-        offset_map = {
-            case["name"]: int(case["offset"]) for case in casm_json["test_entry_points"]
-        }
-        return cls(program=program, offset_map=offset_map)
@@ -0,0 +1,23 @@
+from .cairo1_test_suite_parser import ProtostarCasm
+
+CASM_JSON = {
+    "prime": "0x800000000000011000000000000000000000000000000000000000000000001",
+    "bytecode": [
+        "0xa0680017fff8000",
+        "0x800000000000011000000000000000000000000000000000000000000000000",
+        "0x1",
+    ],
+    "hints": [[0, ["memory[ap + 0] = 1 <= memory[fp + -6];"]]],
+    "test_entry_points": [{"name": "test_a", "offset": 0}],
+}
+
+
+def test_binary_roundtrip():
+    protostar_casm = ProtostarCasm.from_json(CASM_JSON)
+
+    restored_casm = ProtostarCasm.from_bytes(protostar_casm.to_bytes())
+
+    assert restored_casm.offset_map == protostar_casm.offset_map
+    assert restored_casm.program.prime == protostar_casm.program.prime
+    assert restored_casm.program.data == protostar_casm.program.data
+    assert restored_casm.program.hints == protostar_casm.program.hints
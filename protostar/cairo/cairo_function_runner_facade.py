@@ -1,29 +1,75 @@
+import dataclasses
 from contextlib import contextmanager
-from typing import Optional, Any, Generator, Union
+from typing import Optional, Any, Generator, Sequence, Union
 
 from starkware.cairo.common.cairo_function_runner import CairoFunctionRunner
 from starkware.cairo.lang.compiler.program import Program
+from starkware.cairo.lang.vm.cairo_pie import ExecutionResources
+from starkware.cairo.lang.vm.memory_dict import MemoryDict
 from starkware.cairo.lang.vm.utils import RunResources
-from starkware.cairo.lang.vm.relocatable import MaybeRelocatable
+from starkware.cairo.lang.vm.relocatable import MaybeRelocatable, RelocatableValue
 from starkware.cairo.lang.vm.security import verify_secure_runner
 
+from protostar.cairo.cairo_profiler import get_active_profiler
 
 RUNNER_BUILTINS = ["pedersen", "range_check", "bitwise", "ec_op"]
 RUNNER_BUILTINS_TITLE_CASE = [
     "".join(x.title() for x in builtin.split("_")[:]) for builtin in RUNNER_BUILTINS
 ]
+RUNNER_LAYOUT = "starknet"
 
 
-class CairoRunnerFacade:
+class _PreparedCairoFunctionRunner(CairoFunctionRunner):
+    """
+    Function runner, which memory already contains the program.
+    """
+
+    def initialize_state(
+        self, entrypoint: Union[str, int], stack: Sequence[MaybeRelocatable]
+    ):
+        self.initial_pc = self.program_base + self._to_pc(entrypoint)
+        self.load_data(self.execution_base, stack)
+
+
+class CairoRunnerTemplate:
+    """
+    Runner scaffolding shared by all runs of the program, e.g. all test cases of a test suite.
+    The program is loaded into memory once, and each runner starts with a copy of that memory.
+    Runners initialize program, execution and builtin segments in the same order, so the copied
+    memory is valid for every runner.
+    """
+
     def __init__(self, program: Program):
+        self.program = program
+        template_runner = CairoFunctionRunner(program=program, layout=RUNNER_LAYOUT)
+        template_runner.load_data(template_runner.program_base, program.data)
+        self._memory_data = template_runner.memory.data
+        self._segments_count = template_runner.segments.n_segments
+
+    def create_runner(self) -> CairoFunctionRunner:
+        runner = _PreparedCairoFunctionRunner(
+            program=self.program,
+            layout=RUNNER_LAYOUT,
+            memory=MemoryDict(self._memory_data),
+        )
+        assert runner.segments.n_segments == self._segments_count
+        return runner
+
+
+class CairoRunnerFacade:
+    def __init__(
+        self, program: Program, runner_template: Optional[CairoRunnerTemplate] = None
+    ):
         self._program: Program = program
+        self._runner_template = runner_template or CairoRunnerTemplate(program)
+        assert self._runner_template.program is program
         self.current_runner: CairoFunctionRunner
         self._previous_runner: Optional[CairoFunctionRunner] = None
 
     @contextmanager
     def new_runner(self) -> Generator[CairoFunctionRunner, None, None]:
         self._previous_runner = None
-        runner = CairoFunctionRunner(program=self._program, layout="starknet")
+        runner = self._runner_template.create_runner()
         self.current_runner = runner
         yield runner
         self._previous_runner = runner
@@ -111,7 +157,12 @@ class CairoRunnerFacade:
             hint_locals=hint_locals, static_locals=static_locals
         )
 
-        function_runner.run_until_pc(addr=end, run_resources=run_resources)
+        profiler = get_active_profiler()
+        if profiler:
+            with profiler.profile_run(function_runner):
+                function_runner.run_until_pc(addr=end, run_resources=run_resources)
+        else:
+            function_runner.run_until_pc(addr=end, run_resources=run_resources)
         function_runner.end_run()
 
         if verify_secure:
@@ -135,6 +186,34 @@ class CairoRunnerFacade:
         ), "No runs were performed, so no return values are available!"
         return self._previous_runner.get_return_values(n_ret)
 
+    def get_execution_resources(self) -> ExecutionResources:
+        assert (
+            self._previous_runner
+        ), "No runs were performed, so no execution resources are available!"
+        runner = self._previous_runner
+        execution_resources = runner.get_execution_resources()
+        # The whole program is loaded, but a run executes only a small part of it,
+        # so the rest of the program is not counted as memory holes
+        return dataclasses.replace(
+            execution_resources,
+            n_memory_holes=execution_resources.n_memory_holes
+            - self._count_program_memory_holes(runner),
+        )
+
+    @staticmethod
+    def _count_program_memory_holes(runner: CairoFunctionRunner) -> int:
+        program_segment_index = runner.program_base.segment_index
+        accessed_program_cells_count = sum(
+            1
+            for address in runner.vm.accessed_addresses
+            if isinstance(address, RelocatableValue)
+            and address.segment_index == program_segment_index
+        )
+        return (
+            runner.segments.get_segment_used_size(program_segment_index)
+            - accessed_program_cells_count
+        )
+
     def did_panic(self) -> bool:
         return bool(self.get_panic_data())
 
@@ -0,0 +1,71 @@
+import dataclasses
+
+from starkware.cairo.lang.compiler.cairo_compile import compile_cairo
+from starkware.cairo.lang.compiler.program import Program
+from starkware.crypto.signature.signature import FIELD_PRIME
+
+from .cairo_function_runner_facade import (
+    CairoRunnerFacade,
+    CairoRunnerTemplate,
+)
+
+CAIRO_CODE = """
+func add(a, b) -> (res: felt) {
+    return (res=a + b);
+}
+"""
+
+# Roughly the size of a test suite compiled to CASM
+PROGRAM_PADDING_SIZE = 20_000
+
+
+def compile_program() -> Program:
+    program = compile_cairo(CAIRO_CODE, prime=FIELD_PRIME)
+    return dataclasses.replace(
+        program, data=[*program.data, *([0] * PROGRAM_PADDING_SIZE)]
+    )
+
+
+def test_runs_from_template_are_independent():
+    program = compile_program()
+    facade = CairoRunnerFacade(program, runner_template=CairoRunnerTemplate(program))
+
+    facade.run_by_function_name("add", 2, 3)
+    first_runner_memory_size = len(facade.current_runner.vm_memory)
+    first_result = facade.get_return_values(1)
+    facade.run_by_function_name("add", 4, 5)
+
+    assert first_result == [5]
+    assert facade.get_return_values(1) == [9]
+    assert len(facade.current_runner.vm_memory) == first_runner_memory_size
+
+
+def test_runners_from_template_share_program_but_not_memory():
+    program = compile_program()
+    runner_template = CairoRunnerTemplate(program)
+
+    first_runner = runner_template.create_runner()
+    second_runner = runner_template.create_runner()
+    first_runner.memory[first_runner.segments.add()] = 42
+
+    assert first_runner.program is second_runner.program is program
+    assert first_runner.memory is not second_runner.memory
+    assert len(second_runner.memory) == len(program.data)
+    assert [
+        second_runner.memory[second_runner.program_base + offset]
+        for offset in range(len(program.data))
+    ] == program.data
+
+
+def test_unexecuted_program_is_not_counted_as_memory_holes():
+    program = compile_program()
+    unpadded_program = compile_cairo(CAIRO_CODE, prime=FIELD_PRIME)
+    facade = CairoRunnerFacade(program)
+    unpadded_facade = CairoRunnerFacade(unpadded_program)
+
+    facade.run_by_function_name("add", 2, 3)
+    unpadded_facade.run_by_function_name("add", 2, 3)
+
+    execution_resources = facade.get_execution_resources()
+    assert execution_resources == unpadded_facade.get_execution_resources()
+    assert execution_resources.n_memory_holes < PROGRAM_PADDING_SIZE
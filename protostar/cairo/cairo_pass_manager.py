@@ -5,6 +5,7 @@ from starkware.cairo.lang.compiler.preprocessor.default_pass_manager import (
     default_pass_manager,
 )
 
+from .parsed_module_cache import use_parsed_module_cache
 from .pass_manager import PassManagerConfig, PassManagerFactory
 
 
@@ -12,7 +13,10 @@ class CairoPassManagerFactory(PassManagerFactory):
     @staticmethod
     def build(config: PassManagerConfig) -> PassManager:
         read_module = get_module_reader(cairo_path=config.include_paths).read
-        return default_pass_manager(
-            prime=DEFAULT_PRIME,
-            read_module=read_module,
+        return use_parsed_module_cache(
+            default_pass_manager(
+                prime=DEFAULT_PRIME,
+                read_module=read_module,
+            ),
+            cache_io=config.cache_io,
         )
@@ -0,0 +1,186 @@
+import gzip
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Generator, Optional
+
+from starkware.cairo.lang.tracer.third_party.profile_pb2 import Profile
+from starkware.cairo.lang.vm.cairo_runner import CairoRunner
+from starkware.starknet.public.abi import get_selector_from_name
+
+Offset = int
+FunctionNames = dict[Offset, str]
+CallStack = tuple[str, ...]
+"""Function names from the outermost to the innermost one."""
+
+
+@dataclass
+class _ProfiledRun:
+    runner: CairoRunner
+    program_name: str
+    function_names: FunctionNames
+    parent_step: int
+    prefix: CallStack = ()
+    children: dict[int, list["_ProfiledRun"]] = field(default_factory=dict)
+
+
+class CairoProfiler:
+    """
+    Collects steps executed by Cairo runners, including runners of contracts called by the profiled code.
+    Every step is attributed to the stack of functions, which was active when the step was executed.
+    Functions are recognized by `call` and `ret` instructions, as the CASM carries no debug info.
+    Functions without a known name are named after their offset in the program.
+    """
+
+    def __init__(self):
+        self._runs: list[_ProfiledRun] = []
+        self._active_runs: list[_ProfiledRun] = []
+        self._selector_names: dict[int, str] = {}
+        self._program_names: dict[int, tuple[Any, str, FunctionNames]] = {}
+
+    def name_program(
+        self, program: Any, program_name: str, function_names: FunctionNames
+    ):
+        self._program_names[id(program)] = (program, program_name, function_names)
+
+    def name_selectors(self, abi: list[dict[str, Any]]):
+        for item in abi:
+            if item.get("type") == "interface":
+                self.name_selectors(item.get("items", []))
+            elif item.get("type") in ("function", "l1_handler", "constructor"):
+                self._selector_names[get_selector_from_name(item["name"])] = item[
+                    "name"
+                ]
+
+    def get_selector_name(self, selector: int) -> str:
+        return self._selector_names.get(selector, hex(selector))
+
+    @contextmanager
+    def profile_run(
+        self,
+        runner: CairoRunner,
+        program_name: Optional[str] = None,
+        function_names: Optional[FunctionNames] = None,
+    ) -> Generator[None, None, None]:
+        if program_name is None:
+            _, program_name, function_names = self._program_names.get(
+                id(runner.program), (None, "<unknown program>", {})
+            )
+        parent = self._active_runs[-1] if self._active_runs else None
+        run = _ProfiledRun(
+            runner=runner,
+            program_name=program_name,
+            function_names=function_names or {},
+            parent_step=len(parent.runner.vm.trace) if parent else 0,
+        )
+        if parent:
+            parent.children.setdefault(run.parent_step, []).append(run)
+        self._runs.append(run)
+        self._active_runs.append(run)
+        try:
+            yield
+        finally:
+            self._active_runs.pop()
+
+    def get_samples(self) -> Counter[CallStack]:
+        samples: Counter[CallStack] = Counter()
+        # Parents are registered before their children, so prefixes of children are known in time
+        for run in self._runs:
+            self._collect_samples(run, samples)
+        return samples
+
+    def _collect_samples(self, run: _ProfiledRun, samples: Counter[CallStack]):
+        frames: list[tuple[int, str]] = []
+        call_stack = run.prefix
+        trace = run.runner.vm.trace if hasattr(run.runner, "vm") else []
+        program_base = run.runner.program_base
+        for step, entry in enumerate(trace):
+            fp = entry.fp.offset
+            if not frames or frames[-1][0] != fp:
+                while frames and frames[-1][0] > fp:
+                    frames.pop()
+                if not frames or frames[-1][0] < fp:
+                    offset = entry.pc - program_base
+                    frames.append((fp, self._get_function_name(run, offset)))
+                call_stack = run.prefix + tuple(name for _, name in frames)
+            samples[call_stack] += 1
+            for child in run.children.pop(step, []):
+                child.prefix = call_stack
+        # Children started by the step, which failed, never made it to the trace
+        for children in run.children.values():
+            for child in children:
+                child.prefix = call_stack or run.prefix
+
+    @staticmethod
+    def _get_function_name(run: _ProfiledRun, offset: Offset) -> str:
+        name = run.function_names.get(offset)
+        if name is not None:
+            return name
+        return f"{run.program_name}::<function at {offset}>"
+
+
+_active_profiler: Optional[CairoProfiler] = None
+
+
+def get_active_profiler() -> Optional[CairoProfiler]:
+    return _active_profiler
+
+
+@contextmanager
+def activate_profiler(profiler: CairoProfiler) -> Generator[None, None, None]:
+    global _active_profiler  # pylint: disable=global-statement
+    _active_profiler = profiler
+    try:
+        yield
+    finally:
+        _active_profiler = None
+
+
+def write_collapsed_stacks(samples: Counter[CallStack], path: Path):
+    """
+    Writes samples in the format of `flamegraph.pl` and compatible tools.
+    """
+    lines = [
+        ";".join(name.replace(";", ":") for name in call_stack) + f" {steps}\n"
+        for call_stack, steps in sorted(samples.items())
+    ]
+    path.write_text("".join(lines), encoding="utf-8")
+
+
+def write_pprof_profile(samples: Counter[CallStack], path: Path):
+    """
+    Writes samples as a gzipped pprof protobuf, e.g. for `go tool pprof`.
+    """
+    profile = Profile()
+    string_ids: dict[str, int] = {}
+
+    def string_id(value: str) -> int:
+        if value not in string_ids:
+            string_ids[value] = len(string_ids)
+            profile.string_table.append(value)
+        return string_ids[value]
+
+    string_id("")
+    sample_type = profile.sample_type.add()
+    sample_type.type = string_id("running time")
+    sample_type.unit = string_id("steps")
+    profile.time_nanos = int(time.time() * 10**9)
+
+    location_ids: dict[str, int] = {}
+    for call_stack, steps in samples.items():
+        sample = profile.sample.add()
+        for name in reversed(call_stack):
+            if name not in location_ids:
+                location_id = location_ids[name] = len(location_ids) + 1
+                function = profile.function.add()
+                function.id = location_id
+                function.name = function.system_name = string_id(name)
+                location = profile.location.add()
+                location.id = location_id
+                location.line.add().function_id = location_id
+            sample.location_id.append(location_ids[name])
+        sample.value.append(steps)
+
+    path.write_bytes(gzip.compress(profile.SerializeToString()))
@@ -0,0 +1,110 @@
+import gzip
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from starkware.cairo.lang.tracer.third_party.profile_pb2 import Profile
+
+from .cairo_profiler import (
+    CairoProfiler,
+    write_collapsed_stacks,
+    write_pprof_profile,
+)
+
+
+def trace_entry(pc: int, fp: int) -> Any:
+    return SimpleNamespace(pc=pc, fp=SimpleNamespace(offset=fp))
+
+
+def fake_runner(program: Any = None) -> Any:
+    return SimpleNamespace(
+        program=program, program_base=0, vm=SimpleNamespace(trace=[])
+    )
+
+
+def test_attributing_steps_to_functions_and_called_contracts():
+    program = object()
+    profiler = CairoProfiler()
+    profiler.name_program(program, "test_suite.cairo", {10: "test_main"})
+    test_runner = fake_runner(program)
+    contract_runner = fake_runner()
+
+    with profiler.profile_run(test_runner):
+        test_runner.vm.trace += [
+            trace_entry(pc=10, fp=5),
+            trace_entry(pc=11, fp=5),
+            trace_entry(pc=30, fp=9),
+        ]
+        with profiler.profile_run(
+            contract_runner,
+            program_name="contract 0x1",
+            function_names={0: "contract 0x1::increase_balance"},
+        ):
+            contract_runner.vm.trace += [
+                trace_entry(pc=0, fp=3),
+                trace_entry(pc=1, fp=3),
+            ]
+        test_runner.vm.trace += [
+            trace_entry(pc=31, fp=9),
+            trace_entry(pc=12, fp=5),
+        ]
+
+    helper = "test_suite.cairo::<function at 30>"
+    assert profiler.get_samples() == Counter(
+        {
+            ("test_main",): 3,
+            ("test_main", helper): 2,
+            ("test_main", helper, "contract 0x1::increase_balance"): 2,
+        }
+    )
+
+
+def test_naming_selectors_from_abi():
+    profiler = CairoProfiler()
+
+    profiler.name_selectors(
+        [
+            {"type": "function", "name": "get_balance"},
+            {
+                "type": "interface",
+                "items": [{"type": "function", "name": "increase_balance"}],
+            },
+            {"type": "event", "name": "BalanceIncreased"},
+        ]
+    )
+
+    names = {
+        profiler.get_selector_name(selector)
+        for selector in profiler._selector_names  # pylint: disable=protected-access
+    }
+    assert names == {"get_balance", "increase_balance"}
+    assert profiler.get_selector_name(0x123) == "0x123"
+
+
+def test_writing_collapsed_stacks(tmp_path: Path):
+    path = tmp_path / "profile.folded"
+
+    write_collapsed_stacks(Counter({("a",): 3, ("a", "b;c"): 2}), path)
+
+    assert path.read_text("utf-8") == "a 3\na;b:c 2\n"
+
+
+def test_writing_pprof_profile(tmp_path: Path):
+    path = tmp_path / "profile.pb.gz"
+
+    write_pprof_profile(Counter({("a",): 3, ("a", "b"): 2}), path)
+
+    profile = Profile()
+    profile.ParseFromString(gzip.decompress(path.read_bytes()))
+    function_names = {
+        function.id: profile.string_table[function.name]
+        for function in profile.function
+    }
+    samples = {
+        tuple(function_names[location_id] for location_id in sample.location_id): list(
+            sample.value
+        )
+        for sample in profile.sample
+    }
+    assert samples == {("a",): [3], ("b", "a"): [2]}
@@ -0,0 +1,229 @@
+import pickle
+from typing import Callable, Dict, Optional, Sequence, Set, Tuple
+
+from starkware.cairo.lang.compiler.ast.module import CairoFile, CairoModule
+from starkware.cairo.lang.compiler.ast.visitor import get_lang_from_file
+from starkware.cairo.lang.compiler.error_handling import Location
+from starkware.cairo.lang.compiler.import_loader import (
+    DirectDependenciesCollector,
+    ImportLoaderError,
+    ImportsCollector,
+    UsingCycleError,
+)
+from starkware.cairo.lang.compiler.module_reader import ModuleNotFoundException
+from starkware.cairo.lang.compiler.parser import parse_file
+from starkware.cairo.lang.compiler.preprocessor.default_pass_manager import (
+    ModuleCollector,
+)
+from starkware.cairo.lang.compiler.preprocessor.pass_manager import (
+    PassManager,
+    PassManagerContext,
+)
+from starkware.cairo.lang.compiler.scoped_name import ScopedName
+
+from protostar.self.cache_io import CacheIO
+from protostar.self.cairo_lang_version import get_cairo_lang_version
+from protostar.self.content_hash import ContentHash, hash_content
+
+ReadModule = Callable[[str], Tuple[str, str]]
+
+
+class ParsedModuleCache:
+    """
+    ASTs of Cairo 0 modules, keyed by the file name and content, so the common library is parsed once
+    per process instead of once per compiled contract or test suite.
+    ASTs are stored pickled, and every `parse` returns a fresh copy, as some compilation stages modify the AST.
+    Only the latest content of each file is kept, so edited modules don't pile up.
+    """
+
+    _NAMESPACE = "cairo0_modules"
+    _FORMAT_VERSION = "2"
+    _KEY_LENGTH = 64
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[ContentHash, bytes]] = {}
+        self._version = hash_content(self._FORMAT_VERSION, get_cairo_lang_version())
+
+    def parse(
+        self, code: str, filename: str, cache_io: Optional[CacheIO] = None
+    ) -> CairoFile:
+        key = hash_content(self._version, filename, code)
+        entry = self._get_entry(key, filename, cache_io)
+        if entry is None:
+            parsed_file = parse_file(code, filename=filename)
+            entry = pickle.dumps(parsed_file, protocol=pickle.HIGHEST_PROTOCOL)
+            if cache_io is not None:
+                cache_io.write_bytes(
+                    self._entry_name(filename), key.encode("ascii") + entry
+                )
+            self._entries[filename] = (key, entry)
+            return parsed_file
+        return pickle.loads(entry)
+
+    def _get_entry(
+        self, key: ContentHash, filename: str, cache_io: Optional[CacheIO]
+    ) -> Optional[bytes]:
+        cached_key, entry = self._entries.get(filename, (None, None))
+        if cached_key == key:
+            return entry
+        if cache_io is None:
+            return None
+        stored_entry = cache_io.read_bytes(self._entry_name(filename))
+        if stored_entry is None or stored_entry[: self._KEY_LENGTH] != key.encode(
+            "ascii"
+        ):
+            return None
+        entry = stored_entry[self._KEY_LENGTH :]
+        self._entries[filename] = (key, entry)
+        return entry
+
+    def _entry_name(self, filename: str) -> str:
+        # One entry per file, so entries of previous contents are overwritten
+        return f"{self._NAMESPACE}/{hash_content(self._version, filename)}.pickle"
+
+
+parsed_module_cache = ParsedModuleCache()
+
+
+class _CachedImportsCollector(ImportsCollector):
+    def __init__(self, read_file: ReadModule, parse: Callable[[str, str], CairoFile]):
+        super().__init__(read_file)
+        self._parse = parse
+
+    # Same as `ImportsCollector.collect`, except for parsing
+    def collect(self, curr_pkg_name: str, location: Optional[Location] = None):
+        if curr_pkg_name in self.curr_ancestors:
+            raise UsingCycleError(self.curr_ancestors + [curr_pkg_name])
+
+        if curr_pkg_name in self.collected_data:
+            return
+
+        try:
+            code, filename = self.read_file(curr_pkg_name)
+        except ModuleNotFoundException as ex:
+            raise ImportLoaderError(str(ex), location=location) from ex
+        except Exception as ex:
+            raise ImportLoaderError(
+                f"Could not load module '{curr_pkg_name}'.\nError: {ex}",
+                location=location,
+            ) from ex
+
+        parsed_file = self._parse(code, filename)
+        lang = get_lang_from_file(parsed_file)
+
+        collector = DirectDependenciesCollector()
+        collector.get_using_pkgs_in_block(parsed_file.code_block)
+
+        self.curr_ancestors.append(curr_pkg_name)
+        for pkg_name, pkg_location in collector.packages:
+            self.collect(pkg_name, location=pkg_location)
+            if not (self.lang[pkg_name] is None or self.lang[pkg_name] == lang):
+                raise ImportLoaderError(
+                    f"Importing modules with %lang directive '{self.lang[pkg_name]}' must "
+                    "be from a module with the same directive.",
+                    location=pkg_location,
+                )
+        self.curr_ancestors.pop()
+        self.collected_data[curr_pkg_name] = parsed_file
+        self.lang[curr_pkg_name] = lang
+
+
+class CachedModuleCollector(ModuleCollector):
+    """
+    `ModuleCollector` parsing modules with the `ParsedModuleCache`.
+    `source_files` holds file names of modules collected by the last run.
+    """
+
+    def __init__(
+        self,
+        read_module: ReadModule,
+        additional_modules: Optional[Sequence[str]] = None,
+        cache_io: Optional[CacheIO] = None,
+    ):
+        super().__init__(read_module=read_module, additional_modules=additional_modules)
+        self._cache_io = cache_io
+        self.source_files: Set[str] = set()
+
+    def collect_module(
+        self,
+        code: str,
+        filename: str,
+        context: PassManagerContext,
+        visited_modules: Set[str],
+    ):
+        def read_file_fixed(name: str) -> Tuple[str, str]:
+            return (code, filename) if name == filename else self.read_module(name)
+
+        for module_name, ast in self._collect_imports(
+            filename, read_file=read_file_fixed
+        ).items():
+            if module_name == filename:
+                scope = context.main_scope
+            else:
+                scope = ScopedName.from_string(module_name)
+                if module_name in visited_modules:
+                    continue
+                visited_modules.add(module_name)
+            context.modules.append(CairoModule(cairo_file=ast, module_name=scope))
+
+    def run(self, context: PassManagerContext):
+        self.source_files = set()
+        visited_modules: Set[str] = set()
+        for code, filename in context.start_codes:
+            self.collect_module(
+                code=code,
+                filename=filename,
+                context=context,
+                visited_modules=visited_modules,
+            )
+
+        for additional_module in self.additional_modules:
+            for module_name, ast in self._collect_imports(
+                additional_module, read_file=self.read_module
+            ).items():
+                if module_name in visited_modules:
+                    continue
+                visited_modules.add(module_name)
+                context.modules.append(
+                    CairoModule(
+                        cairo_file=ast, module_name=ScopedName.from_string(module_name)
+                    )
+                )
+
+        for code, filename in context.codes:
+            self.collect_module(
+                code=code,
+                filename=filename,
+                context=context,
+                visited_modules=visited_modules,
+            )
+
+    def _collect_imports(
+        self, curr_pkg_name: str, read_file: ReadModule
+    ) -> Dict[str, CairoFile]:
+        collector = _CachedImportsCollector(read_file=read_file, parse=self._parse)
+        collector.collect(curr_pkg_name)
+        return collector.collected_data
+
+    def _parse(self, code: str, filename: str) -> CairoFile:
+        self.source_files.add(filename)
+        return parsed_module_cache.parse(code, filename, cache_io=self._cache_io)
+
+
+def use_parsed_module_cache(
+    manager: PassManager, cache_io: Optional[CacheIO] = None
+) -> PassManager:
+    """
+    Replaces the module collector of `manager` with the `CachedModuleCollector`.
+    """
+    _, module_collector = manager.stages[manager.get_stage_index("module_collector")]
+    assert isinstance(module_collector, ModuleCollector)
+    manager.replace(
+        "module_collector",
+        CachedModuleCollector(
+            read_module=module_collector.read_module,
+            additional_modules=module_collector.additional_modules,
+            cache_io=cache_io,
+        ),
+    )
+    return manager
@@ -0,0 +1,53 @@
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+from starkware.cairo.lang.compiler.parser import parse_file
+
+from protostar.self.cache_io import CacheIO
+
+from .parsed_module_cache import ParsedModuleCache
+
+CAIRO_CODE = """
+func add(a, b) -> (res: felt) {
+    return (res=a + b);
+}
+"""
+
+
+def test_parsing_module_once(mocker: MockerFixture):
+    parse_file_spy = mocker.patch(
+        "protostar.cairo.parsed_module_cache.parse_file", wraps=parse_file
+    )
+    cache = ParsedModuleCache()
+
+    first_ast = cache.parse(CAIRO_CODE, "add.cairo")
+    second_ast = cache.parse(CAIRO_CODE, "add.cairo")
+
+    assert parse_file_spy.call_count == 1
+    assert first_ast.format() == second_ast.format()
+    assert first_ast is not second_ast
+
+
+def test_reusing_modules_parsed_in_previous_runs(tmp_path: Path, mocker: MockerFixture):
+    ParsedModuleCache().parse(CAIRO_CODE, "add.cairo", cache_io=CacheIO(tmp_path))
+    parse_file_spy = mocker.patch(
+        "protostar.cairo.parsed_module_cache.parse_file", wraps=parse_file
+    )
+
+    ast = ParsedModuleCache().parse(CAIRO_CODE, "add.cairo", cache_io=CacheIO(tmp_path))
+    changed_ast = ParsedModuleCache().parse(
+        CAIRO_CODE + "\n", "add.cairo", cache_io=CacheIO(tmp_path)
+    )
+
+    assert parse_file_spy.call_count == 1
+    assert ast.format() == changed_ast.format()
+
+
+def test_keeping_one_entry_per_module(tmp_path: Path):
+    cache_io = CacheIO(tmp_path)
+
+    ParsedModuleCache().parse(CAIRO_CODE, "add.cairo", cache_io=cache_io)
+    ParsedModuleCache().parse(CAIRO_CODE + "\n", "add.cairo", cache_io=cache_io)
+    ParsedModuleCache().parse(CAIRO_CODE, "other.cairo", cache_io=cache_io)
+
+    assert len(list((cache_io.cache_path / "cairo0_modules").iterdir())) == 2
@@ -1,13 +1,17 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Optional
 
 from starkware.cairo.lang.compiler.preprocessor.pass_manager import PassManager
 
+from protostar.self.cache_io import CacheIO
+
 
 @dataclass(frozen=True)
 class PassManagerConfig:
     include_paths: list[str]
     disable_hint_validation: bool
+    cache_io: Optional[CacheIO] = None
 
 
 class PassManagerFactory(ABC):
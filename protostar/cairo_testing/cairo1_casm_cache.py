@@ -0,0 +1,69 @@
+import mmap
+from pathlib import Path
+from typing import Optional
+
+import protostar.cairo.bindings.cairo_bindings as cairo1
+from protostar.cairo.cairo1_test_suite_parser import ProtostarCasm
+from protostar.self.cache_io import CacheIO
+from protostar.self.content_hash import ContentHash, ContentHasher, hash_content
+
+
+class Cairo1CasmCache:
+    """
+    Persistent cache of test suites compiled to CASM, stored in the `ProtostarCasm` binary format.
+    An entry is valid as long as the sierra code, the selected tests and the compiler stay the same.
+    """
+
+    _NAMESPACE = "cairo1_casm"
+    _KEY_LENGTH = 64
+
+    def __init__(self, cache_io: CacheIO, compiler_version: Optional[str] = None):
+        self._cache_io = cache_io
+        self._compiler_version = compiler_version or cairo1.get_compiler_fingerprint()
+
+    def get(
+        self,
+        test_suite_path: Path,
+        sierra_output: str,
+        named_tests: list[tuple[str, cairo1.AvailableGas]],
+    ) -> Optional[ProtostarCasm]:
+        entry_path = self._cache_io.cache_path / self._entry_name(test_suite_path)
+        if not entry_path.exists():
+            return None
+
+        key = self._compute_key(sierra_output, named_tests).encode("ascii")
+        with open(entry_path, "rb") as file:
+            if file.read(self._KEY_LENGTH) != key:
+                return None
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                try:
+                    return ProtostarCasm.from_bytes(
+                        memoryview(buffer)[self._KEY_LENGTH :]
+                    )
+                except ValueError:
+                    return None
+
+    def put(
+        self,
+        test_suite_path: Path,
+        sierra_output: str,
+        named_tests: list[tuple[str, cairo1.AvailableGas]],
+        protostar_casm: ProtostarCasm,
+    ):
+        key = self._compute_key(sierra_output, named_tests).encode("ascii")
+        self._cache_io.write_bytes(
+            self._entry_name(test_suite_path), key + protostar_casm.to_bytes()
+        )
+
+    def _entry_name(self, test_suite_path: Path) -> str:
+        return f"{self._NAMESPACE}/{hash_content(str(test_suite_path.resolve()))}.casm"
+
+    def _compute_key(
+        self,
+        sierra_output: str,
+        named_tests: list[tuple[str, cairo1.AvailableGas]],
+    ) -> ContentHash:
+        hasher = ContentHasher().update(self._compiler_version).update(sierra_output)
+        for test_name, available_gas in named_tests:
+            hasher.update(test_name).update(str(available_gas))
+        return hasher.hexdigest()
@@ -0,0 +1,75 @@
+import re
+from pathlib import Path
+from typing import Optional, Tuple
+
+import protostar.cairo.bindings.cairo_bindings as cairo1
+from protostar.self.cache_io import CacheIO
+from protostar.self.content_hash import ContentHash, ContentHasher, hash_content
+
+
+class Cairo1TestCollectionCache:
+    """
+    Persistent, content-addressed cache of `cairo1.collect_tests` outputs.
+    An entry is valid as long as the suite source, the sources of linked libraries
+    and the compiler version stay the same. A suite declaring external modules (`mod x;`)
+    also depends on the Cairo sources next to it, so these are hashed too.
+    """
+
+    _NAMESPACE = "cairo1_test_collection"
+    _EXTERNAL_MODULE_PATTERN = re.compile(rb"^\s*(pub\s+)?mod\s+\w+\s*;", re.MULTILINE)
+
+    def __init__(
+        self,
+        cache_io: CacheIO,
+        linked_libraries: list[Tuple[Path, cairo1.PackageName]],
+        compiler_version: Optional[str] = None,
+    ):
+        self._cache_io = cache_io
+        self._linked_libraries = linked_libraries
+        self._compiler_version = compiler_version or cairo1.get_compiler_fingerprint()
+        self._environment_hash: Optional[ContentHash] = None
+
+    def get(self, file_path: Path) -> Optional[cairo1.TestCollectorOutput]:
+        entry = self._cache_io.read(self._entry_name(file_path))
+        if entry is None or entry.get("key") != self._compute_key(file_path):
+            return None
+        return cairo1.TestCollectorOutput(
+            sierra_output=entry["sierra_output"],
+            collected_tests=[
+                (test_name, available_gas)
+                for test_name, available_gas in entry["collected_tests"]
+            ],
+        )
+
+    def put(self, file_path: Path, collector_output: cairo1.TestCollectorOutput):
+        self._cache_io.write(
+            self._entry_name(file_path),
+            {
+                "key": self._compute_key(file_path),
+                "sierra_output": collector_output.sierra_output,
+                "collected_tests": collector_output.collected_tests,
+            },
+        )
+
+    def _entry_name(self, file_path: Path) -> str:
+        # One entry per suite, so stale outputs are overwritten instead of piling up
+        return f"{self._NAMESPACE}/{hash_content(str(file_path.resolve()))}"
+
+    def _compute_key(self, file_path: Path) -> ContentHash:
+        file_path = file_path.resolve()
+        hasher = ContentHasher().update(self._get_environment_hash())
+        if self._EXTERNAL_MODULE_PATTERN.search(file_path.read_bytes()):
+            return hasher.update_directory(
+                file_path.parent, suffix=".cairo"
+            ).hexdigest()
+        return hasher.update_file(file_path).hexdigest()
+
+    def _get_environment_hash(self) -> ContentHash:
+        if self._environment_hash is None:
+            hasher = ContentHasher().update(self._compiler_version)
+            for package_path, package_name in sorted(self._linked_libraries):
+                hasher.update(package_name).update_directory(
+                    package_path, suffix=".cairo"
+                )
+            self._environment_hash = hasher.hexdigest()
+        return self._environment_hash
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import protostar.cairo.bindings.cairo_bindings as cairo1
+from protostar.self.cache_io import CacheIO
+
+from .cairo1_test_collection_cache import Cairo1TestCollectionCache
+
+COLLECTOR_OUTPUT = cairo1.TestCollectorOutput(
+    sierra_output="sierra", collected_tests=[("test_a", None)]
+)
+
+
+def create_cache(tmp_path: Path) -> Cairo1TestCollectionCache:
+    return Cairo1TestCollectionCache(
+        CacheIO(tmp_path), linked_libraries=[], compiler_version="1.0.0"
+    )
+
+
+def test_invalidating_entry_when_suite_changes(tmp_path: Path):
+    suite_path = tmp_path / "test_suite.cairo"
+    suite_path.write_text("fn test_a() {}")
+    cache = create_cache(tmp_path)
+    cache.put(suite_path, COLLECTOR_OUTPUT)
+
+    assert cache.get(suite_path) == COLLECTOR_OUTPUT
+    suite_path.write_text("fn test_b() {}")
+    assert cache.get(suite_path) is None
+
+
+def test_ignoring_sibling_files_of_suite_without_external_modules(tmp_path: Path):
+    suite_path = tmp_path / "test_suite.cairo"
+    suite_path.write_text("fn test_a() {}")
+    sibling_path = tmp_path / "helpers.cairo"
+    sibling_path.write_text("fn helper() {}")
+    cache = create_cache(tmp_path)
+    cache.put(suite_path, COLLECTOR_OUTPUT)
+
+    sibling_path.write_text("fn other_helper() {}")
+
+    assert cache.get(suite_path) == COLLECTOR_OUTPUT
+
+
+def test_invalidating_entry_when_external_module_changes(tmp_path: Path):
+    suite_path = tmp_path / "test_suite.cairo"
+    suite_path.write_text("mod helpers;\n\nfn test_a() {}")
+    module_path = tmp_path / "helpers" / "utils.cairo"
+    module_path.parent.mkdir()
+    module_path.write_text("fn helper() {}")
+    cache = create_cache(tmp_path)
+    cache.put(suite_path, COLLECTOR_OUTPUT)
+
+    module_path.write_text("fn other_helper() {}")
+
+    assert cache.get(suite_path) is None
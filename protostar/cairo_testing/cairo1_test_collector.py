@@ -1,11 +1,14 @@
 from pathlib import Path
-from typing import List, Iterable, Tuple
+from typing import List, Iterable, Optional, Tuple
 
 from starkware.cairo.lang.compiler.preprocessor.preprocessor_error import (
     PreprocessorError,
 )
 
 import protostar.cairo.bindings.cairo_bindings as cairo1
+from protostar.cairo_testing.cairo1_test_collection_cache import (
+    Cairo1TestCollectionCache,
+)
 from protostar.testing import TestCollector
 from protostar.testing.test_collector import TestSuiteInfo
 from protostar.testing.test_suite import Cairo1TestSuite, TestSuite, TestCase
@@ -16,17 +19,43 @@ class Cairo1TestCollectionException(Exception):
 
 
 class Cairo1TestCollector(TestCollector):
-    def __init__(self, linked_libraries: list[Tuple[Path, cairo1.PackageName]]):
+    def __init__(
+        self,
+        linked_libraries: list[Tuple[Path, cairo1.PackageName]],
+        collection_cache: Optional[Cairo1TestCollectionCache] = None,
+    ):
         super().__init__(
             get_suite_function_names=self.collect_cairo1_tests_and_cache_outputs
         )
         self.linked_libraries = linked_libraries
+        self._collection_cache = collection_cache
         self._cairo_1_test_path_to_sierra_output: dict[Path, str] = {}
 
     def collect_cairo1_tests_and_cache_outputs(
         self,
         file_path: Path,
     ) -> list[tuple[str, cairo1.AvailableGas]]:
+        collector_output = (
+            self._collection_cache.get(file_path) if self._collection_cache else None
+        )
+        if collector_output is None:
+            collector_output = self._collect_tests(file_path)
+            if self._collection_cache:
+                self._collection_cache.put(file_path, collector_output)
+
+        assert collector_output.sierra_output
+        self._cairo_1_test_path_to_sierra_output[
+            file_path
+        ] = collector_output.sierra_output
+        return [
+            (namespaced_test_name.split("::")[-1], available_gas)
+            for (
+                namespaced_test_name,
+                available_gas,
+            ) in collector_output.collected_tests
+        ]
+
+    def _collect_tests(self, file_path: Path) -> cairo1.TestCollectorOutput:
         try:
             collector_output = cairo1.collect_tests(
                 file_path,
@@ -39,17 +68,7 @@ class Cairo1TestCollector(TestCollector):
             raise Cairo1TestCollectionException(
                 f"Compiler did not emit sierra output for {file_path}"
             )
-
-        self._cairo_1_test_path_to_sierra_output[
-            file_path
-        ] = collector_output.sierra_output
-        return [
-            (namespaced_test_name.split("::")[-1], available_gas)
-            for (
-                namespaced_test_name,
-                available_gas,
-            ) in collector_output.collected_tests
-        ]
+        return collector_output
 
     def _build_test_suite_from_test_suite_info(
         self, test_suite_info: TestSuiteInfo
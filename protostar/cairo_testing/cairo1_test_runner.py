@@ -1,14 +1,20 @@
-import asyncio
 import traceback
 from contextlib import contextmanager
 from logging import getLogger
 from pathlib import Path
 from typing import Optional, TYPE_CHECKING, List
 
-from starkware.cairo.lang.compiler.program import Program
-
 from protostar.cairo import CairoCompiler, CairoCompilerConfig
 from protostar.cairo.cairo1_test_suite_parser import ProtostarCasm
+from protostar.cairo.cairo_function_runner_facade import CairoRunnerTemplate
+from protostar.cairo.cairo_profiler import (
+    CairoProfiler,
+    FunctionNames,
+    activate_profiler,
+    write_collapsed_stacks,
+    write_pprof_profile,
+)
+from protostar.cairo_testing.cairo1_casm_cache import Cairo1CasmCache
 from protostar.cairo_testing.execution_environments.cairo_setup_execution_environment import (
     CairoSetupExecutionEnvironment,
 )
@@ -21,10 +27,17 @@ from protostar.compiler import (
     ProjectCairoPathBuilder,
     ProjectCompilerConfig,
 )
+from protostar.compiler.cached_cairo1_contract_compiler import (
+    CachedCairo1ContractCompiler,
+)
+from protostar.commands.cairo1_commands.fetch_from_scarb import (
+    fetch_linked_libraries_from_scarb,
+)
 from protostar.contract_path_resolver import ContractPathResolver
 from protostar.configuration_file import ConfigurationFileFactory
 from protostar.starknet import ReportedException
 from protostar.protostar_exception import ProtostarException
+from protostar.self.cache_io import CacheIO
 from protostar.testing import (
     UnexpectedBrokenTestSuiteResult,
     BrokenTestSuiteResult,
@@ -50,6 +63,10 @@ from protostar.testing.test_suite import (
     Cairo1TestCase,
 )
 from protostar.testing.testing_seed import Seed
+from protostar.testing.test_runner import (
+    initialize_worker_runner,
+    run_in_worker_event_loop,
+)
 import protostar.cairo.bindings.cairo_bindings as cairo1
 
 
@@ -73,6 +90,9 @@ class Cairo1TestRunner:
         self._gas_estimation_enabled = gas_estimation_enabled
         self.shared_tests_state = shared_tests_state
         self.profiling = profiling
+        self._project_root_path = project_root_path
+        self._profiler: Optional[CairoProfiler] = None
+        self._sources_version = 0
         include_paths = include_paths or []
 
         configuration_file = ConfigurationFileFactory(
@@ -107,41 +127,74 @@ class Cairo1TestRunner:
             disable_hint_validation=project_compiler_config.hint_validation_disabled,
         )
         self.cairo_compiler = CairoCompiler(config=compiler_config)
+        cache_io = CacheIO(project_root_path)
+        self.casm_cache = Cairo1CasmCache(cache_io)
+        self.cairo1_contract_compiler = CachedCairo1ContractCompiler(
+            linked_libraries_provider=lambda: fetch_linked_libraries_from_scarb(
+                project_root_path
+            ),
+            cache_io=cache_io,
+        )
+
+    PPROF_FILE_NAME = "profile.pb.gz"
+    COLLAPSED_STACKS_FILE_NAME = "profile.folded"
+
+    # Runner reused by every test suite executed in the worker process
+    _worker_runner: Optional["Cairo1TestRunner"] = None
+
+    @classmethod
+    def from_worker_config(
+        cls, config: "TestRunner.WorkerConfig"
+    ) -> "Cairo1TestRunner":
+        return cls(
+            include_paths=config.include_paths,
+            project_root_path=config.project_root_path,
+            profiling=config.profiling,
+            cwd=config.cwd,
+            shared_tests_state=config.shared_tests_state,
+            active_profile_name=config.active_profile_name,
+            gas_estimation_enabled=config.gas_estimation_enabled,
+        )
+
+    @classmethod
+    def initialize_worker(cls, config: "TestRunner.WorkerConfig"):
+        cls._worker_runner = initialize_worker_runner(cls.from_worker_config, config)
 
     @classmethod
     def worker(cls, args: "TestRunner.WorkerArgs"):
-        asyncio.run(
-            cls(
-                include_paths=args.include_paths,
-                project_root_path=args.project_root_path,
-                profiling=args.profiling,
-                cwd=args.cwd,
-                shared_tests_state=args.shared_tests_state,
-                active_profile_name=args.active_profile_name,
-                gas_estimation_enabled=args.gas_estimation_enabled,
-            ).run_test_suite(
+        if cls._worker_runner is None:
+            cls._worker_runner = cls.from_worker_config(args.worker_config)
+        cls._worker_runner.update_sources_version(args.sources_version)
+        run_in_worker_event_loop(
+            cls._worker_runner.run_test_suite(
                 test_suite=args.test_suite,
                 testing_seed=args.testing_seed,
                 max_steps=args.max_steps,
             )
         )
 
+    def update_sources_version(self, sources_version: int):
+        if sources_version != self._sources_version:
+            self._sources_version = sources_version
+            self.cairo1_contract_compiler.invalidate_environment()
+
     async def _build_execution_state(self, test_config: TestConfig):
         return await CairoTestExecutionState.from_test_config(
             test_config=test_config,
             cairo0_project_compiler=self.cairo0_project_compiler,
             contract_path_resolver=self.contract_path_resolver,
+            cairo1_contract_compiler=self.cairo1_contract_compiler,
         )
 
     async def _run_suite_setup(
         self,
         test_suite: TestSuite,
         test_execution_state: CairoTestExecutionState,
-        program: Program,
+        runner_template: CairoRunnerTemplate,
     ):
         if test_suite.setup_fn_name:
             env = CairoSetupExecutionEnvironment(
-                program=program, state=test_execution_state
+                runner_template=runner_template, state=test_execution_state
             )
             await env.execute(test_suite.setup_fn_name)
 
@@ -149,12 +202,12 @@ class Cairo1TestRunner:
         self,
         test_case: TestCase,
         state: CairoTestExecutionState,
-        program: Program,
+        runner_template: CairoRunnerTemplate,
     ) -> SetupCaseResult:
         assert test_case.setup_fn_name
         try:
             execution_environment = CairoSetupCaseExecutionEnvironment(
-                state=state, program=program
+                state=state, runner_template=runner_template
             )
 
             with state.stopwatch.lap(test_case.setup_fn_name):
@@ -196,26 +249,71 @@ class Cairo1TestRunner:
             )
             test_execution_state = await self._build_execution_state(test_config)
 
-            casm_json = cairo1.compile_protostar_sierra_to_casm(
-                named_tests=[
-                    (test_case.test_fn_name, test_case.available_gas)
-                    for test_case in test_suite.test_cases
-                ],
-                input_data=test_suite.sierra_output,
-            )
-
-            assert casm_json, f"No CASM was emitted for {test_suite.test_path}"
-
-            protostar_casm = ProtostarCasm.from_json(casm_json)
+            protostar_casm = self._compile_test_suite_to_casm(test_suite)
 
             test_suite.add_offsets_to_cases(offset_map=protostar_casm.offset_map)
 
+            runner_template = CairoRunnerTemplate(protostar_casm.program)
+            if self.profiling:
+                self._profiler = CairoProfiler()
+                self._profiler.name_program(
+                    runner_template.program,
+                    program_name=str(test_suite.test_path),
+                    function_names=self._get_function_names(test_suite),
+                )
+
             await self._invoke_test_cases(
                 test_suite=test_suite,
-                program=protostar_casm.program,
+                runner_template=runner_template,
                 test_execution_state=test_execution_state,
             )
 
+    @staticmethod
+    def _get_function_names(test_suite: TestSuite) -> FunctionNames:
+        function_names: FunctionNames = {}
+        for test_case in test_suite.test_cases:
+            assert isinstance(test_case, Cairo1TestCase)
+            function_names[test_case.test_fn_offset] = test_case.test_fn_name
+            if test_case.setup_fn_name and test_case.setup_fn_offset is not None:
+                function_names[test_case.setup_fn_offset] = test_case.setup_fn_name
+        return function_names
+
+    def _write_profile(self, profiler: CairoProfiler):
+        samples = profiler.get_samples()
+        write_pprof_profile(samples, self._project_root_path / self.PPROF_FILE_NAME)
+        write_collapsed_stacks(
+            samples, self._project_root_path / self.COLLAPSED_STACKS_FILE_NAME
+        )
+
+    def _compile_test_suite_to_casm(self, test_suite: Cairo1TestSuite) -> ProtostarCasm:
+        named_tests = [
+            (test_case.test_fn_name, test_case.available_gas)
+            for test_case in test_suite.compiled_test_cases
+        ]
+        cached_casm = self.casm_cache.get(
+            test_suite_path=test_suite.test_path,
+            sierra_output=test_suite.sierra_output,
+            named_tests=named_tests,
+        )
+        if cached_casm:
+            return cached_casm
+
+        casm_json = cairo1.compile_protostar_sierra_to_casm(
+            named_tests=named_tests,
+            input_data=test_suite.sierra_output,
+        )
+
+        assert casm_json, f"No CASM was emitted for {test_suite.test_path}"
+
+        protostar_casm = ProtostarCasm.from_json(casm_json)
+        self.casm_cache.put(
+            test_suite_path=test_suite.test_path,
+            sierra_output=test_suite.sierra_output,
+            named_tests=named_tests,
+            protostar_casm=protostar_casm,
+        )
+        return protostar_casm
+
     @contextmanager
     def suite_exception_handling(self, test_suite: TestSuite):
         try:
@@ -242,13 +340,13 @@ class Cairo1TestRunner:
     async def _invoke_test_cases(
         self,
         test_suite: TestSuite,
-        program: Program,
+        runner_template: CairoRunnerTemplate,
         test_execution_state: CairoTestExecutionState,
     ) -> None:
         for test_case in test_suite.test_cases:
             test_result = await self._invoke_test_case(
                 test_case=test_case,
-                program=program,
+                runner_template=runner_template,
                 initial_state=test_execution_state,
             )
             self.shared_tests_state.put_result(test_result)
@@ -257,7 +355,7 @@ class Cairo1TestRunner:
         self,
         initial_state: CairoTestExecutionState,
         test_case: TestCase,
-        program: Program,
+        runner_template: CairoRunnerTemplate,
     ) -> TestResult:
         state: CairoTestExecutionState = initial_state.fork()
         assert isinstance(
@@ -266,11 +364,18 @@ class Cairo1TestRunner:
 
         test_execution_environment = CairoTestExecutionEnvironment(
             state=state,
-            program=program,
+            runner_template=runner_template,
         )
-        return await Cairo1TestCaseRunner(
+        test_case_runner = Cairo1TestCaseRunner(
             function_executor=test_execution_environment,
             test_case=test_case,
             output_recorder=state.output_recorder,
             stopwatch=state.stopwatch,
-        ).run()
+        )
+        if not self._profiler:
+            return await test_case_runner.run()
+
+        with activate_profiler(self._profiler):
+            test_result = await test_case_runner.run()
+        self._write_profile(self._profiler)
+        return test_result
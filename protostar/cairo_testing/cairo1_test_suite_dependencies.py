@@ -0,0 +1,198 @@
+import re
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from protostar.cairo.bindings.cairo_bindings import PackageName
+from protostar.protostar_exception import ProtostarException
+from protostar.testing.test_collector import TestCollector
+
+_PATH_RE = re.compile(r"\b([A-Za-z_]\w*)((?:::[A-Za-z_]\w*)+)")
+_USE_GROUP_RE = re.compile(r"\buse\s+([\w:]+)::\{([^{}]*)\}")
+_MOD_RE = re.compile(r"^\s*(?:pub\s+)?mod\s+(\w+)\s*;", re.MULTILINE)
+_DECLARE_RE = re.compile(r"\bdeclare\s*\(\s*([^)]*?)\s*\)")
+_STRING_LITERAL_RE = re.compile(r"""^(?:'([^']*)'|"([^"]*)")$""")
+
+ModulePath = Tuple[str, ...]
+ContractPathResolver = Callable[[str], Path]
+
+
+class Cairo1TestSuiteDependencyResolver:
+    """
+    Finds Cairo files a test suite depends on by scanning module paths used in the sources,
+    `mod` declarations and contracts declared with string literals.
+    The analysis is textual, so it over-approximates. It returns None when dependencies
+    cannot be determined, e.g. when a contract name is not a literal.
+    """
+
+    def __init__(
+        self,
+        linked_libraries: List[Tuple[Path, PackageName]],
+        resolve_contract_path: Optional[ContractPathResolver] = None,
+    ):
+        self._package_roots: Dict[str, Path] = {
+            package_name: package_path.resolve()
+            for package_path, package_name in linked_libraries
+        }
+        self._resolve_contract_path = resolve_contract_path
+
+    def resolve(self, test_suite_path: Path) -> Optional[Set[Path]]:
+        test_suite_path = test_suite_path.resolve()
+        try:
+            source = test_suite_path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+        crate_roots = [test_suite_path]
+        for declare_match in _DECLARE_RE.finditer(source):
+            argument = declare_match.group(1)
+            if not argument:
+                continue
+            literal_match = _STRING_LITERAL_RE.match(argument)
+            if not literal_match:
+                return None
+            contract_path = self._find_contract_path(
+                literal_match.group(1) or literal_match.group(2)
+            )
+            if contract_path is None:
+                continue
+            if contract_path.is_dir():
+                crate_roots.extend(contract_path.rglob("*.cairo"))
+            else:
+                crate_roots.append(contract_path)
+
+        return self._find_dependencies(crate_roots)
+
+    def _find_contract_path(self, contract_name: str) -> Optional[Path]:
+        if self._resolve_contract_path is None:
+            return None
+        try:
+            return self._resolve_contract_path(contract_name).resolve()
+        except (ProtostarException, AssertionError):
+            # Such test fails on its own, changes of the configuration file reload everything
+            return None
+
+    def _find_dependencies(self, crate_roots: Iterable[Path]) -> Set[Path]:
+        dependencies: Set[Path] = set()
+        # Items are: a file, its module location and whether modules it declares are compiled
+        queue: Deque[Tuple[Path, Path, ModulePath, bool]] = deque(
+            (crate_root, *self._locate_crate_root(crate_root), True)
+            for crate_root in crate_roots
+        )
+        while queue:
+            file_path, root_path, module_path, includes_submodules = queue.popleft()
+            if file_path in dependencies or not file_path.is_file():
+                continue
+            dependencies.add(file_path)
+            source = file_path.read_text(encoding="utf-8")
+
+            if includes_submodules:
+                for mod_match in _MOD_RE.finditer(source):
+                    submodule_path = (*module_path, mod_match.group(1))
+                    queue.append(
+                        (
+                            self._module_file(root_path, submodule_path),
+                            root_path,
+                            submodule_path,
+                            True,
+                        )
+                    )
+
+            for referenced_root, referenced_module in self._find_referenced_modules(
+                source, root_path, module_path
+            ):
+                # Every module on the path is needed, but not their other submodules
+                for prefix_length in range(len(referenced_module) + 1):
+                    prefix = referenced_module[:prefix_length]
+                    queue.append(
+                        (
+                            self._module_file(referenced_root, prefix),
+                            referenced_root,
+                            prefix,
+                            False,
+                        )
+                    )
+        return dependencies
+
+    def _find_referenced_modules(
+        self, source: str, root_path: Path, module_path: ModulePath
+    ) -> Iterable[Tuple[Path, ModulePath]]:
+        paths = [
+            (path_match.group(1), path_match.group(2)[2:].split("::"))
+            for path_match in _PATH_RE.finditer(source)
+        ]
+        for group_match in _USE_GROUP_RE.finditer(source):
+            prefix = group_match.group(1).split("::")
+            for item in group_match.group(2).split(","):
+                item_segments = [
+                    segment for segment in item.strip().split("::") if segment
+                ]
+                if item_segments:
+                    paths.append((prefix[0], [*prefix[1:], *item_segments]))
+
+        for first_segment, segments in paths:
+            if first_segment in self._package_roots:
+                yield self._package_roots[first_segment], tuple(segments)
+            elif first_segment == "self":
+                yield root_path, (*module_path, *segments)
+            elif first_segment == "super":
+                yield root_path, (*module_path[:-1], *segments)
+
+    def _locate_crate_root(self, file_path: Path) -> Tuple[Path, ModulePath]:
+        for package_root in self._package_roots.values():
+            if package_root in file_path.parents:
+                relative_path = file_path.relative_to(package_root).with_suffix("")
+                if relative_path == Path("lib"):
+                    return package_root, ()
+                return package_root, relative_path.parts
+        return file_path.parent, ()
+
+    @staticmethod
+    def _module_file(root_path: Path, module_path: ModulePath) -> Path:
+        if not module_path:
+            return root_path / "lib.cairo"
+        return root_path.joinpath(*module_path[:-1]) / f"{module_path[-1]}.cairo"
+
+
+class TestSuiteDependencyMap:
+    """
+    Maps test suites to files they depend on. Suites with unknown dependencies are always affected.
+    """
+
+    def __init__(self):
+        self._dependencies: Dict[Path, Optional[Set[Path]]] = {}
+
+    def update(self, test_suite_path: Path, dependencies: Optional[Set[Path]]):
+        self._dependencies[test_suite_path.resolve()] = dependencies
+
+    def remove(self, test_suite_path: Path):
+        self._dependencies.pop(test_suite_path.resolve(), None)
+
+    def clear(self):
+        self._dependencies.clear()
+
+    def find_affected_test_suites(
+        self, changed_paths: Set[Path]
+    ) -> Optional[Set[Path]]:
+        """
+        Returns None if a changed file is unknown, and everything has to be re-run.
+        """
+        affected_test_suites: Set[Path] = set()
+        for changed_path in changed_paths:
+            changed_path = changed_path.resolve()
+            if changed_path in self._dependencies or TestCollector.is_test_suite(
+                changed_path.name
+            ):
+                affected_test_suites.add(changed_path)
+                continue
+
+            is_known = False
+            for test_suite_path, dependencies in self._dependencies.items():
+                if dependencies is None:
+                    affected_test_suites.add(test_suite_path)
+                elif changed_path in dependencies:
+                    affected_test_suites.add(test_suite_path)
+                    is_known = True
+            if not is_known:
+                return None
+        return affected_test_suites
@@ -0,0 +1,69 @@
+from pathlib import Path
+
+from .cairo1_test_suite_dependencies import (
+    Cairo1TestSuiteDependencyResolver,
+    TestSuiteDependencyMap,
+)
+
+
+def write_file(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path.resolve()
+
+
+def test_resolving_dependencies(tmp_path: Path):
+    src_path = tmp_path / "src"
+    lib_path = write_file(
+        src_path / "lib.cairo", "mod math;\nmod storage;\nmod unused;"
+    )
+    math_path = write_file(
+        src_path / "math.cairo", "use my_package::storage::helpers::read;"
+    )
+    storage_path = write_file(src_path / "storage.cairo", "mod helpers;")
+    helpers_path = write_file(src_path / "storage" / "helpers.cairo", "fn read() {}")
+    write_file(src_path / "unused.cairo", "")
+    contract_path = write_file(tmp_path / "contracts" / "minimal.cairo", "mod inner;")
+    inner_path = write_file(tmp_path / "contracts" / "inner.cairo", "")
+    test_suite_path = write_file(
+        tmp_path / "tests" / "test_math.cairo",
+        "use my_package::math::{add, sub};\n" "fn test_add() { declare('minimal'); }",
+    )
+    resolver = Cairo1TestSuiteDependencyResolver(
+        linked_libraries=[(src_path, "my_package")],
+        resolve_contract_path={"minimal": contract_path}.__getitem__,
+    )
+
+    assert resolver.resolve(test_suite_path) == {
+        test_suite_path,
+        lib_path,
+        math_path,
+        storage_path,
+        helpers_path,
+        contract_path,
+        inner_path,
+    }
+
+
+def test_dependencies_are_unknown_for_non_literal_contract_names(tmp_path: Path):
+    test_suite_path = write_file(
+        tmp_path / "test_a.cairo", "fn test_a() { declare(name); }"
+    )
+
+    assert Cairo1TestSuiteDependencyResolver([]).resolve(test_suite_path) is None
+
+
+def test_finding_affected_test_suites(tmp_path: Path):
+    dependency_map = TestSuiteDependencyMap()
+    dependency_map.update(tmp_path / "test_a.cairo", {tmp_path / "a.cairo"})
+    dependency_map.update(tmp_path / "test_b.cairo", {tmp_path / "b.cairo"})
+    dependency_map.update(tmp_path / "test_c.cairo", None)
+
+    assert dependency_map.find_affected_test_suites({tmp_path / "a.cairo"}) == {
+        (tmp_path / "test_a.cairo").resolve(),
+        (tmp_path / "test_c.cairo").resolve(),
+    }
+    assert (tmp_path / "test_new.cairo").resolve() in (
+        dependency_map.find_affected_test_suites({tmp_path / "test_new.cairo"}) or {}
+    )
+    assert dependency_map.find_affected_test_suites({tmp_path / "other.cairo"}) is None
@@ -1,5 +1,5 @@
 # pylint: disable=duplicate-code
-from typing import List
+from typing import List, Optional
 
 from protostar.cairo import HintLocal
 from protostar.cairo_testing import CairoTestExecutionState
@@ -33,6 +33,7 @@ from protostar.cheatable_starknet.cheatables.cheatable_cached_state import (
 from protostar.cheatable_starknet.controllers import (
     StorageController,
     ContractsController,
+    ContractCallsResources,
     BlockInfoController,
     ExpectCallController,
 )
@@ -52,23 +53,29 @@ class CairoSharedHintLocalFactory:
         contract_path_resolver: ContractPathResolver,
         test_finish_hook: Hook,
         test_execution_state: CairoTestExecutionState,
+        contract_calls_resources: Optional[ContractCallsResources] = None,
     ):
         self.cheatable_state = cheatable_state
         self.cairo0_project_compiler = cairo0_project_compiler
         self.contract_path_resolver = contract_path_resolver
         self._test_finish_hook = test_finish_hook
         self._test_execution_state = test_execution_state
+        self._contract_calls_resources = contract_calls_resources
 
     def build_hint_locals(self) -> List[HintLocal]:
         block_info_controller = BlockInfoController(
             cheatable_state=self.cheatable_state
         )
-        contracts_controller = ContractsController(cheatable_state=self.cheatable_state)
+        contracts_controller = ContractsController(
+            cheatable_state=self.cheatable_state,
+            contract_calls_resources=self._contract_calls_resources,
+        )
         storage_controller = StorageController(cheatable_state=self.cheatable_state)
 
         declare_cheatcode = DeclareHintLocal(
             contracts_controller=contracts_controller,
             contract_path_resolver=self.contract_path_resolver,
+            cairo1_contract_compiler=self._test_execution_state.cairo1_contract_compiler,
         )
         declare_cairo0_cheatcode = DeclareCairo0HintLocal(
             project_compiler=self.cairo0_project_compiler,
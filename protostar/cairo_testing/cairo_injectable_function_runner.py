@@ -2,21 +2,28 @@ import asyncio
 from contextlib import contextmanager
 from typing import Any
 
-from starkware.cairo.lang.compiler.program import Program
+from starkware.cairo.lang.vm.cairo_pie import ExecutionResources
 from starkware.cairo.lang.vm.vm_exceptions import VmException
 
 from protostar.cairo import HintLocalsDict
 from protostar.cairo.cairo_function_executor import Offset, OffsetOrName
-from protostar.cairo.cairo_function_runner_facade import CairoRunnerFacade
+from protostar.cairo.cairo_function_runner_facade import (
+    CairoRunnerFacade,
+    CairoRunnerTemplate,
+)
 from protostar.cairo.short_string import short_string_to_str
 from protostar.testing.test_environment_exceptions import RevertableException
 from protostar.starknet import SimpleReportedException
 
 
 class CairoInjectableFunctionRunner:
-    def __init__(self, hint_locals: HintLocalsDict, program: Program):
+    def __init__(
+        self, hint_locals: HintLocalsDict, runner_template: CairoRunnerTemplate
+    ):
         self._hint_locals = hint_locals
-        self._cairo_runner_facade = CairoRunnerFacade(program=program)
+        self._cairo_runner_facade = CairoRunnerFacade(
+            program=runner_template.program, runner_template=runner_template
+        )
 
     async def run_cairo_function(
         self,
@@ -72,6 +79,9 @@ class CairoInjectableFunctionRunner:
                 **kwargs,
             )
 
+    def get_execution_resources(self) -> ExecutionResources:
+        return self._cairo_runner_facade.get_execution_resources()
+
     @contextmanager
     def vm_exception_handling(self):
         try:
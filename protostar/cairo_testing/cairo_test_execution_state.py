@@ -1,5 +1,5 @@
 import dataclasses
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import dataclass, field
 from typing import cast
 
@@ -18,6 +18,9 @@ from typing_extensions import Self
 
 from protostar.cheatable_starknet.controllers.expect_events_controller import Event
 from protostar.compiler import Cairo0ProjectCompiler
+from protostar.compiler.cached_cairo1_contract_compiler import (
+    CachedCairo1ContractCompiler,
+)
 from protostar.cheatable_starknet.cheatables.cheatable_cached_state import (
     CheatableCachedState,
 )
@@ -38,6 +41,7 @@ class CairoTestExecutionState:
     config: TestConfig
     cairo0_project_compiler: Cairo0ProjectCompiler
     contract_path_resolver: ContractPathResolver
+    cairo1_contract_compiler: CachedCairo1ContractCompiler
     expected_events_list: list[list[Event]] = field(default_factory=list)
 
     @property
@@ -51,16 +55,31 @@ class CairoTestExecutionState:
             config=deepcopy(self.config),
             output_recorder=self.output_recorder.fork(),
             stopwatch=self.stopwatch.fork(),
-            starknet=self.starknet.copy(),
+            starknet=self._fork_starknet(),
             expected_events_list=self.expected_events_list.copy(),
         )
 
+    def _fork_starknet(self) -> Starknet:
+        # `Starknet.copy` copies the whole state
+        starknet_state = copy(self.starknet.state)
+        starknet_state.state = self.cheatable_state.fork()
+        # pylint: disable=protected-access
+        starknet_state._l2_to_l1_messages = {**starknet_state._l2_to_l1_messages}
+        starknet_state.l2_to_l1_messages_log = [*starknet_state.l2_to_l1_messages_log]
+        starknet_state.events = [*starknet_state.events]
+
+        starknet = copy(self.starknet)
+        starknet.state = starknet_state
+        starknet.class_hash_to_abi = {**starknet.class_hash_to_abi}
+        return starknet
+
     @classmethod
     async def from_test_config(
         cls,
         test_config: TestConfig,
         cairo0_project_compiler: Cairo0ProjectCompiler,
         contract_path_resolver: ContractPathResolver,
+        cairo1_contract_compiler: CachedCairo1ContractCompiler,
     ):
         general_config = StarknetGeneralConfig()
         ffc = FactFetchingContext(storage=DictStorage(), hash_func=pedersen_hash_func)
@@ -94,4 +113,5 @@ class CairoTestExecutionState:
             config=test_config,
             cairo0_project_compiler=cairo0_project_compiler,
             contract_path_resolver=contract_path_resolver,
+            cairo1_contract_compiler=cairo1_contract_compiler,
         )
@@ -1,10 +1,9 @@
 from abc import ABC
 from typing import Any
 
-from starkware.cairo.lang.compiler.program import Program
-
 from protostar.cairo import HintLocalsDict
 from protostar.cairo.cairo_function_executor import CairoFunctionExecutor, OffsetOrName
+from protostar.cairo.cairo_function_runner_facade import CairoRunnerTemplate
 from protostar.cairo_testing.cairo_injectable_function_runner import (
     CairoInjectableFunctionRunner,
 )
@@ -15,12 +14,15 @@ class CairoExecutionEnvironment(CairoFunctionExecutor, ABC):
     def __init__(
         self,
         state: CairoTestExecutionState,
-        program: Program,
+        runner_template: CairoRunnerTemplate,
         hint_locals: HintLocalsDict,
     ):
         self.state = state
-        self.program = program
+        self.program = runner_template.program
         self.hint_locals = hint_locals
+        self._function_runner = CairoInjectableFunctionRunner(
+            hint_locals=hint_locals, runner_template=runner_template
+        )
 
     async def run_cairo_function(
         self,
@@ -28,6 +30,6 @@ class CairoExecutionEnvironment(CairoFunctionExecutor, ABC):
         *args: Any,
         **kwargs: Any,
     ):
-        await CairoInjectableFunctionRunner(
-            hint_locals=self.hint_locals, program=self.program
-        ).run_cairo_function(function_identifier, *args, **kwargs)
+        await self._function_runner.run_cairo_function(
+            function_identifier, *args, **kwargs
+        )
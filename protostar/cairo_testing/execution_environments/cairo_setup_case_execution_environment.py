@@ -1,6 +1,5 @@
-from starkware.cairo.lang.compiler.program import Program
-
 from protostar.cairo import HintLocalsDict
+from protostar.cairo.cairo_function_runner_facade import CairoRunnerTemplate
 from protostar.cairo_testing.cairo_hint_local_factory import (
     CairoSharedHintLocalFactory,
     CairoSetupHintLocalFactory,
@@ -17,13 +16,13 @@ from protostar.testing.test_context import TestContextHintLocal
 class CairoSetupCaseExecutionEnvironment(CairoExecutionEnvironment):
     def __init__(
         self,
-        program: Program,
+        runner_template: CairoRunnerTemplate,
         state: CairoTestExecutionState,
     ):
         self._finish_hook = (
             Hook()
         )  # assigned before super call, because _get_hint_locals uses this hook
-        super().__init__(state, program, self._get_hint_locals(state))
+        super().__init__(state, runner_template, self._get_hint_locals(state))
 
     async def execute(self, function_identifier: OffsetOrName):
         with self.state.output_recorder.redirect("setup case"):
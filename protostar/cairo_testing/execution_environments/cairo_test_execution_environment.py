@@ -1,13 +1,22 @@
-from typing import Any
+from typing import Any, Optional
 
-from starkware.cairo.lang.compiler.program import Program
+from starkware.starknet.business_logic.execution.objects import (
+    ExecutionResourcesManager,
+)
+from starkware.starknet.definitions.general_config import StarknetGeneralConfig
 
+from protostar.cheatable_starknet.controllers import ContractCallsResources
+from protostar.starknet import estimate_gas
 from protostar.testing.environments.execution_environment import TestExecutionResult
+from protostar.testing.starkware.execution_resources_summary import (
+    ExecutionResourcesSummary,
+)
 from protostar.testing.cheatcodes.expect_revert_cheatcode import ExpectRevertContext
 from protostar.testing.hook import Hook
 from protostar.testing.test_context import TestContextHintLocal
 from protostar.cairo_testing.cairo_test_execution_state import CairoTestExecutionState
 from protostar.cairo import HintLocalsDict
+from protostar.cairo.cairo_function_runner_facade import CairoRunnerTemplate
 from protostar.cairo.cairo_function_executor import OffsetOrName
 
 from .cairo_execution_environment import CairoExecutionEnvironment
@@ -21,20 +30,25 @@ class CairoTestExecutionEnvironment(CairoExecutionEnvironment):
     def __init__(
         self,
         state: CairoTestExecutionState,
-        program: Program,
+        runner_template: CairoRunnerTemplate,
     ):
         self._finish_hook = (
             Hook()
         )  # assigned before super call, because _get_hint_locals uses this hook
+        self._contract_calls_resources = ContractCallsResources()
         super().__init__(
-            state=state, program=program, hint_locals=self._get_hint_locals(state)
+            state=state,
+            runner_template=runner_template,
+            hint_locals=self._get_hint_locals(state),
         )
         self._expect_revert_context = ExpectRevertContext()
 
     async def execute(self, function_identifier: OffsetOrName) -> Any:
         with self.state.output_recorder.redirect("test"):
             await self.execute_test_case(function_identifier)
-            return TestExecutionResult(execution_resources=None)
+            return TestExecutionResult(
+                execution_resources=self._summarize_execution_resources()
+            )
 
     async def execute_test_case(
         self,
@@ -46,6 +60,28 @@ class CairoTestExecutionEnvironment(CairoExecutionEnvironment):
             async with self._finish_hook.run_after():
                 await self.run_cairo_function(function_identifier, *args, **kwargs)
 
+    def _summarize_execution_resources(self) -> ExecutionResourcesSummary:
+        """
+        Sums resources used by the test function and by contracts it called.
+        """
+        calls_resources_manager = self._contract_calls_resources.resources_manager
+        resources_manager = ExecutionResourcesManager(
+            cairo_usage=self._function_runner.get_execution_resources()
+            + calls_resources_manager.cairo_usage,
+            syscall_counter=calls_resources_manager.syscall_counter,
+        )
+        estimated_gas: Optional[int] = None
+        if self.state.config.gas_estimation_enabled:
+            estimated_gas = estimate_gas(
+                state=self.state.cheatable_state,
+                starknet_general_config=StarknetGeneralConfig(),
+                resources_manager=resources_manager,
+                call_infos=self._contract_calls_resources.call_infos,
+            )
+        return ExecutionResourcesSummary.from_execution_resources(
+            resources_manager.cairo_usage, estimated_gas=estimated_gas
+        )
+
     def _get_hint_locals(self, state: CairoTestExecutionState) -> HintLocalsDict:
         hint_locals: HintLocalsDict = {}
         cheatcode_factory = CairoTestHintLocalFactory(
@@ -55,6 +91,7 @@ class CairoTestExecutionEnvironment(CairoExecutionEnvironment):
                 contract_path_resolver=state.contract_path_resolver,
                 test_execution_state=state,
                 test_finish_hook=self._finish_hook,
+                contract_calls_resources=self._contract_calls_resources,
             )
         )
         test_hint_locals = cheatcode_factory.build_hint_locals()
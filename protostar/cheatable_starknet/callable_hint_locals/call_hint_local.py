@@ -1,4 +1,3 @@
-import asyncio
 from typing import Callable, Optional
 
 from protostar.starknet import CheatcodeException, RawAddress, Address, Selector
@@ -11,6 +10,7 @@ from protostar.cheatable_starknet.controllers import ExpectCallController
 from protostar.cheatable_starknet.controllers.expect_call_controller import ExpectedCall
 from protostar.starknet.data_transformer import CairoData
 from protostar.cairo.short_string import short_string_to_str, CairoShortString
+from protostar.starknet.thread_event_loop import run_in_thread_event_loop
 
 from .callable_hint_local import CallableHintLocal
 
@@ -39,7 +39,7 @@ class CallHintLocal(CallableHintLocal):
         function_name: CairoShortString,
         calldata: Optional[CairoData] = None,
     ) -> CallResult:
-        return asyncio.run(
+        return run_in_thread_event_loop(
             self._call(
                 contract_address=Address.from_user_input(contract_address),
                 entry_point_selector=Selector(short_string_to_str(function_name)),
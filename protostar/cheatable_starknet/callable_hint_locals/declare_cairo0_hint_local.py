@@ -1,4 +1,3 @@
-import asyncio
 from typing import Any, Protocol
 
 from protostar.cheatable_starknet.controllers.contracts import (
@@ -7,6 +6,7 @@ from protostar.cheatable_starknet.controllers.contracts import (
 )
 from protostar.compiler import Cairo0ProjectCompiler
 from protostar.cairo.short_string import CairoShortString, short_string_to_str
+from protostar.starknet.thread_event_loop import run_in_thread_event_loop
 
 from .callable_hint_local import CallableHintLocal
 
@@ -43,7 +43,7 @@ class DeclareCairo0HintLocal(CallableHintLocal):
                 contract_str
             )
         )
-        declared_class = asyncio.run(
+        declared_class = run_in_thread_event_loop(
             self._contracts_controller.declare_cairo0_contract(compiled_contract)
         )
 
@@ -1,10 +1,5 @@
-import asyncio
-from typing import Callable, Tuple
+from typing import Callable
 
-from starkware.starknet.services.api.contract_class.contract_class import (
-    ContractClass,
-    CompiledClass,
-)
 from protostar.cairo.short_string import short_string_to_str
 from protostar.cheatable_starknet.callable_hint_locals.callable_hint_local import (
     CallableHintLocal,
@@ -14,12 +9,11 @@ from protostar.cheatable_starknet.controllers.contracts import (
     ContractsController,
     DeclaredSierraClass,
 )
-from protostar.commands.cairo1_commands.fetch_from_scarb import (
-    fetch_linked_libraries_from_scarb,
+from protostar.compiler.cached_cairo1_contract_compiler import (
+    CachedCairo1ContractCompiler,
+    CompiledCairo1Contract,
 )
-from protostar.cairo.contract_class import make_contract_class, make_compiled_class
 from protostar.compiler.cairo1_contract_compiler import (
-    Cairo1ContractCompiler,
     SierraCompilationException,
     CasmCompilationException,
 )
@@ -28,6 +22,7 @@ from protostar.configuration_file.configuration_file import (
     ContractNameNotFoundException,
 )
 from protostar.starknet import CheatcodeException
+from protostar.starknet.thread_event_loop import run_in_thread_event_loop
 
 
 class DeclareHintLocal(CallableHintLocal):
@@ -35,9 +30,11 @@ class DeclareHintLocal(CallableHintLocal):
         self,
         contracts_controller: ContractsController,
         contract_path_resolver: ContractPathResolver,
+        cairo1_contract_compiler: CachedCairo1ContractCompiler,
     ):
         self._contracts_controller = contracts_controller
         self._contract_path_resolver = contract_path_resolver
+        self._cairo1_contract_compiler = cairo1_contract_compiler
 
     @property
     def name(self) -> str:
@@ -47,22 +44,24 @@ class DeclareHintLocal(CallableHintLocal):
         def declare(contract: int) -> DeclaredContract:
             contract_name = short_string_to_str(contract)
 
-            contract_class, compiled_class = _get_contract_classes(
+            compiled_contract = _compile_contract(
                 contract_name=contract_name,
             )
 
-            declared_class: DeclaredSierraClass = asyncio.run(
+            declared_class: DeclaredSierraClass = run_in_thread_event_loop(
                 self._contracts_controller.declare_sierra_contract(
-                    contract_class=contract_class,
-                    compiled_class=compiled_class,
+                    contract_class=compiled_contract.contract_class,
+                    compiled_class=compiled_contract.compiled_class,
+                    class_hash=compiled_contract.class_hash,
+                    compiled_class_hash=compiled_contract.compiled_class_hash,
                 )
             )
 
             return DeclaredContract(class_hash=declared_class.class_hash)
 
-        def _get_contract_classes(
+        def _compile_contract(
             contract_name: str,
-        ) -> Tuple[ContractClass, CompiledClass]:
+        ) -> CompiledCairo1Contract:
             try:
                 contract_path = (
                     self._contract_path_resolver.contract_path_from_contract_name(
@@ -75,15 +74,8 @@ class DeclareHintLocal(CallableHintLocal):
                 ) from ex
 
             try:
-                (
-                    sierra_compiled,
-                    casm_compiled,
-                ) = Cairo1ContractCompiler.compile_contract(
-                    contract_name,
-                    contract_path,
-                    linked_libraries=fetch_linked_libraries_from_scarb(
-                        self._contract_path_resolver.project_root_path
-                    ),
+                return self._cairo1_contract_compiler.compile_contract(
+                    contract_name, contract_path
                 )
             except SierraCompilationException as ex:
                 raise CheatcodeException(
@@ -94,8 +86,4 @@ class DeclareHintLocal(CallableHintLocal):
                     self, f"Compilation of contract {contract_name} to casm failed"
                 ) from ex
 
-            return make_contract_class(sierra_compiled), make_compiled_class(
-                casm_compiled
-            )
-
         return declare
@@ -1,4 +1,3 @@
-import asyncio
 from typing import Any, Callable
 
 from starkware.starkware_utils.error_handling import StarkException
@@ -11,6 +10,7 @@ from protostar.cheatable_starknet.controllers.contracts import (
 from protostar.cheatable_starknet.controllers.transaction_revert_exception import (
     TransactionRevertException,
 )
+from protostar.starknet.thread_event_loop import run_in_thread_event_loop
 
 from .callable_hint_local import CallableHintLocal
 
@@ -32,7 +32,7 @@ class DeployHintLocal(CallableHintLocal):
         contract_address: int,
         class_hash: int,
     ):
-        return asyncio.run(
+        return run_in_thread_event_loop(
             self._run_deploy_prepared(
                 PreparedContract(
                     constructor_calldata=constructor_calldata,
@@ -1,4 +1,3 @@
-import asyncio
 from typing import Any, Optional, List
 
 from protostar.cairo.short_string import short_string_to_str, CairoShortString
@@ -15,6 +14,7 @@ from protostar.starknet import (
     CheatcodeException,
     Selector,
 )
+from protostar.starknet.thread_event_loop import run_in_thread_event_loop
 
 
 class InvokeHintLocal(CallableHintLocal):
@@ -47,7 +47,7 @@ class InvokeHintLocal(CallableHintLocal):
         calldata: Optional[List[int]] = None,
     ):
         try:
-            asyncio.run(
+            run_in_thread_event_loop(
                 self._contracts_controller.invoke(
                     contract_address=contract_address,
                     entry_point_selector=entry_point_selector,
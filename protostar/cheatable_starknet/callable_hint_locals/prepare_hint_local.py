@@ -1,4 +1,3 @@
-import asyncio
 from typing import Any, Callable, Optional, List
 
 from protostar.cheatable_starknet.callable_hint_locals.callable_hint_local import (
@@ -10,6 +9,7 @@ from protostar.cheatable_starknet.controllers.contracts import (
     PreparedContract,
 )
 from protostar.starknet import CheatcodeException
+from protostar.starknet.thread_event_loop import run_in_thread_event_loop
 
 
 class PrepareHintLocal(CallableHintLocal):
@@ -30,7 +30,7 @@ class PrepareHintLocal(CallableHintLocal):
         class_hash: int,
         calldata: Optional[List[int]] = None,
     ) -> PreparedContract:
-        return asyncio.run(
+        return run_in_thread_event_loop(
             self._prepare(
                 class_hash=class_hash,
                 constructor_calldata=calldata,
@@ -1,9 +1,9 @@
-import asyncio
 from typing import Optional
 
 from protostar.cheatable_starknet.controllers.contracts import ContractsController
 from protostar.starknet import RawAddress, Address, CairoData
 from protostar.starknet.selector import Selector
+from protostar.starknet.thread_event_loop import run_in_thread_event_loop
 
 from .callable_hint_local import CallableHintLocal
 
@@ -24,7 +24,7 @@ class SendMessageToL2HintLocal(CallableHintLocal):
             to_address: RawAddress,
             payload: Optional[CairoData] = None,
         ) -> None:
-            asyncio.run(
+            run_in_thread_event_loop(
                 self._contracts_controller.send_message_to_l2(
                     from_l1_address=Address.from_user_input(from_address),
                     to_l2_address=Address.from_user_input(to_address),
@@ -1,10 +1,10 @@
-import asyncio
 from typing import Optional
 
 from protostar.cheatable_starknet.callable_hint_locals.callable_hint_local import (
     CallableHintLocal,
 )
 from protostar.cheatable_starknet.controllers import StorageController
+from protostar.starknet.thread_event_loop import run_in_thread_event_loop
 
 
 class StoreHintLocal(CallableHintLocal):
@@ -25,7 +25,7 @@ class StoreHintLocal(CallableHintLocal):
         value: list[int],
         key: Optional[list[int]] = None,
     ):
-        asyncio.run(
+        run_in_thread_event_loop(
             self._storage_controller.store(
                 target_contract_address=target_contract_address,
                 variable_name=variable_name,
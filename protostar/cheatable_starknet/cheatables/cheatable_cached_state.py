@@ -4,10 +4,7 @@
 from typing import Dict, Optional
 from typing_extensions import Self
 
-from starkware.starknet.business_logic.state.state import (
-    CachedState,
-    CompiledClassCache,
-)
+from starkware.starknet.business_logic.state.state import CompiledClassCache
 from starkware.starknet.public.abi import AbiType
 from starkware.starknet.business_logic.state.state_api_objects import BlockInfo
 from starkware.starknet.business_logic.state.state_api import StateReader
@@ -17,6 +14,8 @@ from starkware.starknet.services.api.contract_class.contract_class import (
 
 from protostar.cheatable_starknet.controllers.expect_events_controller import Event
 from protostar.starknet.address import Address
+from protostar.starknet.copy_on_write_dict import CopyOnWriteDict
+from protostar.starknet.forkable_cached_state import ForkableCachedState
 from protostar.cheatable_starknet.controllers.block_info import BlockInfoController
 from protostar.starknet.selector import Selector
 from protostar.starknet.types import ClassHashType
@@ -25,7 +24,7 @@ from protostar.cheatable_starknet.controllers.expect_call_controller import Expe
 
 
 # pylint: disable=too-many-instance-attributes
-class CheatableCachedState(CachedState):
+class CheatableCachedState(ForkableCachedState):
     def __init__(
         self,
         block_info: BlockInfo,
@@ -38,17 +37,35 @@ class CheatableCachedState(CachedState):
             compiled_class_cache=compiled_class_cache,
         )
 
-        self._target_address_to_pranked_address: dict[Address, Address] = {}
-        self.mocked_calls: dict[Address, dict[Selector, CairoData]] = {}
-        self.event_selector_to_name_map: Dict[int, str] = {}
+        # Values of the maps are replaced instead of being modified, as they are shared by copies
+        self._target_address_to_pranked_address: CopyOnWriteDict[
+            Address, Address
+        ] = CopyOnWriteDict()
+        self.mocked_calls: CopyOnWriteDict[
+            Address, dict[Selector, CairoData]
+        ] = CopyOnWriteDict()
+        self.event_selector_to_name_map: CopyOnWriteDict[int, str] = CopyOnWriteDict()
         self.emitted_events: list[Event] = []
-        self.event_name_to_contract_abi_map: Dict[str, AbiType] = {}
-        self.class_hash_to_contract_abi_map: Dict[ClassHashType, AbiType] = {}
-        self.contract_address_to_class_hash_map: Dict[Address, ClassHashType] = {}
-        self.expected_contract_calls: dict[Address, list[ExpectedCall]] = {}
-
-        self.contract_address_to_block_timestamp: dict[Address, int] = {}
-        self.contract_address_to_block_number: dict[Address, int] = {}
+        self._inherited_emitted_events_count = 0
+        self.event_name_to_contract_abi_map: CopyOnWriteDict[
+            str, AbiType
+        ] = CopyOnWriteDict()
+        self.class_hash_to_contract_abi_map: CopyOnWriteDict[
+            ClassHashType, AbiType
+        ] = CopyOnWriteDict()
+        self.contract_address_to_class_hash_map: CopyOnWriteDict[
+            Address, ClassHashType
+        ] = CopyOnWriteDict()
+        self.expected_contract_calls: CopyOnWriteDict[
+            Address, list[ExpectedCall]
+        ] = CopyOnWriteDict()
+
+        self.contract_address_to_block_timestamp: CopyOnWriteDict[
+            Address, int
+        ] = CopyOnWriteDict()
+        self.contract_address_to_block_number: CopyOnWriteDict[
+            Address, int
+        ] = CopyOnWriteDict()
 
     def add_mocked_response(
         self,
@@ -56,9 +73,10 @@ class CheatableCachedState(CachedState):
         entrypoint: Selector,
         mocked_response: CairoData,
     ) -> None:
-        if target_address not in self.mocked_calls:
-            self.mocked_calls[target_address] = {}
-        self.mocked_calls[target_address][entrypoint] = mocked_response
+        self.mocked_calls[target_address] = {
+            **self.mocked_calls.get(target_address, {}),
+            entrypoint: mocked_response,
+        }
 
     def get_mocked_response(
         self, target_address: Address, entrypoint: Selector
@@ -88,11 +106,13 @@ class CheatableCachedState(CachedState):
     async def get_contract_class(self, class_hash: int) -> CompiledClassBase:
         return await self.get_compiled_class(class_hash)
 
-    def _copy(self):
+    def _create_copy(
+        self, state_reader: StateReader, compiled_class_cache: CompiledClassCache
+    ) -> Self:
         copied = CheatableCachedState(
             block_info=self.block_info,
-            state_reader=self,
-            compiled_class_cache=self.compiled_classes,
+            state_reader=state_reader,
+            compiled_class_cache=compiled_class_cache,
         )
 
         copied._target_address_to_pranked_address = (
@@ -120,6 +140,7 @@ class CheatableCachedState(CachedState):
             self.contract_address_to_block_number.copy()
         )
         copied.emitted_events = self.emitted_events.copy()
+        copied._inherited_emitted_events_count = len(self.emitted_events)
 
         return copied
 
@@ -127,57 +148,30 @@ class CheatableCachedState(CachedState):
         assert isinstance(parent, self.__class__)
         super()._apply(parent)
 
-        parent._target_address_to_pranked_address = {
-            **parent._target_address_to_pranked_address,
-            **self._target_address_to_pranked_address,
-        }
-
-        parent.mocked_calls = {**parent.mocked_calls}
-
-        # pylint: disable=consider-using-dict-items
-        for address in self.mocked_calls:
-            if address in parent.mocked_calls:
-                parent.mocked_calls[address] = {
-                    **parent.mocked_calls[address],
-                    **self.mocked_calls[address],
-                }
-            else:
-                parent.mocked_calls[address] = self.mocked_calls[address]
-
-        parent.event_selector_to_name_map = {
-            **parent.event_selector_to_name_map,
-            **self.event_selector_to_name_map,
-        }
-
-        parent.event_name_to_contract_abi_map = {
-            **parent.event_name_to_contract_abi_map,
-            **self.event_name_to_contract_abi_map,
-        }
-
-        parent.class_hash_to_contract_abi_map = {
-            **parent.class_hash_to_contract_abi_map,
-            **self.class_hash_to_contract_abi_map,
-        }
-        parent.contract_address_to_class_hash_map = {
-            **parent.contract_address_to_class_hash_map,
-            **self.contract_address_to_class_hash_map,
-        }
-        parent.expected_contract_calls = {
-            **parent.expected_contract_calls,
-            **self.expected_contract_calls,
-        }
-        parent.contract_address_to_block_timestamp = {
-            **parent.contract_address_to_block_timestamp,
-            **self.contract_address_to_block_timestamp,
-        }
-        parent.contract_address_to_block_number = {
-            **parent.contract_address_to_block_number,
-            **self.contract_address_to_block_number,
-        }
-        parent.emitted_events = [
-            *parent.emitted_events,
-            *self.emitted_events,
-        ]
+        self._target_address_to_pranked_address.apply_changes(
+            parent._target_address_to_pranked_address
+        )
+        self.mocked_calls.apply_changes(parent.mocked_calls)
+        self.event_selector_to_name_map.apply_changes(parent.event_selector_to_name_map)
+        self.event_name_to_contract_abi_map.apply_changes(
+            parent.event_name_to_contract_abi_map
+        )
+        self.class_hash_to_contract_abi_map.apply_changes(
+            parent.class_hash_to_contract_abi_map
+        )
+        self.contract_address_to_class_hash_map.apply_changes(
+            parent.contract_address_to_class_hash_map
+        )
+        self.expected_contract_calls.apply_changes(parent.expected_contract_calls)
+        self.contract_address_to_block_timestamp.apply_changes(
+            parent.contract_address_to_block_timestamp
+        )
+        self.contract_address_to_block_number.apply_changes(
+            parent.contract_address_to_block_number
+        )
+        parent.emitted_events.extend(
+            self.emitted_events[self._inherited_emitted_events_count :]
+        )
 
     def update_event_selector_to_name_map(
         self, local_event_selector_to_name_map: Dict[int, str]
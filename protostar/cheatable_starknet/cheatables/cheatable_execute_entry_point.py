@@ -2,8 +2,9 @@
 import dataclasses
 import logging
 import re
-from dataclasses import dataclass
-from typing import Optional, cast, List
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Optional, cast, List
 from copy import deepcopy
 
 from starkware.starknet.builtins.segment_arena.segment_arena_builtin_runner import (
@@ -16,6 +17,7 @@ from starkware.starknet.business_logic.execution.objects import (
     ExecutionResourcesManager,
 )
 from starkware.cairo.common.cairo_function_runner import CairoFunctionRunner
+from starkware.cairo.lang.compiler.program import Program
 from starkware.cairo.lang.vm.relocatable import RelocatableValue, MaybeRelocatable
 from starkware.python.utils import to_bytes, as_non_optional
 from starkware.starknet.business_logic.execution.execute_entry_point import (
@@ -43,8 +45,10 @@ from starkware.starknet.services.api.contract_class.contract_class import (
     EntryPointType,
     DeprecatedCompiledClass,
     CompiledClass,
+    CompiledClassEntryPoint,
 )
 
+from protostar.cairo.cairo_profiler import get_active_profiler
 from protostar.starknet import Address
 from protostar.cheatable_starknet.controllers.transaction_revert_exception import (
     TransactionRevertException,
@@ -60,12 +64,52 @@ FAULTY_CLASS_HASH = to_bytes(
 
 logger = logging.getLogger(__name__)
 
+# Starknet layout with a dummy segment arena builtin
+_LAYOUT = dataclasses.replace(
+    STARKNET_LAYOUT_INSTANCE,
+    builtins={**STARKNET_LAYOUT_INSTANCE.builtins, "segment_arena": {}},
+)
+
+
+@dataclass
+class _CompiledClassData:
+    runnable_programs: dict[tuple[str, ...], Program] = field(default_factory=dict)
+    entry_points: dict[tuple[EntryPointType, int], CompiledClassEntryPoint] = field(
+        default_factory=dict
+    )
+
+
+class _CompiledClassDataCache:
+    """
+    LRU cache of data derived from compiled classes, shared by all calls executed in the process.
+    A class hash identifies the compiled class, so it is used as the key.
+    """
+
+    def __init__(self, max_classes_count: int):
+        self._max_classes_count = max_classes_count
+        self._data: OrderedDict[int, _CompiledClassData] = OrderedDict()
+
+    def get(self, class_hash: int) -> _CompiledClassData:
+        class_data = self._data.get(class_hash)
+        if class_data is None:
+            class_data = _CompiledClassData()
+            self._data[class_hash] = class_data
+            if len(self._data) > self._max_classes_count:
+                self._data.popitem(last=False)
+        else:
+            self._data.move_to_end(class_hash)
+        return class_data
+
 
 @dataclass(frozen=True)
 class CheatableExecuteEntryPoint(ExecuteEntryPoint):
     max_steps: Optional[int] = None
     "``None`` means default Cairo value."
 
+    _compiled_class_data_cache: ClassVar[
+        _CompiledClassDataCache
+    ] = _CompiledClassDataCache(max_classes_count=128)
+
     @classmethod
     def create_for_protostar(
         cls,
@@ -228,23 +272,28 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
         # Fix the current resources usage, in order to calculate the usage of this run at the end.
         previous_cairo_usage = resources_manager.cairo_usage
 
-        # Create a dummy layout.
-        layout = dataclasses.replace(
-            STARKNET_LAYOUT_INSTANCE,
-            builtins={**STARKNET_LAYOUT_INSTANCE.builtins, "segment_arena": {}},
-        )
-
         # Prepare runner.
-        entry_point = self._get_selected_entry_point(
-            compiled_class=compiled_class, class_hash=class_hash
-        )
-        program = compiled_class.get_runnable_program(
-            entrypoint_builtins=as_non_optional(entry_point.builtins)
-        )
+        # region: Modified Starknet Code
+        class_data = self._compiled_class_data_cache.get(class_hash)
+        entry_point_key = (self.entry_point_type, self.entry_point_selector)
+        entry_point = class_data.entry_points.get(entry_point_key)
+        if entry_point is None:
+            entry_point = self._get_selected_entry_point(
+                compiled_class=compiled_class, class_hash=class_hash
+            )
+            class_data.entry_points[entry_point_key] = entry_point
+        entrypoint_builtins = tuple(as_non_optional(entry_point.builtins))
+        program = class_data.runnable_programs.get(entrypoint_builtins)
+        if program is None:
+            program = compiled_class.get_runnable_program(
+                entrypoint_builtins=list(entrypoint_builtins)
+            )
+            class_data.runnable_programs[entrypoint_builtins] = program
+        # endregion
         with wrap_with_stark_exception(code=StarknetErrorCode.SECURITY_ERROR):
             runner = CairoFunctionRunner(
                 program=program,
-                layout=layout,
+                layout=_LAYOUT,
                 additional_builtin_factories=dict(
                     segment_arena=lambda name, included: SegmentArenaBuiltinRunner(  # pyright: ignore
                         included=included
@@ -333,6 +382,27 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
             internal_calls=syscall_handler.internal_calls,
         )
 
+    def _run(
+        self,
+        runner: CairoFunctionRunner,
+        entry_point_offset: int,
+        *args: Any,
+        **kwargs: Any,
+    ):
+        profiler = get_active_profiler()
+        if not profiler:
+            super()._run(runner, entry_point_offset, *args, **kwargs)
+            return
+
+        program_name = f"contract {hex(self.contract_address)}"
+        selector_name = profiler.get_selector_name(self.entry_point_selector)
+        with profiler.profile_run(
+            runner,
+            program_name=program_name,
+            function_names={entry_point_offset: f"{program_name}::{selector_name}"},
+        ):
+            super()._run(runner, entry_point_offset, *args, **kwargs)
+
     def _change_max_steps_in_general_config(
         self, general_config: StarknetGeneralConfig
     ):
@@ -1,4 +1,4 @@
 from .block_info import BlockInfoController
-from .contracts import ContractsController
+from .contracts import ContractsController, ContractCallsResources
 from .storage import StorageController
 from .expect_call_controller import ExpectCallController
@@ -1,5 +1,4 @@
-import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, cast, Tuple
 import json
 
@@ -11,9 +10,18 @@ from starkware.starknet.business_logic.execution.objects import (
 from starkware.starknet.business_logic.execution.objects import Event as StarknetEvent
 from starkware.starknet.business_logic.state.state_api import SyncState
 from starkware.starknet.business_logic.transaction.objects import InternalDeclare
+from starkware.starknet.business_logic.fact_state.contract_class_objects import (
+    CompiledClassFact,
+    ContractClassFact,
+)
+from starkware.starknet.core.os.contract_class.class_hash import compute_class_hash
 from starkware.starknet.core.os.contract_class.compiled_class_hash import (
     compute_compiled_class_hash,
 )
+from starkware.starknet.core.os.transaction_hash.transaction_hash import (
+    TransactionHashPrefix,
+    calculate_transaction_hash_common,
+)
 from starkware.starknet.public.abi import AbiType, CONSTRUCTOR_ENTRY_POINT_SELECTOR
 from starkware.starknet.services.api.gateway.transaction import (
     DEFAULT_DECLARE_SENDER_ADDRESS,
@@ -31,8 +39,9 @@ from starkware.starknet.services.api.contract_class.contract_class import (
     ContractClass,
     CompiledClass,
 )
-from starkware.starknet.business_logic.utils import write_class_facts
+from starkware.python.utils import to_bytes
 
+from protostar.cairo.cairo_profiler import get_active_profiler
 from protostar.cheatable_starknet.cheatables.cheatable_execute_entry_point import (
     CheatableExecuteEntryPoint,
 )
@@ -92,6 +101,45 @@ class CallResult:
 class NonValidatedInternalDeclare(InternalDeclare):
     # pylint: disable=too-many-ancestors
 
+    # pylint: disable=too-many-arguments
+    @classmethod
+    def create_from_class_hashes(
+        cls,
+        class_hash: int,
+        compiled_class_hash: int,
+        chain_id: int,
+        sender_address: int,
+        max_fee: int,
+        version: int,
+        signature: List[int],
+        nonce: int,
+    ):
+        """
+        Equivalent of `InternalDeclare.create`, which reuses already computed class hashes
+        instead of hashing the whole contract class (twice).
+        """
+        internal_declare = cls(
+            class_hash=class_hash,
+            compiled_class_hash=compiled_class_hash,
+            sender_address=sender_address,
+            max_fee=max_fee,
+            version=version,
+            signature=signature,
+            nonce=nonce,
+            hash_value=calculate_transaction_hash_common(
+                tx_hash_prefix=TransactionHashPrefix.DECLARE,
+                version=version,
+                contract_address=sender_address,
+                entry_point_selector=0,
+                calldata=[class_hash],
+                max_fee=max_fee,
+                chain_id=chain_id,
+                additional_data=[nonce, compiled_class_hash],
+            ),
+        )
+        internal_declare.verify_version()
+        return internal_declare
+
     def to_external(self) -> DeprecatedDeclare:
         # It is not implemented in the InternalDeclare itself as wll
         raise NotImplementedError(
@@ -116,27 +164,53 @@ class NonValidatedInternalDeclare(InternalDeclare):
         return None, remaining_gas
 
 
+@dataclass
+class ContractCallsResources:
+    """
+    Resources used by contracts called from a test, including contracts they call in turn.
+    """
+
+    resources_manager: ExecutionResourcesManager = field(
+        default_factory=ExecutionResourcesManager.empty
+    )
+    call_infos: List[CallInfo] = field(default_factory=list)
+
+
 class ContractsController:
-    def __init__(self, cheatable_state: "CheatableCachedState"):
+    def __init__(
+        self,
+        cheatable_state: "CheatableCachedState",
+        contract_calls_resources: Optional[ContractCallsResources] = None,
+    ):
         self.cheatable_state = cheatable_state
+        self.contract_calls_resources = (
+            contract_calls_resources or ContractCallsResources()
+        )
 
     async def declare_sierra_contract(
         self,
         contract_class: ContractClass,
         compiled_class: CompiledClass,
+        class_hash: Optional[int] = None,
+        compiled_class_hash: Optional[int] = None,
     ) -> DeclaredSierraClass:
         """
         Declare a sierra contract.
 
         @param contract_class: sierra compiled contract to be declared
         @param compiled_class: casm compiled contract to be declared
+        @param class_hash: precomputed hash of `contract_class`, computed if not provided
+        @param compiled_class_hash: precomputed hash of `compiled_class`, computed if not provided
         @return: DeclaredSierraClass instance.
         """
-        compiled_class_hash = compute_compiled_class_hash(compiled_class)
+        if class_hash is None:
+            class_hash = compute_class_hash(contract_class)
+        if compiled_class_hash is None:
+            compiled_class_hash = compute_compiled_class_hash(compiled_class)
 
         starknet_config = StarknetGeneralConfig()
-        tx = NonValidatedInternalDeclare.create(
-            contract_class=contract_class,
+        tx = NonValidatedInternalDeclare.create_from_class_hashes(
+            class_hash=class_hash,
             compiled_class_hash=compiled_class_hash,
             chain_id=starknet_config.chain_id.value,
             sender_address=DEFAULT_DECLARE_SENDER_ADDRESS,
@@ -149,6 +223,7 @@ class ContractsController:
         )
 
         self._add_event_abi_to_state(json.loads(contract_class.abi))
+        self._name_profiled_functions(json.loads(contract_class.abi))
 
         with self.cheatable_state.copy_and_apply() as state_copy:
             await tx.apply_state_updates(
@@ -157,11 +232,12 @@ class ContractsController:
 
         abi = contract_class.abi
 
-        class_hash = tx.class_hash
-        await write_class_facts(
-            self.cheatable_state.state_reader.ffc,  # pyright: ignore
-            contract_class,
-            compiled_class,
+        ffc = self.cheatable_state.state_reader.ffc  # pyright: ignore
+        await ContractClassFact(contract_class=contract_class).set(
+            storage=ffc.storage, suffix=to_bytes(class_hash)
+        )
+        await CompiledClassFact(compiled_class=compiled_class).set(
+            storage=ffc.storage, suffix=to_bytes(compiled_class_hash)
         )
 
         await self.cheatable_state.set_contract_class(class_hash, compiled_class)
@@ -192,6 +268,7 @@ class ContractsController:
         assert abi is not None
 
         self._add_event_abi_to_state(abi)
+        self._name_profiled_functions(abi)
         class_hash = tx.class_hash
         assert class_hash is not None
         await self.cheatable_state.set_contract_class(class_hash, contract_class)
@@ -213,6 +290,12 @@ class ContractsController:
         for event_name in event_manager._selector_to_name.values():
             self.cheatable_state.event_name_to_contract_abi_map[event_name] = abi
 
+    @staticmethod
+    def _name_profiled_functions(abi: AbiType):
+        profiler = get_active_profiler()
+        if profiler:
+            profiler.name_selectors(abi)
+
     async def deploy_prepared(self, prepared: PreparedContract) -> DeployedContract:
         await self.cheatable_state.deploy_contract(
             contract_address=int(prepared.contract_address),
@@ -259,7 +342,9 @@ class ContractsController:
             ).execute_for_testing(
                 state=self.cheatable_state,
                 general_config=StarknetGeneralConfig(),
+                resources_manager=self.contract_calls_resources.resources_manager,
             )
+            self.contract_calls_resources.call_infos.append(call_info)
             self._add_emitted_events(
                 cast(CheatableCachedState, state), call_info.get_sorted_events()
             )
@@ -320,14 +405,16 @@ class ContractsController:
             calldata=cairo_calldata,
             entry_point_selector=entry_point_selector,
         )
-        state_copy = copy.deepcopy(self.cheatable_state)
+        state_copy = self.cheatable_state.fork()
         state_copy.expected_contract_calls = (
             self.cheatable_state.expected_contract_calls
         )
         result = await entry_point.execute_for_testing(
             state=state_copy,
             general_config=StarknetGeneralConfig(),
+            resources_manager=self.contract_calls_resources.resources_manager,
         )
+        self.contract_calls_resources.call_infos.append(result)
         return CallResult(return_data=result.retdata)
 
     async def invoke(
@@ -345,7 +432,9 @@ class ContractsController:
             call_info = await entry_point.execute_for_testing(
                 state=state_copy,
                 general_config=StarknetGeneralConfig(),
+                resources_manager=self.contract_calls_resources.resources_manager,
             )
+            self.contract_calls_resources.call_infos.append(call_info)
             self._add_emitted_events(
                 cast(CheatableCachedState, state_copy), call_info.get_sorted_events()
             )
@@ -370,7 +459,9 @@ class ContractsController:
             call_info = await entry_point.execute_for_testing(
                 state=state_copy,
                 general_config=StarknetGeneralConfig(),
+                resources_manager=self.contract_calls_resources.resources_manager,
             )
+            self.contract_calls_resources.call_infos.append(call_info)
             self._add_emitted_events(
                 cast(CheatableCachedState, state_copy), call_info.get_sorted_events()
             )
@@ -36,14 +36,10 @@ class ExpectCallController:
 
     def add_expected_call(self, expected_call: ExpectedCall):
         contract_address = Address(int(expected_call.address))
-        if self._cheatable_state.expected_contract_calls.get(contract_address):
-            self._cheatable_state.expected_contract_calls[contract_address].append(
-                expected_call
-            )
-        else:
-            self._cheatable_state.expected_contract_calls[contract_address] = [
-                expected_call
-            ]
+        self._cheatable_state.expected_contract_calls[contract_address] = [
+            *self._cheatable_state.expected_contract_calls.get(contract_address, []),
+            expected_call,
+        ]
 
     def assert_expect_call(self, expected_call: ExpectedCall):
         contract_address = expected_call.address
@@ -68,10 +64,16 @@ class ExpectCallController:
             expected_call_to_remove.address
         )
         if expected_calls is not None:
-            for index, expected_call_item in enumerate(expected_calls):
-                if expected_call_item == expected_call_to_remove:
-                    del expected_calls[index]
-            if not expected_calls:
+            expected_calls = [
+                expected_call_item
+                for expected_call_item in expected_calls
+                if expected_call_item != expected_call_to_remove
+            ]
+            if expected_calls:
+                cheatable_state.expected_contract_calls[
+                    expected_call_to_remove.address
+                ] = expected_calls
+            else:
                 del cheatable_state.expected_contract_calls[
                     expected_call_to_remove.address
                 ]
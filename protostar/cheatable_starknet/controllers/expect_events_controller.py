@@ -1,3 +1,5 @@
+from bisect import bisect_left
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
 
@@ -68,34 +70,93 @@ class ExpectEventsController:
         self._test_execution_state.expected_events_list.append(expected_events)
 
     def compare_expected_and_actual_results(self):
+        emitted_events = self._cheatable_state.emitted_events
+        emitted_events_index = EmittedEventsIndex(emitted_events)
         for expected_events in self._test_execution_state.expected_events_list:
-            matching_result = match_events(
-                expected_events=expected_events,
-                emitted_events=self._cheatable_state.emitted_events,
+            accepted_positions = emitted_events_index.find_matching_positions(
+                expected_events
             )
-            if not matching_result.should_be_accepted:
-                raise ExpectEventsMismatchReportedException(matching_result)
+            if len(accepted_positions) < len(expected_events):
+                raise ExpectEventsMismatchReportedException(
+                    _create_event_matching_result(
+                        expected_events, emitted_events, accepted_positions
+                    )
+                )
+
+
+class EmittedEventsIndex:
+    """
+    Positions of emitted events grouped by the emitting contract and the event key,
+    so expected events are matched without scanning unrelated events.
+    """
+
+    def __init__(self, emitted_events: list[Event]):
+        self._emitted_events = emitted_events
+        self._positions: defaultdict[tuple[int, int], list[int]] = defaultdict(list)
+        for position, emitted_event in enumerate(emitted_events):
+            self._positions[_get_index_key(emitted_event)].append(position)
+
+    def find_matching_positions(self, expected_events: list[Event]) -> list[int]:
+        """
+        Matches expected events in order, each one with the first matching event emitted after
+        the previously matched one. Returns positions of matched emitted events.
+        An expected event without a match fails the remaining expected events.
+        """
+        accepted_positions: list[int] = []
+        cursor = 0
+        for expected_event in expected_events:
+            positions = self._positions.get(_get_index_key(expected_event), [])
+            position = self._find_matching_position(expected_event, positions, cursor)
+            if position is None:
+                break
+            accepted_positions.append(position)
+            cursor = position + 1
+        return accepted_positions
+
+    def _find_matching_position(
+        self, expected_event: Event, positions: list[int], cursor: int
+    ) -> Optional[int]:
+        for position in positions[bisect_left(positions, cursor) :]:
+            if should_accept_event_matching(
+                expected_event=expected_event,
+                emitted_event=self._emitted_events[position],
+            ):
+                return position
+        return None
+
+
+def _get_index_key(event: Event) -> tuple[int, int]:
+    return int(event.from_address), int(event.key)
 
 
 def match_events(
     expected_events: list[Event], emitted_events: list[Event]
 ) -> EventMatchingResult:
-    event_matchings: list[EventMatching] = []
-    for emitted_event in emitted_events:
-        if expected_events and should_accept_event_matching(
-            expected_event=expected_events[0], emitted_event=emitted_event
-        ):
-            event_matchings.append(
-                AcceptedEventMatching(
-                    emitted_event=emitted_event,
-                    expected_event=expected_events[0],
-                )
-            )
-            expected_events.pop(0)
-        else:
-            event_matchings.append(SkippedEventMatching(emitted_event=emitted_event))
+    accepted_positions = EmittedEventsIndex(emitted_events).find_matching_positions(
+        expected_events
+    )
+    return _create_event_matching_result(
+        expected_events, emitted_events, accepted_positions
+    )
+
+
+def _create_event_matching_result(
+    expected_events: list[Event],
+    emitted_events: list[Event],
+    accepted_positions: list[int],
+) -> EventMatchingResult:
+    event_matchings: list[EventMatching] = [
+        SkippedEventMatching(emitted_event=emitted_event)
+        for emitted_event in emitted_events
+    ]
+    for expected_event, position in zip(expected_events, accepted_positions):
+        event_matchings[position] = AcceptedEventMatching(
+            emitted_event=emitted_events[position],
+            expected_event=expected_event,
+        )
     failed_event_matchings = [
-        FailedEventMatching(expected_event) for expected_event in expected_events
+        FailedEventMatching(expected_event)
+        for expected_event in expected_events[len(accepted_positions) :]
     ]
     return EventMatchingResult(
         event_matchings=[*event_matchings, *failed_event_matchings],
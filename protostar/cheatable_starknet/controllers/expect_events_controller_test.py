@@ -185,3 +185,46 @@ def test_expect_events_mismatch_exception():
             "  [fail] name: baz, from_address: 0x0000000000000000000000000000000000000000000000000000000000000003",
         ]
     )
+
+
+def test_matching_events_from_many_contracts():
+    expected_events = [
+        Event(from_address=Address(address), key=Selector("foo"), data=[address])
+        for address in range(1, 100)
+    ]
+    emitted_events = [
+        Event(from_address=Address(address), key=Selector(name), data=[address])
+        for address in range(100)
+        for name in ["foo", "bar"]
+    ]
+
+    result = match_events(
+        expected_events=expected_events, emitted_events=emitted_events
+    )
+
+    assert result.should_be_accepted
+    assert len(expected_events) == 99
+    assert isinstance(result.event_matchings[0], SkippedEventMatching)
+    assert isinstance(result.event_matchings[2], AcceptedEventMatching)
+    assert isinstance(result.event_matchings[3], SkippedEventMatching)
+    assert isinstance(result.event_matchings[198], AcceptedEventMatching)
+
+
+def test_failing_remaining_events_after_mismatch():
+    expected_events = [
+        Event(from_address=Address(123), key=Selector(name))
+        for name in ["foo", "baz", "bar"]
+    ]
+    emitted_events = [
+        Event(from_address=Address(123), key=Selector(name)) for name in ["foo", "bar"]
+    ]
+
+    result = match_events(
+        expected_events=expected_events, emitted_events=emitted_events
+    )
+
+    assert not result.should_be_accepted
+    assert isinstance(result.event_matchings[0], AcceptedEventMatching)
+    assert isinstance(result.event_matchings[1], SkippedEventMatching)
+    assert isinstance(result.event_matchings[2], FailedEventMatching)
+    assert isinstance(result.event_matchings[3], FailedEventMatching)
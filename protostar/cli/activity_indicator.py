@@ -1,12 +1,23 @@
+import os
 import sys
 from itertools import cycle
 from shutil import get_terminal_size
-from threading import Thread
+from threading import Lock, Thread
 from time import sleep
 from typing import Any
 
 from colorama.ansitowin32 import StreamWrapper
 
+# Indicators print from their own threads, e.g. while tests are collected by forked processes.
+# A fork waits until the indicator is done printing, so the child doesn't inherit a held stdout lock.
+_printing_lock = Lock()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_printing_lock.acquire,
+        after_in_parent=_printing_lock.release,
+        after_in_child=_printing_lock.release,
+    )
+
 
 class ActivityIndicator:
     """NOTE: Don't put anything to stdout while this indicator is active."""
@@ -28,7 +39,8 @@ class ActivityIndicator:
         for step in cycle(self.steps):
             if self.done:
                 break
-            print(f"\r{self.message} {step}", flush=True, end="")
+            with _printing_lock:
+                print(f"\r{self.message} {step}", flush=True, end="")
             sleep(self.interval)
 
     def stop(self):
@@ -10,6 +10,12 @@ import logging
 
 from protostar.protostar_exception import ProtostarException
 from protostar.cairo.bindings.cairo_bindings import PackageName
+from protostar.self.cache_io import CacheIO
+from protostar.self.content_hash import ContentHash, ContentHasher
+
+SCARB_METADATA_CACHE_NAME = "scarb_metadata"
+
+_scarb_metadata_by_key: Dict[ContentHash, Dict] = {}
 
 
 class ScarbMetadataFetchException(ProtostarException):
@@ -64,6 +70,48 @@ def read_scarb_metadata(scarb_toml_path: Path) -> Dict:
         ) from ex
 
 
+def read_cached_scarb_metadata(scarb_toml_path: Path) -> Dict:
+    """
+    Same as `read_scarb_metadata`, but spawns Scarb only if the manifest, the lockfile
+    or the Scarb binary changed since the last invocation.
+    The metadata is memoized per process and stored in the project's `.protostar_cache`.
+    """
+    key = _compute_scarb_metadata_key(scarb_toml_path)
+    if key is None:
+        return read_scarb_metadata(scarb_toml_path)
+
+    if key in _scarb_metadata_by_key:
+        return _scarb_metadata_by_key[key]
+
+    cache_io = CacheIO(scarb_toml_path.parent)
+    cache_entry = cache_io.read(SCARB_METADATA_CACHE_NAME)
+    if cache_entry and cache_entry.get("key") == key:
+        metadata = cache_entry["metadata"]
+    else:
+        metadata = read_scarb_metadata(scarb_toml_path)
+        cache_io.write(SCARB_METADATA_CACHE_NAME, {"key": key, "metadata": metadata})
+
+    _scarb_metadata_by_key[key] = metadata
+    return metadata
+
+
+def _compute_scarb_metadata_key(scarb_toml_path: Path) -> Optional[ContentHash]:
+    scarb_path = shutil.which("scarb")
+    if not scarb_path:
+        return None
+
+    scarb_binary_stat = Path(scarb_path).stat()
+    hasher = (
+        ContentHasher()
+        .update(f"{scarb_path}:{scarb_binary_stat.st_mtime_ns}")
+        .update_file(scarb_toml_path.resolve())
+    )
+    scarb_lock_path = scarb_toml_path.parent / "Scarb.lock"
+    if scarb_lock_path.exists():
+        hasher.update_file(scarb_lock_path.resolve())
+    return hasher.hexdigest()
+
+
 def fetch_linked_libraries_from_scarb(
     package_root_path: Path,
 ) -> list[Tuple[Path, PackageName]]:
@@ -75,7 +123,7 @@ def fetch_linked_libraries_from_scarb(
         )
 
     scarb_toml_path = package_root_path / "Scarb.toml"
-    metadata = read_scarb_metadata(scarb_toml_path)
+    metadata = read_cached_scarb_metadata(scarb_toml_path)
 
     try:
         # assuming we have only one entry in the workspace section
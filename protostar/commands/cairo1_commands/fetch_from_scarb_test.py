@@ -0,0 +1,35 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from pytest_mock import MockerFixture
+
+from .fetch_from_scarb import read_cached_scarb_metadata
+
+
+def _mock_scarb(mocker: MockerFixture, metadata: dict[str, Any]):
+    mocker.patch("shutil.which", return_value=__file__)
+    completed_process = mocker.MagicMock()
+    completed_process.returncode = 0
+    completed_process.stdout = json.dumps(metadata).encode("utf-8")
+    return mocker.patch("subprocess.run", return_value=completed_process)
+
+
+def test_scarb_is_spawned_only_when_manifest_or_lockfile_changes(
+    tmp_path: Path, mocker: MockerFixture
+):
+    scarb_toml_path = tmp_path / "Scarb.toml"
+    scarb_toml_path.write_text('[package]\nname = "a"\n', encoding="utf-8")
+    subprocess_run = _mock_scarb(mocker, {"version": 1})
+
+    assert read_cached_scarb_metadata(scarb_toml_path) == {"version": 1}
+    assert read_cached_scarb_metadata(scarb_toml_path) == {"version": 1}
+    assert subprocess_run.call_count == 1
+
+    (tmp_path / "Scarb.lock").write_text("version = 1\n", encoding="utf-8")
+    read_cached_scarb_metadata(scarb_toml_path)
+    assert subprocess_run.call_count == 2
+
+    scarb_toml_path.write_text('[package]\nname = "b"\n', encoding="utf-8")
+    read_cached_scarb_metadata(scarb_toml_path)
+    assert subprocess_run.call_count == 3
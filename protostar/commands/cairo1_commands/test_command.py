@@ -1,27 +1,46 @@
+import multiprocessing
 from argparse import Namespace
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Set, Tuple
 
 from protostar.cli import ProtostarArgument, ProtostarCommand, MessengerFactory
+from protostar.configuration_file import ConfigurationFileFactory
+from protostar.contract_path_resolver import ContractPathResolver
+from protostar.io.file_watcher import FileWatcher, create_file_watcher
 from protostar.io.log_color_provider import LogColorProvider
 from protostar.self.cache_io import CacheIO
 from protostar.self.protostar_directory import ProtostarDirectory
 from protostar.testing import (
+    SharedTestsState,
+    TestCollector,
+    TestDurations,
     TestingSummary,
+    TestRunner,
     TestScheduler,
+    TestWorkerPool,
     determine_testing_seed,
 )
 from protostar.io.output import Messenger
+from protostar.protostar_exception import ProtostarException
 
 
+from protostar.cairo_testing.cairo1_test_collection_cache import (
+    Cairo1TestCollectionCache,
+)
 from protostar.cairo_testing.cairo1_test_collector import Cairo1TestCollector
 from protostar.cairo_testing.cairo1_test_runner import Cairo1TestRunner
+from protostar.cairo_testing.cairo1_test_suite_dependencies import (
+    Cairo1TestSuiteDependencyResolver,
+    TestSuiteDependencyMap,
+)
 from protostar.commands.legacy_commands.test_cairo0 import (
     TestCollectorResultMessage,
     TestCommandCache,
 )
 from protostar.commands.legacy_commands.test_cairo0.messages import (
+    SchedulingReportMessage,
     TestingSummaryResultMessage,
+    WatchingForChangesMessage,
 )
 from protostar.commands.legacy_commands.test_cairo0.testing_live_logger import (
     TestingLiveLogger,
@@ -29,6 +48,11 @@ from protostar.commands.legacy_commands.test_cairo0.testing_live_logger import (
 from protostar.cairo.bindings.cairo_bindings import PackageName
 from .fetch_from_scarb import fetch_linked_libraries_from_scarb
 
+LinkedLibraries = list[Tuple[Path, PackageName]]
+
+WATCHED_DIRECTORY_NAMES = ["src", "tests"]
+CONFIGURATION_FILE_NAMES = ["Scarb.toml", "Scarb.lock", "protostar.toml"]
+
 
 class TestCommand(ProtostarCommand):
     def __init__(
@@ -90,6 +114,19 @@ A glob or globs to a directory or a test suite, for example:
                 type="bool",
                 description="Disable progress bar.",
             ),
+            ProtostarArgument(
+                name="hide-passed-stdout",
+                type="bool",
+                description=(
+                    "Do not show output captured in passed test cases. "
+                    "Output of failed and broken test cases is still shown."
+                ),
+            ),
+            ProtostarArgument(
+                name="estimate-gas",
+                type="bool",
+                description="Show gas estimation for each test case. Estimations might be inaccurate.",
+            ),
             ProtostarArgument(
                 name="exit-first",
                 short_name="x",
@@ -102,20 +139,79 @@ A glob or globs to a directory or a test suite, for example:
                 description="Print the slowest tests at the end.",
                 default=0,
             ),
+            ProtostarArgument(
+                name="profiling",
+                type="bool",
+                description=(
+                    "Profile a single test case and save the steps it executed per function "
+                    "to `profile.pb.gz` (pprof) and `profile.folded` (collapsed stacks for flame graphs) "
+                    "in the project root. Steps of called contracts are included."
+                ),
+            ),
+            ProtostarArgument(
+                name="report-scheduling",
+                type="bool",
+                description=(
+                    "Print the predicted and the actual time of executing test suites in parallel. "
+                    "Predictions are based on durations recorded in previous runs."
+                ),
+            ),
             ProtostarArgument(
                 name="last-failed",
                 short_name="lf",
                 type="bool",
                 description="Only re-run failed and broken test cases.",
             ),
+            ProtostarArgument(
+                name="split-suites",
+                type="bool",
+                description=(
+                    "Split big test suites into shards executed in parallel. "
+                    "The `__setup__` hook is executed once per shard."
+                ),
+            ),
+            ProtostarArgument(
+                name="watch",
+                type="bool",
+                description=(
+                    "Keep running and re-run test suites affected by changes "
+                    "in the `src` and `tests` directories."
+                ),
+            ),
+            ProtostarArgument(
+                name="workers",
+                type="int",
+                description=(
+                    "Number of processes executing test suites in parallel. "
+                    "Defaults to the number of CPUs."
+                ),
+            ),
         ]
 
-    async def run(self, args: Namespace) -> TestingSummary:
+    async def run(self, args: Namespace) -> Optional[TestingSummary]:
         if not vars(args).get("json"):
             args.json = None
         messenger = self._messenger_factory.from_args(args)
+        if args.workers is not None and args.workers < 1:
+            raise ProtostarException("Number of workers must be greater than 0.")
         cache = TestCommandCache(CacheIO(self._project_root_path))
 
+        if args.watch:
+            return await self.watch(
+                targets=cache.obtain_targets(args.target, args.last_failed),
+                ignored_targets=args.ignore,
+                no_progress_bar=args.no_progress_bar,
+                exit_first=args.exit_first,
+                slowest_tests_to_report_count=args.report_slowest_tests,
+                split_suites=args.split_suites,
+                report_scheduling=args.report_scheduling,
+                hide_passed_stdout=args.hide_passed_stdout,
+                workers_count=args.workers,
+                profiling=args.profiling,
+                gas_estimation_enabled=args.estimate_gas,
+                messenger=messenger,
+            )
+
         summary = await self.test(
             targets=cache.obtain_targets(args.target, args.last_failed),
             ignored_targets=args.ignore,
@@ -125,6 +221,12 @@ A glob or globs to a directory or a test suite, for example:
             no_progress_bar=args.no_progress_bar,
             exit_first=args.exit_first,
             slowest_tests_to_report_count=args.report_slowest_tests,
+            split_suites=args.split_suites,
+            report_scheduling=args.report_scheduling,
+            hide_passed_stdout=args.hide_passed_stdout,
+            workers_count=args.workers,
+            profiling=args.profiling,
+            gas_estimation_enabled=args.estimate_gas,
             messenger=messenger,
         )
         cache.write_failed_tests_to_cache(summary)
@@ -141,16 +243,38 @@ A glob or globs to a directory or a test suite, for example:
         no_progress_bar: bool = False,
         exit_first: bool = False,
         slowest_tests_to_report_count: int = 0,
+        split_suites: bool = False,
+        report_scheduling: bool = False,
+        hide_passed_stdout: bool = False,
+        workers_count: Optional[int] = None,
+        test_suite_paths: Optional[Set[Path]] = None,
+        worker_pool: Optional[TestWorkerPool] = None,
+        sources_version: int = 0,
+        profiling: bool = False,
+        gas_estimation_enabled: bool = False,
     ) -> TestingSummary:
         testing_seed = determine_testing_seed(seed=None)
+        cache_io = CacheIO(self._project_root_path)
 
-        test_collector = Cairo1TestCollector(linked_libraries or [])
+        test_collector = Cairo1TestCollector(
+            linked_libraries or [],
+            collection_cache=Cairo1TestCollectionCache(
+                cache_io=cache_io,
+                linked_libraries=linked_libraries or [],
+            ),
+        )
         test_collector_result = test_collector.collect(
             targets=targets,
             ignored_targets=ignored_targets,
             default_test_suite_glob=str(self._project_root_path),
+            test_suite_paths=test_suite_paths,
         )
 
+        if profiling and test_collector_result.test_cases_count > 1:
+            raise ProtostarException(
+                "Only one test case can be profiled at the time. Please specify path to a single test case."
+            )
+
         messenger(TestCollectorResultMessage(test_collector_result))
 
         testing_summary = TestingSummary(
@@ -168,23 +292,33 @@ A glob or globs to a directory or a test suite, for example:
                 project_root_path=self._project_root_path,
                 write=messenger,
             )
-            worker = Cairo1TestRunner.worker
+            test_durations = TestDurations.read(cache_io)
 
-            TestScheduler(live_logger=live_logger, worker=worker).run(
+            scheduling_report = TestScheduler(
+                live_logger=live_logger,
+                worker=Cairo1TestRunner.worker,
+                worker_initializer=Cairo1TestRunner.initialize_worker,
+            ).run(
                 include_paths=[
                     str(package_path)
                     for package_path, package_name in linked_libraries or []
                 ],
                 test_collector_result=test_collector_result,
                 disable_hint_validation=False,
-                profiling=False,
+                profiling=profiling,
                 exit_first=exit_first,
                 testing_seed=testing_seed,
                 max_steps=None,
                 project_root_path=self._project_root_path,
                 active_profile_name=self._active_profile_name,
                 cwd=self._cwd,
-                gas_estimation_enabled=False,
+                gas_estimation_enabled=gas_estimation_enabled,
+                split_suites=split_suites,
+                estimate_test_suite_cost=test_durations.estimate_test_suite_cost,
+                send_passed_stdout=not hide_passed_stdout,
+                workers_count=workers_count,
+                worker_pool=worker_pool,
+                sources_version=sources_version,
                 on_exit_first=lambda: messenger(
                     TestingSummaryResultMessage(
                         test_collector_result=test_collector_result,
@@ -194,4 +328,184 @@ A glob or globs to a directory or a test suite, for example:
                 ),
             )
 
+            test_durations.update(testing_summary)
+            test_durations.write(cache_io)
+            if report_scheduling and scheduling_report:
+                messenger(SchedulingReportMessage(scheduling_report))
+
+        return testing_summary
+
+    # pylint: disable=too-many-arguments
+    async def watch(
+        self,
+        targets: list[str],
+        messenger: Messenger,
+        ignored_targets: Optional[list[str]] = None,
+        no_progress_bar: bool = False,
+        exit_first: bool = False,
+        slowest_tests_to_report_count: int = 0,
+        split_suites: bool = False,
+        report_scheduling: bool = False,
+        hide_passed_stdout: bool = False,
+        workers_count: Optional[int] = None,
+        profiling: bool = False,
+        gas_estimation_enabled: bool = False,
+    ) -> Optional[TestingSummary]:
+        """
+        Runs tests, and re-runs affected test suites on every change until interrupted.
+        Workers are kept warm between runs. Changes of configuration files restart them.
+        """
+        configuration_paths = {
+            (self._project_root_path / file_name).resolve()
+            for file_name in CONFIGURATION_FILE_NAMES
+        }
+        watched_directories = [
+            self._project_root_path / directory_name
+            for directory_name in WATCHED_DIRECTORY_NAMES
+            if (self._project_root_path / directory_name).is_dir()
+        ] or [self._project_root_path]
+
+        testing_summary: Optional[TestingSummary] = None
+        worker_pool: Optional[TestWorkerPool] = None
+        dependency_map = TestSuiteDependencyMap()
+        # None means all test suites
+        test_suite_paths: Optional[Set[Path]] = None
+        sources_version = 0
+        cache = TestCommandCache(CacheIO(self._project_root_path))
+        with create_file_watcher(
+            [*watched_directories, *configuration_paths]
+        ) as file_watcher:
+            try:
+                while True:
+                    linked_libraries = fetch_linked_libraries_from_scarb(
+                        package_root_path=self._project_root_path,
+                    )
+                    if worker_pool is None or worker_pool.is_terminated:
+                        worker_pool = self._create_worker_pool(
+                            linked_libraries=linked_libraries,
+                            hide_passed_stdout=hide_passed_stdout,
+                            workers_count=workers_count,
+                            profiling=profiling,
+                            gas_estimation_enabled=gas_estimation_enabled,
+                        )
+
+                    testing_summary = await self.test(
+                        targets=targets,
+                        ignored_targets=ignored_targets,
+                        linked_libraries=linked_libraries,
+                        no_progress_bar=no_progress_bar,
+                        exit_first=exit_first,
+                        slowest_tests_to_report_count=slowest_tests_to_report_count,
+                        split_suites=split_suites,
+                        report_scheduling=report_scheduling,
+                        test_suite_paths=test_suite_paths,
+                        worker_pool=worker_pool,
+                        sources_version=sources_version,
+                        profiling=profiling,
+                        gas_estimation_enabled=gas_estimation_enabled,
+                        messenger=messenger,
+                    )
+                    cache.write_failed_tests_to_cache(
+                        testing_summary,
+                        keep_other_test_suites=test_suite_paths is not None,
+                    )
+                    self._update_dependency_map(
+                        dependency_map=dependency_map,
+                        test_collector_result=testing_summary.test_collector_result,
+                        linked_libraries=linked_libraries,
+                        test_suite_paths=test_suite_paths,
+                    )
+
+                    messenger(WatchingForChangesMessage())
+                    (
+                        changed_paths,
+                        test_suite_paths,
+                    ) = self._wait_for_affected_test_suites(
+                        file_watcher, dependency_map, configuration_paths
+                    )
+                    sources_version += 1
+                    if configuration_paths & changed_paths:
+                        worker_pool.terminate()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                if worker_pool:
+                    worker_pool.terminate()
         return testing_summary
+
+    def _create_worker_pool(
+        self,
+        linked_libraries: LinkedLibraries,
+        hide_passed_stdout: bool,
+        workers_count: Optional[int],
+        profiling: bool,
+        gas_estimation_enabled: bool,
+    ) -> TestWorkerPool:
+        return TestWorkerPool(
+            TestRunner.WorkerConfig(
+                shared_tests_state=SharedTestsState(
+                    test_collector_result=TestCollector.Result(test_suites=[]),
+                    send_passed_stdout=not hide_passed_stdout,
+                ),
+                include_paths=[
+                    str(package_path) for package_path, _ in linked_libraries
+                ],
+                disable_hint_validation_in_user_contracts=False,
+                profiling=profiling,
+                project_root_path=self._project_root_path,
+                cwd=self._cwd,
+                active_profile_name=self._active_profile_name,
+                gas_estimation_enabled=gas_estimation_enabled,
+            ),
+            processes_count=workers_count or multiprocessing.cpu_count(),
+            worker_initializer=Cairo1TestRunner.initialize_worker,
+        )
+
+    def _update_dependency_map(
+        self,
+        dependency_map: TestSuiteDependencyMap,
+        test_collector_result: TestCollector.Result,
+        linked_libraries: LinkedLibraries,
+        test_suite_paths: Optional[Set[Path]],
+    ):
+        configuration_file = ConfigurationFileFactory(
+            cwd=self._cwd, active_profile_name=self._active_profile_name
+        ).create()
+        dependency_resolver = Cairo1TestSuiteDependencyResolver(
+            linked_libraries=linked_libraries,
+            resolve_contract_path=ContractPathResolver(
+                project_root_path=self._project_root_path,
+                configuration_file=configuration_file,
+            ).contract_path_from_contract_name,
+        )
+        if test_suite_paths is None:
+            dependency_map.clear()
+        for test_suite_path in test_suite_paths or []:
+            dependency_map.remove(test_suite_path)
+        collected_test_suite_paths = [
+            test_suite.test_path for test_suite in test_collector_result.test_suites
+        ] + [
+            broken_test_suite.file_path
+            for broken_test_suite in test_collector_result.broken_test_suites
+        ]
+        for test_suite_path in collected_test_suite_paths:
+            dependency_map.update(
+                test_suite_path, dependency_resolver.resolve(test_suite_path)
+            )
+
+    @staticmethod
+    def _wait_for_affected_test_suites(
+        file_watcher: FileWatcher,
+        dependency_map: TestSuiteDependencyMap,
+        configuration_paths: Set[Path],
+    ) -> Tuple[Set[Path], Optional[Set[Path]]]:
+        """
+        Returns changed files and test suites affected by them, None meaning all test suites.
+        """
+        while True:
+            changed_paths = file_watcher.wait_for_changes()
+            if configuration_paths & changed_paths:
+                return changed_paths, None
+            test_suite_paths = dependency_map.find_affected_test_suites(changed_paths)
+            if test_suite_paths is None or test_suite_paths:
+                return changed_paths, test_suite_paths
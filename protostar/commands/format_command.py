@@ -68,6 +68,14 @@ class FormatCommand(ProtostarCommand):
                 is_required=False,
                 default=False,
             ),
+            ProtostarArgument(
+                name="workers",
+                type="int",
+                description=(
+                    "Number of processes formatting files in parallel. "
+                    "Defaults to the number of CPUs."
+                ),
+            ),
         ]
 
     async def run(self, args: Namespace):
@@ -79,6 +87,7 @@ class FormatCommand(ProtostarCommand):
             verbose=args.verbose,
             ignore_broken=args.ignore_broken,
             on_formatting_result=write,
+            workers_count=args.workers,
         )
 
         write(summary)
@@ -96,6 +105,7 @@ class FormatCommand(ProtostarCommand):
         verbose: bool = False,
         ignore_broken: bool = False,
         on_formatting_result: Optional[Callable[[FormattingResult], Any]] = None,
+        workers_count: Optional[int] = None,
     ) -> FormattingSummary:
         summary = self._formatter.format(
             file_paths=map_targets_to_file_paths(targets),
@@ -103,6 +113,7 @@ class FormatCommand(ProtostarCommand):
             verbose=verbose,
             ignore_broken=ignore_broken,
             on_formatting_result=on_formatting_result,
+            workers_count=workers_count,
         )
 
         return summary
@@ -13,3 +13,5 @@ from .unexpected_broken_test_suite_result_message import (
 )
 from .test_collector_result_message import TestCollectorResultMessage
 from .testing_summary_message import TestingSummaryResultMessage
+from .scheduling_report_message import SchedulingReportMessage
+from .watching_for_changes_message import WatchingForChangesMessage
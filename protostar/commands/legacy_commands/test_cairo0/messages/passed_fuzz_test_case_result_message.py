@@ -111,4 +111,18 @@ class PassedFuzzTestCaseResultMessage(StructuredMessage):
         }
         if self.passed_fuzz_test_case_result.fuzz_runs_count:
             result["fuzz_runs"] = str(self.passed_fuzz_test_case_result.fuzz_runs_count)
+        execution_resources = self.passed_fuzz_test_case_result.execution_resources
+        if execution_resources:
+            result["execution_resources"] = {
+                "steps": str(execution_resources.n_steps),
+                "memory_holes": str(execution_resources.n_memory_holes),
+                "builtins": {
+                    builtin_name: str(builtin_count)
+                    for builtin_name, builtin_count in execution_resources.builtin_name_to_count_map.items()
+                },
+            }
+            if execution_resources.estimated_gas is not None:
+                result["execution_resources"]["estimated_gas"] = str(
+                    execution_resources.estimated_gas
+                )
         return result
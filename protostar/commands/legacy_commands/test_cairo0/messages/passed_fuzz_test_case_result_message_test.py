@@ -0,0 +1,100 @@
+from pathlib import Path
+from typing import Optional
+
+from protostar.testing import PassedFuzzTestCaseResult
+from protostar.testing.starkware.execution_resources_summary import (
+    CountSeriesStatistic,
+    CountStatistic,
+    ExecutionResourcesSummary,
+)
+
+from .passed_fuzz_test_case_result_message import PassedFuzzTestCaseResultMessage
+
+
+def create_passed_test_case_result(
+    execution_resources: Optional[ExecutionResourcesSummary],
+    fuzz_runs_count: Optional[int] = None,
+) -> PassedFuzzTestCaseResult:
+    return PassedFuzzTestCaseResult(
+        file_path=Path("tests/test_main.cairo"),
+        test_case_name="test_main",
+        captured_stdout={},
+        execution_time=1.0,
+        execution_resources=execution_resources,
+        fuzz_runs_count=fuzz_runs_count,
+    )
+
+
+def test_formatting_execution_resources_to_dict():
+    message = PassedFuzzTestCaseResultMessage(
+        create_passed_test_case_result(
+            ExecutionResourcesSummary(
+                n_steps=CountStatistic(42),
+                n_memory_holes=CountStatistic(3),
+                builtin_name_to_count_map={
+                    "pedersen_builtin": CountStatistic(1),
+                    "range_check_builtin": CountStatistic(0),
+                },
+                estimated_gas=CountStatistic(1234),
+            )
+        )
+    )
+
+    result = message.format_dict()
+
+    assert result["execution_resources"] == {
+        "steps": "42",
+        "memory_holes": "3",
+        "builtins": {
+            "pedersen_builtin": "1",
+            "range_check_builtin": "0",
+        },
+        "estimated_gas": "1234",
+    }
+
+
+def test_formatting_execution_resources_without_gas_to_dict():
+    message = PassedFuzzTestCaseResultMessage(
+        create_passed_test_case_result(
+            ExecutionResourcesSummary(n_steps=CountStatistic(42))
+        )
+    )
+
+    result = message.format_dict()
+
+    assert result["execution_resources"] == {
+        "steps": "42",
+        "memory_holes": "0",
+        "builtins": {},
+    }
+
+
+def test_formatting_fuzz_execution_resources_to_dict():
+    message = PassedFuzzTestCaseResultMessage(
+        create_passed_test_case_result(
+            ExecutionResourcesSummary(
+                n_steps=CountSeriesStatistic([10, 20]),
+                builtin_name_to_count_map={
+                    "pedersen_builtin": CountSeriesStatistic([1, 1]),
+                },
+            ),
+            fuzz_runs_count=2,
+        )
+    )
+
+    result = message.format_dict()
+
+    assert result["test_type"] == "passed_fuzz_test_case"
+    assert result["fuzz_runs"] == "2"
+    assert result["execution_resources"]["steps"] == "μ: 15, Md: 15, min: 10, max: 20"
+    assert result["execution_resources"]["builtins"] == {
+        "pedersen_builtin": "μ: 1, Md: 1, min: 1, max: 1"
+    }
+
+
+def test_formatting_test_case_without_execution_resources_to_dict():
+    message = PassedFuzzTestCaseResultMessage(create_passed_test_case_result(None))
+
+    result = message.format_dict()
+
+    assert "execution_resources" not in result
@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+
+from protostar.io import StructuredMessage, LogColorProvider
+from protostar.testing import SchedulingReport
+
+from .formatters import format_execution_time_structured
+
+
+@dataclass
+class SchedulingReportMessage(StructuredMessage):
+    scheduling_report: SchedulingReport
+
+    def format_human(self, fmt: LogColorProvider) -> str:
+        report = self.scheduling_report
+        predicted = format_execution_time_structured(report.predicted_makespan)
+        actual = format_execution_time_structured(report.actual_makespan)
+        estimated_total_work = format_execution_time_structured(
+            report.estimated_total_work
+        )
+        return (
+            f"{fmt.bold('Scheduling:')} {report.test_suites_count} suites "
+            f"on {report.workers_count} workers, "
+            f"estimated work {estimated_total_work}s, "
+            f"predicted makespan {predicted}s, "
+            f"actual makespan {actual}s"
+        )
+
+    def format_dict(self) -> dict:
+        report = self.scheduling_report
+        return {
+            "type": "test",
+            "message_type": "scheduling_report",
+            "workers_count": report.workers_count,
+            "test_suites_count": report.test_suites_count,
+            "estimated_total_work_in_seconds": format_execution_time_structured(
+                report.estimated_total_work
+            ),
+            "predicted_makespan_in_seconds": format_execution_time_structured(
+                report.predicted_makespan
+            ),
+            "actual_makespan_in_seconds": format_execution_time_structured(
+                report.actual_makespan
+            ),
+        }
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+from protostar.io import StructuredMessage, LogColorProvider
+
+
+@dataclass
+class WatchingForChangesMessage(StructuredMessage):
+    def format_human(self, fmt: LogColorProvider) -> str:
+        return fmt.colorize(
+            "GRAY", "Watching for changes... (press Ctrl+C to stop watching)"
+        )
+
+    def format_dict(self) -> dict:
+        return {
+            "type": "test",
+            "message_type": "watching_for_changes",
+        }
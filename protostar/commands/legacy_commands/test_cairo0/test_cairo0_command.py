@@ -1,3 +1,4 @@
+import multiprocessing
 from argparse import Namespace
 from logging import getLogger
 from pathlib import Path
@@ -104,6 +105,14 @@ A glob or globs to a directory or a test suite, for example:
                 type="bool",
                 description="Disable progress bar.",
             ),
+            ProtostarArgument(
+                name="setup-cache",
+                type="bool",
+                description=(
+                    "Reuse the state after `__setup__` of every test suite from the previous run, "
+                    "as long as Cairo files in the project and the configuration file don't change."
+                ),
+            ),
             ProtostarArgument(
                 name="safe-collecting",
                 type="bool",
@@ -142,6 +151,23 @@ A glob or globs to a directory or a test suite, for example:
                 type="bool",
                 description="Show gas estimation for each test case. Estimations might be inaccurate.",
             ),
+            ProtostarArgument(
+                name="fuzz-workers",
+                type="int",
+                description=(
+                    "Number of processes sharing the examples of a single fuzz test. "
+                    "Results are reproducible for the same seed and number of processes."
+                ),
+                default=1,
+            ),
+            ProtostarArgument(
+                name="workers",
+                type="int",
+                description=(
+                    "Number of processes collecting and executing test suites in parallel. "
+                    "Defaults to the number of CPUs."
+                ),
+            ),
         ]
 
     async def run(self, args: Namespace) -> TestingSummary:
@@ -152,6 +178,8 @@ A glob or globs to a directory or a test suite, for example:
             "Legacy cairo 0 test runner is deprecated, and will be removed in future versions. "
             "Usage of cairo 1 runner is recommended.",
         )
+        if args.workers is not None and args.workers < 1:
+            raise ProtostarException("Number of workers must be greater than 0.")
         cache = TestCommandCache(CacheIO(self._project_root_path))
         summary = await self.test(
             targets=cache.obtain_targets(args.target, args.last_failed),
@@ -165,6 +193,9 @@ A glob or globs to a directory or a test suite, for example:
             max_steps=args.max_steps,
             slowest_tests_to_report_count=args.report_slowest_tests,
             gas_estimation_enabled=args.estimate_gas,
+            workers_count=args.workers,
+            setup_cache_enabled=args.setup_cache,
+            fuzz_workers_count=args.fuzz_workers,
             messenger=messenger,
         )
         cache.write_failed_tests_to_cache(summary)
@@ -187,6 +218,9 @@ A glob or globs to a directory or a test suite, for example:
         max_steps: Optional[int] = None,
         slowest_tests_to_report_count: int = 0,
         gas_estimation_enabled: bool = False,
+        workers_count: Optional[int] = None,
+        setup_cache_enabled: bool = False,
+        fuzz_workers_count: int = 1,
     ) -> TestingSummary:
         include_paths = [
             str(path)
@@ -213,6 +247,7 @@ A glob or globs to a directory or a test suite, for example:
             compiler_config = CairoCompilerConfig(
                 disable_hint_validation=True,
                 include_paths=include_paths,
+                cache_io=CacheIO(self._project_root_path),
             )
 
             starknet_compiler = StarknetCompiler(
@@ -220,7 +255,8 @@ A glob or globs to a directory or a test suite, for example:
                 pass_manager_factory=factory,
             )
             test_collector = TestCollector(
-                get_suite_function_names=starknet_compiler.get_function_names
+                get_suite_function_names=starknet_compiler.get_function_names,
+                workers_count=workers_count or multiprocessing.cpu_count(),
             )
 
             test_collector_result = test_collector.collect(
@@ -251,9 +287,11 @@ A glob or globs to a directory or a test suite, for example:
                 project_root_path=self._project_root_path,
                 write=messenger,
             )
-            worker = TestRunner.worker
-
-            TestScheduler(live_logger=live_logger, worker=worker).run(
+            TestScheduler(
+                live_logger=live_logger,
+                worker=TestRunner.worker,
+                worker_initializer=TestRunner.initialize_worker,
+            ).run(
                 include_paths=include_paths,
                 test_collector_result=test_collector_result,
                 disable_hint_validation=disable_hint_validation,
@@ -265,6 +303,9 @@ A glob or globs to a directory or a test suite, for example:
                 active_profile_name=self._active_profile_name,
                 cwd=self._cwd,
                 gas_estimation_enabled=gas_estimation_enabled,
+                workers_count=workers_count,
+                setup_cache_enabled=setup_cache_enabled,
+                fuzz_workers_count=fuzz_workers_count,
                 on_exit_first=lambda: messenger(
                     TestingSummaryResultMessage(
                         test_collector_result=test_collector_result,
@@ -27,8 +27,28 @@ class TestCommandCache:
             )
         return targets
 
-    def write_failed_tests_to_cache(self, summary: TestingSummary):
+    def write_failed_tests_to_cache(
+        self, summary: TestingSummary, keep_other_test_suites: bool = False
+    ):
+        """
+        If `keep_other_test_suites` is set, failures of test suites not collected in this run,
+        e.g. not affected by a change in the watch mode, are kept.
+        """
         last_failed_targets = []
+        if keep_other_test_suites:
+            collected_paths = {
+                str(test_suite.test_path)
+                for test_suite in summary.test_collector_result.test_suites
+            } | {
+                str(broken_test_suite.file_path)
+                for broken_test_suite in summary.test_collector_result.broken_test_suites
+            }
+            cached = self.cache_io.read("last_failed_tests") or {"targets": []}
+            last_failed_targets = [
+                (file_path, test_name)
+                for file_path, test_name in cached["targets"]
+                if file_path not in collected_paths
+            ]
         for failed_test in summary.failed + summary.broken + summary.broken_suites:
             if isinstance(failed_test, (BrokenTestCaseResult, FailedTestCaseResult)):
                 last_failed_targets.append(
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+from protostar.self.cache_io import CacheIO
+from protostar.testing import TestCollector, TestingSummary
+from protostar.testing.test_results import FailedTestCaseResult
+from protostar.testing.test_suite import TestCase, TestSuite
+
+from .test_command_cache import TestCommandCache
+
+
+def make_testing_summary(
+    test_path: Path, failed_test_case_names: list[str]
+) -> TestingSummary:
+    return TestingSummary(
+        initial_test_results=[
+            FailedTestCaseResult(
+                file_path=test_path,
+                test_case_name=name,
+                captured_stdout={},
+                execution_time=0.0,
+                exception=ValueError(),
+            )
+            for name in failed_test_case_names
+        ],
+        testing_seed=0,
+        test_collector_result=TestCollector.Result(
+            test_suites=[
+                TestSuite(
+                    test_path=test_path,
+                    test_cases=[
+                        TestCase(test_path=test_path, test_fn_name=name)
+                        for name in failed_test_case_names
+                    ],
+                )
+            ]
+        ),
+    )
+
+
+def test_keeping_failures_of_test_suites_not_run(tmp_path: Path):
+    cache = TestCommandCache(CacheIO(tmp_path))
+    cache.write_failed_tests_to_cache(
+        make_testing_summary(Path("a_test.cairo"), ["test_a"])
+    )
+    cache.write_failed_tests_to_cache(
+        make_testing_summary(Path("b_test.cairo"), ["test_b"])
+    )
+    assert cache.obtain_targets([], last_failed=True) == ["b_test.cairo::test_b"]
+
+    cache.write_failed_tests_to_cache(
+        make_testing_summary(Path("a_test.cairo"), ["test_a"]),
+        keep_other_test_suites=True,
+    )
+
+    assert cache.obtain_targets([], last_failed=True) == [
+        "b_test.cairo::test_b",
+        "a_test.cairo::test_a",
+    ]
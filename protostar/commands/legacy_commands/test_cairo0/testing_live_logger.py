@@ -81,6 +81,12 @@ class TestingLiveLogger:
             while tests_left_n > 0:
                 test_result: TestResult = shared_tests_state.get_result()
 
+                # Shards of a split suite report it as broken separately, it is logged once
+                is_reported_broken_suite = isinstance(
+                    test_result, BrokenTestSuiteResult
+                ) and bool(
+                    self.testing_summary.find_broken_suite(test_result.file_path)
+                )
                 self.testing_summary.extend([test_result])
 
                 test_result = make_path_relative_if_possible(
@@ -91,14 +97,15 @@ class TestingLiveLogger:
                     cast(Any, progress_bar).colour = (
                         "RED" if shared_tests_state.any_failed_or_broken() else "GREEN"
                     )
-                    formatted_test_result = format_test_result(test_result)
-                    progress_bar.write(
-                        formatted_test_result.format_human(fmt=log_color_provider)
-                    )
+                    if not is_reported_broken_suite:
+                        formatted_test_result = format_test_result(test_result)
+                        progress_bar.write(
+                            formatted_test_result.format_human(fmt=log_color_provider)
+                        )
 
                     if self.should_exit(test_result):
                         break
-                else:
+                elif not is_reported_broken_suite:
                     self._write(format_test_result(test_result))
 
                 if isinstance(test_result, BrokenTestSuiteResult):
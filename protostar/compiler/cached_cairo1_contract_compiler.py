@@ -0,0 +1,173 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from starkware.starknet.core.os.contract_class.class_hash import compute_class_hash
+from starkware.starknet.core.os.contract_class.compiled_class_hash import (
+    compute_compiled_class_hash,
+)
+from starkware.starknet.services.api.contract_class.contract_class import (
+    ContractClass,
+    CompiledClass,
+)
+
+import protostar.cairo.bindings.cairo_bindings as cairo1_bindings
+from protostar.cairo.bindings.cairo_bindings import PackageName
+from protostar.cairo.contract_class import make_contract_class, make_compiled_class
+from protostar.self.cache_io import CacheIO
+from protostar.self.content_hash import ContentHash, ContentHasher, hash_content
+
+from .cairo1_contract_compiler import Cairo1ContractCompiler
+
+LinkedLibraries = list[Tuple[Path, PackageName]]
+
+
+@dataclass(frozen=True)
+class CompiledCairo1Contract:
+    contract_class: ContractClass
+    compiled_class: CompiledClass
+    class_hash: int
+    compiled_class_hash: int
+
+
+class CachedCairo1ContractCompiler:
+    """
+    Compiles Cairo 1 contracts at most once per content.
+    Results are kept in memory for the lifetime of the compiler and, if `cache_io` is provided,
+    on disk between runs. Linked libraries are resolved lazily, once per compiler.
+    """
+
+    _NAMESPACE = "cairo1_contracts"
+
+    def __init__(
+        self,
+        linked_libraries_provider: Callable[[], LinkedLibraries],
+        cache_io: Optional[CacheIO] = None,
+    ):
+        self._linked_libraries_provider = linked_libraries_provider
+        self._cache_io = cache_io
+        self._linked_libraries: Optional[LinkedLibraries] = None
+        self._environment_hash: Optional[ContentHash] = None
+        self._compiled_contracts: dict[ContentHash, CompiledCairo1Contract] = {}
+
+    @property
+    def linked_libraries(self) -> LinkedLibraries:
+        if self._linked_libraries is None:
+            self._linked_libraries = self._linked_libraries_provider()
+        return self._linked_libraries
+
+    def invalidate_environment(self):
+        """
+        Makes the compiler notice changes of linked libraries' sources, e.g. between runs
+        of the watch mode executed by the same worker.
+        """
+        self._environment_hash = None
+
+    def compile_contract(
+        self, contract_name: str, contract_path: Path
+    ) -> CompiledCairo1Contract:
+        key = self._compute_key(contract_name, contract_path)
+        if key in self._compiled_contracts:
+            return self._compiled_contracts[key]
+
+        compiled_contract = self._read_from_disk(contract_name, contract_path, key)
+        if compiled_contract is None:
+            sierra_compiled, casm_compiled = Cairo1ContractCompiler.compile_contract(
+                contract_name,
+                contract_path,
+                linked_libraries=self.linked_libraries,
+            )
+            compiled_contract = self._make_compiled_contract(
+                sierra_compiled, casm_compiled
+            )
+            self._write_to_disk(
+                contract_name,
+                contract_path,
+                key,
+                sierra_compiled,
+                casm_compiled,
+                compiled_contract,
+            )
+
+        self._compiled_contracts[key] = compiled_contract
+        return compiled_contract
+
+    @staticmethod
+    def _make_compiled_contract(
+        sierra_compiled: str,
+        casm_compiled: str,
+        class_hash: Optional[int] = None,
+        compiled_class_hash: Optional[int] = None,
+    ) -> CompiledCairo1Contract:
+        contract_class = make_contract_class(sierra_compiled)
+        compiled_class = make_compiled_class(casm_compiled)
+        return CompiledCairo1Contract(
+            contract_class=contract_class,
+            compiled_class=compiled_class,
+            class_hash=class_hash
+            if class_hash is not None
+            else compute_class_hash(contract_class),
+            compiled_class_hash=compiled_class_hash
+            if compiled_class_hash is not None
+            else compute_compiled_class_hash(compiled_class),
+        )
+
+    def _read_from_disk(
+        self, contract_name: str, contract_path: Path, key: ContentHash
+    ) -> Optional[CompiledCairo1Contract]:
+        if not self._cache_io:
+            return None
+        entry = self._cache_io.read(self._entry_name(contract_name, contract_path))
+        if entry is None or entry.get("key") != key:
+            return None
+        return self._make_compiled_contract(
+            sierra_compiled=entry["sierra"],
+            casm_compiled=entry["casm"],
+            class_hash=entry["class_hash"],
+            compiled_class_hash=entry["compiled_class_hash"],
+        )
+
+    # pylint: disable=too-many-arguments
+    def _write_to_disk(
+        self,
+        contract_name: str,
+        contract_path: Path,
+        key: ContentHash,
+        sierra_compiled: str,
+        casm_compiled: str,
+        compiled_contract: CompiledCairo1Contract,
+    ):
+        if not self._cache_io:
+            return
+        self._cache_io.write(
+            self._entry_name(contract_name, contract_path),
+            {
+                "key": key,
+                "sierra": sierra_compiled,
+                "casm": casm_compiled,
+                "class_hash": compiled_contract.class_hash,
+                "compiled_class_hash": compiled_contract.compiled_class_hash,
+            },
+        )
+
+    def _entry_name(self, contract_name: str, contract_path: Path) -> str:
+        return f"{self._NAMESPACE}/{hash_content(contract_name, str(contract_path.resolve()))}"
+
+    def _compute_key(self, contract_name: str, contract_path: Path) -> ContentHash:
+        return (
+            ContentHasher()
+            .update(self._get_environment_hash())
+            .update(contract_name)
+            .update_file(contract_path.resolve())
+            .hexdigest()
+        )
+
+    def _get_environment_hash(self) -> ContentHash:
+        if self._environment_hash is None:
+            hasher = ContentHasher().update(cairo1_bindings.get_compiler_fingerprint())
+            for package_path, package_name in sorted(self.linked_libraries):
+                hasher.update(package_name).update_directory(
+                    package_path, suffix=".cairo"
+                )
+            self._environment_hash = hasher.hexdigest()
+        return self._environment_hash
@@ -0,0 +1,124 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from starkware.starknet.services.api.contract_class.contract_class import (
+    DeprecatedCompiledClass,
+)
+
+from protostar.self.cache_io import CacheIO
+from protostar.self.cairo_lang_version import get_cairo_lang_version
+from protostar.self.content_hash import ContentHash, ContentHasher, hash_content
+
+from .project_compiler_types import ProjectCompilerConfig
+
+Dependencies = Dict[str, ContentHash]
+
+
+@dataclass(frozen=True)
+class _CachedCompiledClass:
+    dependencies: Dependencies
+    compiled_class: DeprecatedCompiledClass
+
+
+class Cairo0CompilationCache:
+    """
+    Compiled Cairo 0 contracts, kept in memory and, if `cache_io` is provided, on disk between runs.
+    An entry is keyed by the contract's sources, the cairo path and the compilation flags,
+    and it is valid as long as all files imported by the contract stay the same.
+    """
+
+    _NAMESPACE = "cairo0_contracts"
+    _FORMAT_VERSION = "1"
+
+    def __init__(self, cache_io: Optional[CacheIO] = None):
+        self._cache_io = cache_io
+        self._entries: Dict[ContentHash, _CachedCompiledClass] = {}
+
+    def get_or_compile(
+        self,
+        contract_paths: List[Path],
+        include_paths: List[str],
+        config: ProjectCompilerConfig,
+        compile_contract: Callable[[], DeprecatedCompiledClass],
+        get_source_files: Callable[[], Set[Path]],
+    ) -> DeprecatedCompiledClass:
+        """
+        `get_source_files` returns files read by `compile_contract`, after it finishes.
+        """
+        key = self._compute_key(contract_paths, include_paths, config)
+        entry = self._entries.get(key) or self._read_from_disk(key)
+        if entry is None or not self._are_dependencies_unchanged(entry.dependencies):
+            compiled_class = compile_contract()
+            entry = _CachedCompiledClass(
+                dependencies=self._hash_dependencies(get_source_files()),
+                compiled_class=compiled_class,
+            )
+            self._write_to_disk(key, entry)
+        self._entries[key] = entry
+        return entry.compiled_class
+
+    def _compute_key(
+        self,
+        contract_paths: List[Path],
+        include_paths: List[str],
+        config: ProjectCompilerConfig,
+    ) -> ContentHash:
+        hasher = (
+            ContentHasher()
+            .update(self._FORMAT_VERSION)
+            .update(get_cairo_lang_version())
+            .update(str(config.debugging_info_attached))
+            .update(str(config.hint_validation_disabled))
+        )
+        for contract_path in contract_paths:
+            hasher.update(str(contract_path.resolve()))
+        for include_path in include_paths:
+            hasher.update(include_path)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _hash_dependencies(source_files: Iterable[Path]) -> Dependencies:
+        return {
+            str(path.resolve()): hash_content(path.read_bytes())
+            for path in sorted(source_files)
+        }
+
+    @staticmethod
+    def _are_dependencies_unchanged(dependencies: Dependencies) -> bool:
+        for path, content_hash in dependencies.items():
+            try:
+                if hash_content(Path(path).read_bytes()) != content_hash:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def _read_from_disk(self, key: ContentHash) -> Optional[_CachedCompiledClass]:
+        if not self._cache_io:
+            return None
+        entry = self._cache_io.read(self._entry_name(key))
+        if entry is None:
+            return None
+        return _CachedCompiledClass(
+            dependencies=entry["dependencies"],
+            compiled_class=DeprecatedCompiledClass.Schema().load(
+                entry["compiled_class"]
+            ),
+        )
+
+    def _write_to_disk(self, key: ContentHash, entry: _CachedCompiledClass):
+        if not self._cache_io:
+            return
+        self._cache_io.write(
+            self._entry_name(key),
+            {
+                "dependencies": entry.dependencies,
+                "compiled_class": entry.compiled_class.Schema().dump(
+                    entry.compiled_class
+                ),
+            },
+        )
+
+    def _entry_name(self, key: ContentHash) -> str:
+        return f"{self._NAMESPACE}/{key}"
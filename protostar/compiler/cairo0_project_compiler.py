@@ -16,6 +16,7 @@ from starkware.starkware_utils.error_handling import StarkException
 from protostar.compiler.project_compiler_exceptions import (
     CompilationException,
 )
+from protostar.compiler.cairo0_compilation_cache import Cairo0CompilationCache
 from protostar.compiler.compiled_contract_writer import CompiledContractWriter
 from protostar.compiler.project_cairo_path_builder import LinkedLibrariesBuilder
 from protostar.compiler.project_compiler_types import (
@@ -23,6 +24,7 @@ from protostar.compiler.project_compiler_types import (
     ProjectCompilerConfig,
 )
 from protostar.configuration_file.configuration_file import ConfigurationFile
+from protostar.self.cache_io import CacheIO
 from protostar.starknet import (
     StarknetPassManagerFactory,
     StarknetCompiler,
@@ -44,6 +46,8 @@ class Cairo0ProjectCompiler:
         self._default_config = default_config or ProjectCompilerConfig(
             relative_cairo_path=[]
         )
+        self._cache_io: Optional[CacheIO] = None
+        self._compilation_cache: Optional[Cairo0CompilationCache] = None
 
     def _compile_contract(
         self,
@@ -115,19 +119,39 @@ class Cairo0ProjectCompiler:
         self, contract_paths: List[Path], config: Optional[ProjectCompilerConfig] = None
     ) -> DeprecatedCompiledClass:
         current_config = config or self._default_config
-
-        return StarknetCompiler(
+        include_paths = self._build_str_cairo_path_list(
+            current_config.relative_cairo_path
+        )
+        starknet_compiler = StarknetCompiler(
             config=StarknetCompilerConfig(
-                include_paths=self._build_str_cairo_path_list(
-                    current_config.relative_cairo_path
-                ),
+                include_paths=include_paths,
                 disable_hint_validation=current_config.hint_validation_disabled,
+                cache_io=self._get_cache_io(),
             ),
             pass_manager_factory=StarknetPassManagerFactory,
-        ).compile_contract(
-            *contract_paths, add_debug_info=current_config.debugging_info_attached
         )
 
+        return self._get_compilation_cache().get_or_compile(
+            contract_paths=contract_paths,
+            include_paths=include_paths,
+            config=current_config,
+            compile_contract=lambda: starknet_compiler.compile_contract(
+                *contract_paths, add_debug_info=current_config.debugging_info_attached
+            ),
+            get_source_files=starknet_compiler.get_source_files,
+        )
+
+    def _get_cache_io(self) -> CacheIO:
+        # The cache directory is created on the first compilation, not by every command
+        if self._cache_io is None:
+            self._cache_io = CacheIO(self._project_root_path)
+        return self._cache_io
+
+    def _get_compilation_cache(self) -> Cairo0CompilationCache:
+        if self._compilation_cache is None:
+            self._compilation_cache = Cairo0CompilationCache(self._get_cache_io())
+        return self._compilation_cache
+
     def _build_str_cairo_path_list(
         self, user_relative_cairo_path: List[Path]
     ) -> List[str]:
@@ -1,10 +1,13 @@
+import multiprocessing
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Callable, Any, Optional
+from typing import Any, Callable, Iterable, List, Optional, Tuple
 
 from starkware.cairo.lang.compiler.ast.formatting_utils import FormattingError
 from starkware.cairo.lang.compiler.parser import parse_file
 from starkware.cairo.lang.compiler.parser_transformer import ParserError
 
+from protostar.formatter.formatting_cache import FormattingCache
 from protostar.formatter.formatting_result import (
     FormattingResult,
     BrokenFormattingResult,
@@ -12,6 +15,17 @@ from protostar.formatter.formatting_result import (
     IncorrectFormattingResult,
 )
 from protostar.formatter.formatting_summary import FormattingSummary
+from protostar.self.cache_io import CacheIO
+
+
+@dataclass(frozen=True)
+class _FormattingTask:
+    index: int
+    filepath: Path
+    relative_filepath: Path
+    content: str
+    check: bool
+    ignore_broken: bool
 
 
 class Formatter:
@@ -25,52 +39,106 @@ class Formatter:
         verbose: bool = False,
         ignore_broken: bool = False,
         on_formatting_result: Optional[Callable[[FormattingResult], Any]] = None,
+        workers_count: Optional[int] = None,
     ) -> FormattingSummary:
         summary = FormattingSummary(checked_only=check)
+        formatting_cache = FormattingCache(CacheIO(self._project_root_path))
+
+        def handle_result(result: FormattingResult):
+            summary.extend(result)
+            if not isinstance(result, CorrectFormattingResult) or verbose:
+                if on_formatting_result is not None:
+                    on_formatting_result(result)
 
+        tasks: List[_FormattingTask] = []
+        content_hashes: List[str] = []
         for filepath in file_paths:
             relative_filepath = filepath.relative_to(self._project_root_path)
+            with open(filepath, "r", encoding="utf-8") as file:
+                content = file.read()
 
-            try:
-                with open(filepath, "r", encoding="utf-8") as file:
-                    content = file.read()
-                new_content = parse_file(content, str(filepath)).format()
-            except (ParserError, FormattingError) as ex:
-                if ignore_broken:
-                    continue
-
-                result = BrokenFormattingResult(
-                    filepath=relative_filepath,
-                    checked_only=check,
-                    exception=ex,
+            content_hash = formatting_cache.hash(content)
+            if formatting_cache.is_formatted(content_hash):
+                handle_result(
+                    CorrectFormattingResult(
+                        filepath=relative_filepath,
+                        checked_only=check,
+                    )
                 )
-                summary.extend(result)
-
-                if on_formatting_result is not None:
-                    on_formatting_result(result)
-
-                # Cairo formatter fixes some broken files
-                # We want to disable this behavior
                 continue
 
-            if content == new_content:
-                result = CorrectFormattingResult(
-                    filepath=relative_filepath,
-                    checked_only=check,
-                )
-            else:
-                if not check:
-                    with open(filepath, "w", encoding="utf-8") as file:
-                        file.write(new_content)
-
-                result = IncorrectFormattingResult(
-                    filepath=relative_filepath,
-                    checked_only=check,
+            tasks.append(
+                _FormattingTask(
+                    index=len(tasks),
+                    filepath=filepath,
+                    relative_filepath=relative_filepath,
+                    content=content,
+                    check=check,
+                    ignore_broken=ignore_broken,
                 )
+            )
+            content_hashes.append(content_hash)
 
-            summary.extend(result)
-            if not isinstance(result, CorrectFormattingResult) or verbose:
-                if on_formatting_result is not None:
-                    on_formatting_result(result)
+        try:
+            for index, result in self._format_files(tasks, workers_count):
+                if result is None:
+                    continue
+                if isinstance(result, CorrectFormattingResult):
+                    formatting_cache.mark_formatted(content_hashes[index])
+                handle_result(result)
+        finally:
+            formatting_cache.save()
 
         return summary
+
+    @staticmethod
+    def _format_files(
+        tasks: List[_FormattingTask], workers_count: Optional[int]
+    ) -> Iterable[Tuple[int, Optional[FormattingResult]]]:
+        """
+        Yields results as soon as files are formatted, so the order of results can differ from the order of tasks.
+        """
+        processes_count = min(workers_count or multiprocessing.cpu_count(), len(tasks))
+        if processes_count <= 1:
+            yield from map(_format_file, tasks)
+            return
+
+        with multiprocessing.get_context().Pool(processes=processes_count) as pool:
+            yield from pool.imap_unordered(
+                _format_file,
+                tasks,
+                chunksize=max(1, len(tasks) // (processes_count * 8)),
+            )
+
+
+def _format_file(
+    task: _FormattingTask,
+) -> Tuple[int, Optional[FormattingResult]]:
+    try:
+        new_content = parse_file(task.content, str(task.filepath)).format()
+    except (ParserError, FormattingError) as ex:
+        if task.ignore_broken:
+            return task.index, None
+
+        # Cairo formatter fixes some broken files
+        # We want to disable this behavior
+        return task.index, BrokenFormattingResult(
+            filepath=task.relative_filepath,
+            checked_only=task.check,
+            exception=ex,
+        )
+
+    if task.content == new_content:
+        return task.index, CorrectFormattingResult(
+            filepath=task.relative_filepath,
+            checked_only=task.check,
+        )
+
+    if not task.check:
+        with open(task.filepath, "w", encoding="utf-8") as file:
+            file.write(new_content)
+
+    return task.index, IncorrectFormattingResult(
+        filepath=task.relative_filepath,
+        checked_only=task.check,
+    )
@@ -0,0 +1,55 @@
+from typing import Optional, Set
+
+from protostar.self.cache_io import CacheIO
+from protostar.self.cairo_lang_version import get_cairo_lang_version
+from protostar.self.content_hash import ContentHash, hash_content
+
+
+class FormattingCache:
+    """
+    Hashes of file contents, which are known to be formatted, so `protostar format` skips unchanged files.
+    Entries are bound to the cairo-lang version, as it provides the formatter.
+    """
+
+    _NAME = "formatting"
+    _FORMAT_VERSION = "1"
+    _MAX_ENTRIES_COUNT = 100_000
+
+    def __init__(self, cache_io: CacheIO):
+        self._cache_io = cache_io
+        self._version = hash_content(self._FORMAT_VERSION, get_cairo_lang_version())
+        self._formatted_hashes: Optional[Set[ContentHash]] = None
+        self._new_formatted_hashes: Set[ContentHash] = set()
+
+    def hash(self, content: str) -> ContentHash:
+        return hash_content(self._version, content)
+
+    def is_formatted(self, content_hash: ContentHash) -> bool:
+        return content_hash in self._load()
+
+    def mark_formatted(self, content_hash: ContentHash) -> None:
+        self._new_formatted_hashes.add(content_hash)
+
+    def save(self) -> None:
+        if not self._new_formatted_hashes:
+            return
+        previous_hashes = self._load() - self._new_formatted_hashes
+        formatted_hashes = [
+            *self._new_formatted_hashes,
+            *sorted(previous_hashes),
+        ][: self._MAX_ENTRIES_COUNT]
+        self._cache_io.write(
+            self._NAME,
+            {"version": self._version, "formatted": formatted_hashes},
+        )
+        self._formatted_hashes = set(formatted_hashes)
+        self._new_formatted_hashes = set()
+
+    def _load(self) -> Set[ContentHash]:
+        if self._formatted_hashes is None:
+            cache = self._cache_io.read(self._NAME)
+            if cache is not None and cache.get("version") == self._version:
+                self._formatted_hashes = set(cache.get("formatted", []))
+            else:
+                self._formatted_hashes = set()
+        return self._formatted_hashes
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from protostar.self.cache_io import CacheIO
+
+from .formatting_cache import FormattingCache
+
+
+def test_remembering_formatted_contents(tmp_path: Path):
+    formatting_cache = FormattingCache(CacheIO(tmp_path))
+    formatted_hash = formatting_cache.hash("formatted")
+    formatting_cache.mark_formatted(formatted_hash)
+    formatting_cache.save()
+
+    formatting_cache = FormattingCache(CacheIO(tmp_path))
+
+    assert formatting_cache.is_formatted(formatted_hash)
+    assert not formatting_cache.is_formatted(formatting_cache.hash("unformatted"))
+
+
+def test_keeping_entries_of_previous_runs(tmp_path: Path):
+    first_cache = FormattingCache(CacheIO(tmp_path))
+    first_cache.mark_formatted(first_cache.hash("a"))
+    first_cache.save()
+    second_cache = FormattingCache(CacheIO(tmp_path))
+    second_cache.mark_formatted(second_cache.hash("b"))
+    second_cache.save()
+
+    formatting_cache = FormattingCache(CacheIO(tmp_path))
+
+    assert formatting_cache.is_formatted(formatting_cache.hash("a"))
+    assert formatting_cache.is_formatted(formatting_cache.hash("b"))
@@ -0,0 +1,218 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+
+class FileWatcher(ABC):
+    """
+    Reports files changed under watched directories (recursively) and watched files.
+    Only files with one of the `suffixes` are reported from directories.
+    """
+
+    DEBOUNCE_TIME = 0.05
+
+    def __init__(self, paths: Iterable[Path], suffixes: Iterable[str] = (".cairo",)):
+        paths = [path.resolve() for path in paths]
+        self._directories = [path for path in paths if path.is_dir()]
+        self._files = {path for path in paths if not path.is_dir()}
+        self._suffixes = set(suffixes)
+
+    @abstractmethod
+    def wait_for_changes(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Blocks until some watched files change and returns them.
+        Returns an empty set if nothing changed within `timeout` seconds.
+        """
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def _is_watched(self, path: Path) -> bool:
+        if path in self._files:
+            return True
+        return path.suffix in self._suffixes and any(
+            directory in path.parents for directory in self._directories
+        )
+
+
+class PollingFileWatcher(FileWatcher):
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        suffixes: Iterable[str] = (".cairo",),
+        interval: float = 0.2,
+    ):
+        super().__init__(paths, suffixes)
+        self._interval = interval
+        self._snapshot = self._take_snapshot()
+
+    def wait_for_changes(self, timeout: Optional[float] = None) -> Set[Path]:
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            snapshot = self._take_snapshot()
+            changed_paths = {
+                path
+                for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            if changed_paths:
+                return changed_paths
+            if deadline is not None and time.perf_counter() >= deadline:
+                return set()
+            time.sleep(self._interval)
+
+    def _take_snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot: Dict[Path, Tuple[int, int]] = {}
+        candidates = list(self._files)
+        for directory in self._directories:
+            candidates.extend(directory.rglob("*"))
+        for path in candidates:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if path.is_file() and self._is_watched(path):
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+
+class InotifyFileWatcher(FileWatcher):
+    _IN_MODIFY = 0x00000002
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_FROM = 0x00000040
+    _IN_MOVED_TO = 0x00000080
+    _IN_CREATE = 0x00000100
+    _IN_DELETE = 0x00000200
+    _IN_Q_OVERFLOW = 0x00004000
+    _IN_ISDIR = 0x40000000
+    _WATCH_MASK = (
+        _IN_MODIFY
+        | _IN_CLOSE_WRITE
+        | _IN_MOVED_FROM
+        | _IN_MOVED_TO
+        | _IN_CREATE
+        | _IN_DELETE
+    )
+    _EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, paths: Iterable[Path], suffixes: Iterable[str] = (".cairo",)):
+        super().__init__(paths, suffixes)
+        libc_name = ctypes.util.find_library("c")
+        if libc_name is None:
+            raise OSError("libc not found")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watched_directories: Dict[int, Path] = {}
+        for directory in self._directories:
+            self._add_directory(directory)
+        for file_path in self._files:
+            self._add_watch(file_path.parent)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def wait_for_changes(self, timeout: Optional[float] = None) -> Set[Path]:
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        changed_paths: Set[Path] = set()
+        while not changed_paths:
+            remaining_time = (
+                None if deadline is None else max(0, deadline - time.perf_counter())
+            )
+            if not self._wait_for_events(remaining_time):
+                return set()
+            changed_paths.update(self._read_events())
+            # Editors often save a file in a few steps
+            while self._wait_for_events(self.DEBOUNCE_TIME):
+                changed_paths.update(self._read_events())
+        return changed_paths
+
+    def _wait_for_events(self, timeout: Optional[float]) -> bool:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        return bool(readable)
+
+    def _read_events(self) -> Set[Path]:
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed_paths: Set[Path] = set()
+        offset = 0
+        while offset < len(buffer):
+            watch_descriptor, mask, _, name_length = self._EVENT_HEADER.unpack_from(
+                buffer, offset
+            )
+            offset += self._EVENT_HEADER.size
+            name = buffer[offset : offset + name_length].rstrip(b"\0")
+            offset += name_length
+
+            if mask & self._IN_Q_OVERFLOW:
+                # Events were lost, so everything is considered changed
+                changed_paths.update(self._directories)
+                changed_paths.update(self._files)
+                continue
+
+            directory = self._watched_directories.get(watch_descriptor)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & self._IN_ISDIR:
+                if mask & (self._IN_CREATE | self._IN_MOVED_TO) and any(
+                    watched_directory in path.parents
+                    for watched_directory in self._directories
+                ):
+                    changed_paths.update(self._add_directory(path))
+                continue
+            if self._is_watched(path):
+                changed_paths.add(path)
+        return changed_paths
+
+    def _add_directory(self, directory: Path) -> Set[Path]:
+        """
+        Watches the directory recursively and returns files that are already inside.
+        """
+        existing_files: Set[Path] = set()
+        for root, _, file_names in os.walk(directory):
+            self._add_watch(Path(root))
+            for file_name in file_names:
+                path = Path(root) / file_name
+                if self._is_watched(path):
+                    existing_files.add(path)
+        return existing_files
+
+    def _add_watch(self, directory: Path) -> None:
+        watch_descriptor = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(directory), self._WATCH_MASK
+        )
+        if watch_descriptor >= 0:
+            self._watched_directories[watch_descriptor] = directory
+
+
+def create_file_watcher(
+    paths: Iterable[Path], suffixes: Iterable[str] = (".cairo",)
+) -> FileWatcher:
+    """
+    Uses inotify if it is available, and falls back to polling otherwise.
+    """
+    paths = list(paths)
+    try:
+        return InotifyFileWatcher(paths, suffixes)
+    except (OSError, AttributeError):
+        return PollingFileWatcher(paths, suffixes)
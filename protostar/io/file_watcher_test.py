@@ -0,0 +1,38 @@
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from .file_watcher import FileWatcher, InotifyFileWatcher, PollingFileWatcher
+
+
+def create_polling_file_watcher(paths: list[Path]) -> FileWatcher:
+    return PollingFileWatcher(paths, interval=0.01)
+
+
+@pytest.mark.parametrize(
+    "create_file_watcher", [create_polling_file_watcher, InotifyFileWatcher]
+)
+def test_reporting_changed_files(
+    tmp_path: Path, create_file_watcher: Callable[[list[Path]], FileWatcher]
+):
+    src_path = tmp_path / "src"
+    (src_path / "nested").mkdir(parents=True)
+    cairo_path = src_path / "nested" / "lib.cairo"
+    cairo_path.write_text("fn a() {}", encoding="utf-8")
+    manifest_path = tmp_path / "Scarb.toml"
+
+    with create_file_watcher([src_path, manifest_path]) as file_watcher:
+        assert file_watcher.wait_for_changes(timeout=0.05) == set()
+
+        cairo_path.write_text("fn b() {}", encoding="utf-8")
+        (src_path / "notes.txt").write_text("ignored", encoding="utf-8")
+        assert file_watcher.wait_for_changes(timeout=1) == {cairo_path.resolve()}
+
+        manifest_path.write_text("[package]", encoding="utf-8")
+        assert file_watcher.wait_for_changes(timeout=1) == {manifest_path.resolve()}
+
+        (src_path / "new").mkdir()
+        new_cairo_path = src_path / "new" / "new.cairo"
+        new_cairo_path.write_text("fn c() {}", encoding="utf-8")
+        assert new_cairo_path.resolve() in file_watcher.wait_for_changes(timeout=1)
@@ -1,3 +1,5 @@
+import os
+import tempfile
 from typing import Optional
 import json
 from pathlib import Path
@@ -12,23 +14,52 @@ class CacheIO:
         self._cache_path.mkdir(exist_ok=True)
         self._gitignore_path = Path(self._cache_path / ".gitignore")
 
+    @property
+    def cache_path(self) -> Path:
+        return self._cache_path
+
     def write(self, name: str, value: dict) -> None:
-        if not self._gitignore_path.exists():
-            self._gitignore_path.write_text("*\n", encoding="utf-8")
-        Path(self._cache_path / (name + self._EXTENSION)).write_text(
-            json.dumps(value), encoding="utf-8"
-        )
+        self.write_bytes(name + self._EXTENSION, json.dumps(value).encode("utf-8"))
 
     def read(self, name: str) -> Optional[dict]:
-        if not self._cache_path.exists():
-            return None
-        file_path = self._cache_path / (name + self._EXTENSION)
+        file_contents = self.read_bytes(name + self._EXTENSION)
+        if file_contents:
+            return json.loads(file_contents.decode("utf-8"))
+
+        return None
+
+    def write_bytes(self, name: str, value: bytes) -> None:
+        """
+        Writes `value` to `name` (relative to the cache directory, may contain subdirectories).
+        The file is replaced atomically, so concurrent readers (e.g. test workers) never see partial writes.
+        """
+        self._ensure_gitignore()
+        file_path = self._cache_path / name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(value)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def get_directory(self, name: str) -> Path:
+        """
+        Returns the directory `name` within the cache directory, e.g. for tools managing their own files.
+        """
+        self._ensure_gitignore()
+        directory_path = self._cache_path / name
+        directory_path.mkdir(parents=True, exist_ok=True)
+        return directory_path
+
+    def read_bytes(self, name: str) -> Optional[bytes]:
+        file_path = self._cache_path / name
         if not file_path.exists():
             return None
+        return file_path.read_bytes()
 
-        if file_contents := Path(file_path, encodings="utf-8").read_text(
-            encoding="utf-8"
-        ):
-            return json.loads(file_contents)
-
-        return None
+    def _ensure_gitignore(self) -> None:
+        if not self._gitignore_path.exists():
+            self._gitignore_path.write_text("*\n", encoding="utf-8")
@@ -73,3 +73,18 @@ def test_gitignore_behaviour(tmp_path: Path):
     assert gitignore_path.read_text(encoding="utf-8") == "*\nexample/*\n"
 
     assert cache_io.read(cache_name) == obj
+
+
+def test_bytes_in_subdirectories(tmp_path: Path):
+    cache_io = CacheIO(tmp_path)
+    name = "namespace/entry.bin"
+
+    assert cache_io.read_bytes(name) is None
+
+    cache_io.write_bytes(name, b"\x00\x01")
+    cache_io.write_bytes(name, b"\x02")
+
+    assert cache_io.read_bytes(name) == b"\x02"
+    assert [p.name for p in (cache_io.cache_path / "namespace").iterdir()] == [
+        "entry.bin"
+    ]
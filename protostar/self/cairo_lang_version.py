@@ -0,0 +1,8 @@
+from importlib.metadata import PackageNotFoundError, version
+
+
+def get_cairo_lang_version() -> str:
+    try:
+        return version("cairo-lang")
+    except PackageNotFoundError:
+        return "unknown"
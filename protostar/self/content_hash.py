@@ -0,0 +1,48 @@
+import hashlib
+from pathlib import Path
+from typing import Iterable, Union
+
+ContentHash = str
+
+
+class ContentHasher:
+    """
+    Incrementally builds a sha256 digest out of strings, bytes and file contents.
+    Every chunk is length-prefixed, so different splits of the same data produce different hashes.
+    """
+
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256()
+
+    def update(self, value: Union[str, bytes]) -> "ContentHasher":
+        data = value.encode("utf-8") if isinstance(value, str) else value
+        self._hash.update(len(data).to_bytes(8, "little"))
+        self._hash.update(data)
+        return self
+
+    def update_file(self, path: Path) -> "ContentHasher":
+        self.update(str(path))
+        return self.update(path.read_bytes())
+
+    def update_directory(self, path: Path, suffix: str) -> "ContentHasher":
+        for file_path in sorted(path.rglob(f"*{suffix}")):
+            if file_path.is_file():
+                self.update_file(file_path)
+        return self
+
+    def hexdigest(self) -> ContentHash:
+        return self._hash.hexdigest()
+
+
+def hash_content(*values: Union[str, bytes]) -> ContentHash:
+    hasher = ContentHasher()
+    for value in values:
+        hasher.update(value)
+    return hasher.hexdigest()
+
+
+def hash_files(paths: Iterable[Path]) -> ContentHash:
+    hasher = ContentHasher()
+    for path in paths:
+        hasher.update_file(path)
+    return hasher.hexdigest()
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+from .content_hash import ContentHasher, hash_content, hash_files
+
+
+def test_chunks_are_length_prefixed():
+    assert hash_content("ab", "c") != hash_content("a", "bc")
+    assert hash_content("ab", "c") == hash_content(b"ab", b"c")
+
+
+def test_directory_hash_depends_on_cairo_sources_only(tmp_path: Path):
+    (tmp_path / "lib.cairo").write_text("mod a;", encoding="utf-8")
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "a.cairo").write_text("fn a() {}", encoding="utf-8")
+
+    def hash_dir() -> str:
+        return ContentHasher().update_directory(tmp_path, ".cairo").hexdigest()
+
+    initial_hash = hash_dir()
+    (tmp_path / "README.md").write_text("docs", encoding="utf-8")
+    assert hash_dir() == initial_hash
+
+    (tmp_path / "nested" / "a.cairo").write_text("fn b() {}", encoding="utf-8")
+    assert hash_dir() != initial_hash
+
+
+def test_hash_files(tmp_path: Path):
+    file_path = tmp_path / "a.cairo"
+    file_path.write_text("a", encoding="utf-8")
+    initial_hash = hash_files([file_path])
+
+    file_path.write_text("b", encoding="utf-8")
+
+    assert hash_files([file_path]) != initial_hash
@@ -0,0 +1,15 @@
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+
+def get_protostar_package_version() -> str:
+    """
+    Identifies the running Protostar build. Used for invalidating caches of Python objects.
+    Binary builds carry no package metadata, so they are identified by their installation.
+    """
+    try:
+        return version("protostar")
+    except PackageNotFoundError:
+        package_path = Path(__file__).parent.parent
+        package_stat = package_path.stat()
+        return f"{package_path}:{package_stat.st_mtime_ns}"
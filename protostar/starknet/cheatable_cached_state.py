@@ -24,10 +24,12 @@ from protostar.starknet.types import ClassHashType, SelectorType
 from protostar.starknet.data_transformer import CairoOrPythonData
 
 from protostar.starknet.address import Address
+from protostar.starknet.copy_on_write_dict import CopyOnWriteDict
+from protostar.starknet.forkable_cached_state import ForkableCachedState
 
 
 # pylint: disable=too-many-instance-attributes
-class CheatableCachedState(CachedState):
+class CheatableCachedState(ForkableCachedState):
     def __init__(
         self,
         block_info: BlockInfo,
@@ -40,27 +42,40 @@ class CheatableCachedState(CachedState):
             compiled_class_cache=compiled_class_cache,
         )
 
-        self.pranked_contracts_map: Dict[int, int] = {}
-        self.mocked_calls_map: Dict[Address, Dict[SelectorType, List[int]]] = {}
-        self.event_selector_to_name_map: Dict[int, str] = {}
-
-        self.event_name_to_contract_abi_map: Dict[str, AbiType] = {}
-        self.class_hash_to_contract_abi_map: Dict[ClassHashType, AbiType] = {}
-        self.class_hash_to_contract_path_map: Dict[ClassHashType, Path] = {}
-        self.contract_address_to_class_hash_map: Dict[Address, ClassHashType] = {}
-        self.expected_contract_calls: dict[
+        # Values of the maps are replaced instead of being modified, as they are shared by copies
+        self.pranked_contracts_map: CopyOnWriteDict[int, int] = CopyOnWriteDict()
+        self.mocked_calls_map: CopyOnWriteDict[
+            Address, Dict[SelectorType, List[int]]
+        ] = CopyOnWriteDict()
+        self.event_selector_to_name_map: CopyOnWriteDict[int, str] = CopyOnWriteDict()
+
+        self.event_name_to_contract_abi_map: CopyOnWriteDict[
+            str, AbiType
+        ] = CopyOnWriteDict()
+        self.class_hash_to_contract_abi_map: CopyOnWriteDict[
+            ClassHashType, AbiType
+        ] = CopyOnWriteDict()
+        self.class_hash_to_contract_path_map: CopyOnWriteDict[
+            ClassHashType, Path
+        ] = CopyOnWriteDict()
+        self.contract_address_to_class_hash_map: CopyOnWriteDict[
+            Address, ClassHashType
+        ] = CopyOnWriteDict()
+        self.expected_contract_calls: CopyOnWriteDict[
             Address, list[tuple[SelectorType, CairoOrPythonData]]
-        ] = {}
+        ] = CopyOnWriteDict()
 
         self.cheaters = Cheaters(
             block_info=BlockInfoCheater(self.block_info),
         )
 
-    def _copy(self):
+    def _create_copy(
+        self, state_reader: StateReader, compiled_class_cache: CompiledClassCache
+    ) -> Self:
         copied = CheatableCachedState(
             block_info=self.block_info,
-            state_reader=self,
-            compiled_class_cache=self.compiled_classes,
+            state_reader=state_reader,
+            compiled_class_cache=compiled_class_cache,
         )
 
         copied.pranked_contracts_map = self.pranked_contracts_map.copy()
@@ -89,49 +104,22 @@ class CheatableCachedState(CachedState):
         assert isinstance(parent, self.__class__)
         super()._apply(parent)
 
-        parent.pranked_contracts_map = {
-            **parent.pranked_contracts_map,
-            **self.pranked_contracts_map,
-        }
-
-        parent.mocked_calls_map = {**parent.mocked_calls_map}
-
-        # pylint: disable=consider-using-dict-items
-        for address in self.mocked_calls_map:
-            if address in parent.mocked_calls_map:
-                parent.mocked_calls_map[address] = {
-                    **parent.mocked_calls_map[address],
-                    **self.mocked_calls_map[address],
-                }
-            else:
-                parent.mocked_calls_map[address] = self.mocked_calls_map[address]
-
-        parent.event_selector_to_name_map = {
-            **parent.event_selector_to_name_map,
-            **self.event_selector_to_name_map,
-        }
-
-        parent.event_name_to_contract_abi_map = {
-            **parent.event_name_to_contract_abi_map,
-            **self.event_name_to_contract_abi_map,
-        }
-
-        parent.class_hash_to_contract_path_map = {
-            **parent.class_hash_to_contract_path_map,
-            **self.class_hash_to_contract_path_map,
-        }
-        parent.class_hash_to_contract_abi_map = {
-            **parent.class_hash_to_contract_abi_map,
-            **self.class_hash_to_contract_abi_map,
-        }
-        parent.contract_address_to_class_hash_map = {
-            **parent.contract_address_to_class_hash_map,
-            **self.contract_address_to_class_hash_map,
-        }
-        parent.expected_contract_calls = {
-            **parent.expected_contract_calls,
-            **self.expected_contract_calls,
-        }
+        self.pranked_contracts_map.apply_changes(parent.pranked_contracts_map)
+        self.mocked_calls_map.apply_changes(parent.mocked_calls_map)
+        self.event_selector_to_name_map.apply_changes(parent.event_selector_to_name_map)
+        self.event_name_to_contract_abi_map.apply_changes(
+            parent.event_name_to_contract_abi_map
+        )
+        self.class_hash_to_contract_path_map.apply_changes(
+            parent.class_hash_to_contract_path_map
+        )
+        self.class_hash_to_contract_abi_map.apply_changes(
+            parent.class_hash_to_contract_abi_map
+        )
+        self.contract_address_to_class_hash_map.apply_changes(
+            parent.contract_address_to_class_hash_map
+        )
+        self.expected_contract_calls.apply_changes(parent.expected_contract_calls)
 
         parent.cheaters.apply(self.cheaters)
 
@@ -171,20 +159,24 @@ class CheatableCachedState(CachedState):
     def register_expected_call(
         self, contract_address: Address, selector: SelectorType, calldata: list[int]
     ):
-        if self.expected_contract_calls.get(contract_address):
-            self.expected_contract_calls[contract_address].append((selector, calldata))
-        else:
-            self.expected_contract_calls[contract_address] = [(selector, calldata)]
+        self.expected_contract_calls[contract_address] = [
+            *self.expected_contract_calls.get(contract_address, []),
+            (selector, calldata),
+        ]
 
     def unregister_expected_call(
         self, contract_address: Address, calldata: tuple[int, list[int]]
     ):
         data_for_address = self.expected_contract_calls.get(contract_address)
         if data_for_address is not None and calldata in data_for_address:
-            for index, (selector, calldata_item) in enumerate(data_for_address):
-                if selector == calldata[0] and calldata_item == calldata[1]:
-                    del data_for_address[index]
-            if not data_for_address:
+            data_for_address = [
+                (selector, calldata_item)
+                for selector, calldata_item in data_for_address
+                if selector != calldata[0] or calldata_item != calldata[1]
+            ]
+            if data_for_address:
+                self.expected_contract_calls[contract_address] = data_for_address
+            else:
                 del self.expected_contract_calls[contract_address]
 
 
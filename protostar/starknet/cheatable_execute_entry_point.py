@@ -1,7 +1,7 @@
 # pylint: disable=protected-access
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Optional, cast
+from typing import TYPE_CHECKING, Optional, cast
 from copy import deepcopy
 
 from starkware.cairo.common.cairo_function_runner import CairoFunctionRunner
@@ -39,6 +39,7 @@ from starkware.starkware_utils.error_handling import (
 from protostar.starknet.cheatable_cached_state import CheatableCachedState
 from protostar.starknet.cheatable_syscall_handler import CheatableSysCallHandler
 from protostar.starknet.cheatcode import Cheatcode
+from protostar.starknet.cheatcode_table import CheatcodeTable
 
 if TYPE_CHECKING:
     from protostar.starknet.cheatcode_factory import CheatcodeFactory
@@ -70,6 +71,7 @@ def extract_cheatable_state(state: SyncState) -> CheatableCachedState:
 # pylint: disable=too-many-branches
 class CheatableExecuteEntryPoint(ExecuteEntryPoint):
     cheatcode_factory: Optional["CheatcodeFactory"] = None
+    cheatcode_table: Optional[CheatcodeTable] = None
     samples: list[ContractProfile] = []
     contract_callstack: list[str] = []
 
@@ -118,14 +120,7 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
             segments=runner.segments,
         )
 
-        hint_locals: dict[str, Any] = {}
-
-        cheatcode_factory = CheatableExecuteEntryPoint.cheatcode_factory
-        assert (
-            cheatcode_factory is not None
-        ), "Tried to use CheatableExecuteEntryPoint without cheatcodes."
-
-        cheatcodes = cheatcode_factory.build_cheatcodes(
+        hint_locals = self._get_cheatcode_table().bind(
             syscall_dependencies=Cheatcode.SyscallDependencies(
                 execute_entry_point_cls=CheatableExecuteEntryPoint,
                 tx_execution_context=tx_execution_context,
@@ -139,11 +134,6 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
                 segments=runner.segments,
             )
         )
-        for cheatcode in cheatcodes:
-            hint_locals[cheatcode.name] = cheatcode.build()
-
-        for custom_hint_local in cheatcode_factory.build_hint_locals():
-            hint_locals[custom_hint_local.name] = custom_hint_local.build()
 
         # endregion
 
@@ -196,6 +186,23 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
             class_hash=class_hash,
         )
 
+    @staticmethod
+    def _get_cheatcode_table() -> CheatcodeTable:
+        cheatcode_factory = CheatableExecuteEntryPoint.cheatcode_factory
+        assert (
+            cheatcode_factory is not None
+        ), "Tried to use CheatableExecuteEntryPoint without cheatcodes."
+
+        # A factory is set for each test case, so the table is prepared once per test case
+        cheatcode_table = CheatableExecuteEntryPoint.cheatcode_table
+        if (
+            cheatcode_table is None
+            or cheatcode_table.cheatcode_factory is not cheatcode_factory
+        ):
+            cheatcode_table = CheatcodeTable(cheatcode_factory)
+            CheatableExecuteEntryPoint.cheatcode_table = cheatcode_table
+        return cheatcode_table
+
     def append_contract_callstack(self, state: SyncState, class_hash: int):
         if not CheatableExecuteEntryPoint.contract_callstack:
             CheatableExecuteEntryPoint.contract_callstack.append("TEST_CONTRACT")
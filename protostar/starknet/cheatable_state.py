@@ -133,4 +133,12 @@ class CheatableStarknetState(StarknetState):
         return cls(state=state, general_config=general_config)
 
     def copy(self) -> "CheatableStarknetState":
-        return cast(CheatableStarknetState, super().copy())
+        # `StarknetState.copy` copies the whole state
+        copied = CheatableStarknetState(
+            state=self.cheatable_state.fork(), general_config=self.general_config
+        )
+        # pylint: disable=protected-access
+        copied._l2_to_l1_messages = {**self._l2_to_l1_messages}
+        copied.l2_to_l1_messages_log = [*self.l2_to_l1_messages_log]
+        copied.events = [*self.events]
+        return copied
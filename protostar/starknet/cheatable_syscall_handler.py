@@ -75,7 +75,13 @@ class CheatableSysCallHandler(DeprecatedBlSyscallHandler):
             raise CheatableSysCallHandlerException(
                 f"Couldn't find mocked selector {selector} for an address {contract_address}."
             )
-        del self.cheatable_state.mocked_calls_map[contract_address][selector]
+        self.cheatable_state.mocked_calls_map[contract_address] = {
+            mocked_selector: retdata
+            for mocked_selector, retdata in self.cheatable_state.mocked_calls_map[
+                contract_address
+            ].items()
+            if mocked_selector != selector
+        }
 
     def _call_contract(
         self,
@@ -0,0 +1,68 @@
+from typing import TYPE_CHECKING, Any, Optional
+
+from protostar.cairo import HintLocalsDict
+from protostar.starknet.cheatcode import Cheatcode
+
+if TYPE_CHECKING:
+    from protostar.starknet.cheatcode_factory import CheatcodeFactory
+
+
+class CheatcodeTable:
+    """
+    Hint locals provided by a `CheatcodeFactory`, prepared once per test case.
+    Cheatcodes depend on the contract call, so they are bound to each call, but they are built
+    only when the call uses a cheatcode. Most calls, e.g. to contracts under test, never do.
+    """
+
+    def __init__(self, cheatcode_factory: "CheatcodeFactory"):
+        self.cheatcode_factory = cheatcode_factory
+        self._cheatcode_names: Optional[list[str]] = None
+        self._hint_locals: Optional[HintLocalsDict] = None
+
+    def bind(
+        self, syscall_dependencies: Cheatcode.SyscallDependencies
+    ) -> HintLocalsDict:
+        binding = _CheatcodesBinding(self.cheatcode_factory, syscall_dependencies)
+        if self._cheatcode_names is None:
+            self._cheatcode_names = list(binding.get_cheatcodes())
+        if self._hint_locals is None:
+            self._hint_locals = {
+                hint_local.name: hint_local.build()
+                for hint_local in self.cheatcode_factory.build_hint_locals()
+            }
+        return {
+            **{name: _BoundCheatcode(binding, name) for name in self._cheatcode_names},
+            **self._hint_locals,
+        }
+
+
+class _CheatcodesBinding:
+    def __init__(
+        self,
+        cheatcode_factory: "CheatcodeFactory",
+        syscall_dependencies: Cheatcode.SyscallDependencies,
+    ):
+        self._cheatcode_factory = cheatcode_factory
+        self._syscall_dependencies = syscall_dependencies
+        self._cheatcodes: Optional[HintLocalsDict] = None
+
+    def get_cheatcodes(self) -> HintLocalsDict:
+        if self._cheatcodes is None:
+            self._cheatcodes = {
+                cheatcode.name: cheatcode.build()
+                for cheatcode in self._cheatcode_factory.build_cheatcodes(
+                    self._syscall_dependencies
+                )
+            }
+        return self._cheatcodes
+
+
+class _BoundCheatcode:
+    __slots__ = ("_binding", "_name")
+
+    def __init__(self, binding: _CheatcodesBinding, name: str):
+        self._binding = binding
+        self._name = name
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._binding.get_cheatcodes()[self._name](*args, **kwargs)
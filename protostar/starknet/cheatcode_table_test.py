@@ -0,0 +1,78 @@
+from typing import Any, List, cast
+
+from protostar.cairo import HintLocal
+from protostar.starknet.cheatcode import Cheatcode
+
+from .cheatcode_table import CheatcodeTable
+
+
+class FakeCheatcode:
+    def __init__(self, name: str, syscall_dependencies: Any):
+        self.name = name
+        self._syscall_dependencies = syscall_dependencies
+
+    def build(self):
+        return self.execute
+
+    def execute(self, value: int):
+        return (self.name, self._syscall_dependencies, value)
+
+
+class FakeHintLocal(HintLocal):
+    @property
+    def name(self) -> str:
+        return "custom"
+
+    def build(self) -> Any:
+        return object()
+
+
+class FakeCheatcodeFactory:
+    def __init__(self):
+        self.cheatcodes_builds_count = 0
+        self.hint_locals_builds_count = 0
+
+    def build_cheatcodes(self, syscall_dependencies: Any) -> List[FakeCheatcode]:
+        self.cheatcodes_builds_count += 1
+        return [
+            FakeCheatcode("warp", syscall_dependencies),
+            FakeCheatcode("roll", syscall_dependencies),
+        ]
+
+    def build_hint_locals(self) -> List[HintLocal]:
+        self.hint_locals_builds_count += 1
+        return [FakeHintLocal()]
+
+
+def dependencies(call_id: int) -> Cheatcode.SyscallDependencies:
+    return cast(Cheatcode.SyscallDependencies, call_id)
+
+
+def test_building_cheatcodes_only_when_call_uses_them():
+    factory = FakeCheatcodeFactory()
+    table = CheatcodeTable(cast(Any, factory))
+
+    first_call_locals = table.bind(dependencies(1))
+    second_call_locals = table.bind(dependencies(2))
+    third_call_locals = table.bind(dependencies(3))
+
+    assert list(first_call_locals) == ["warp", "roll", "custom"]
+    assert factory.cheatcodes_builds_count == 1
+
+    assert second_call_locals["warp"](42) == ("warp", 2, 42)
+    assert second_call_locals["roll"](7) == ("roll", 2, 7)
+    assert factory.cheatcodes_builds_count == 2
+
+    assert list(third_call_locals) == ["warp", "roll", "custom"]
+    assert factory.cheatcodes_builds_count == 2
+
+
+def test_building_custom_hint_locals_once():
+    factory = FakeCheatcodeFactory()
+    table = CheatcodeTable(cast(Any, factory))
+
+    first_call_locals = table.bind(dependencies(1))
+    second_call_locals = table.bind(dependencies(2))
+
+    assert first_call_locals["custom"] is second_call_locals["custom"]
+    assert factory.hint_locals_builds_count == 1
@@ -7,14 +7,19 @@ from typing_extensions import Self
 
 from protostar.starknet.cheater import Cheater
 from protostar.starknet.address import Address
+from protostar.starknet.copy_on_write_dict import CopyOnWriteDict
 
 
 class BlockInfoCheater(Cheater):
     def __init__(self, base: BlockInfo):
         self.base: BlockInfo = base
 
-        self.contract_address_to_block_timestamp: dict[Address, int] = {}
-        self.contract_address_to_block_number: dict[Address, int] = {}
+        self.contract_address_to_block_timestamp: CopyOnWriteDict[
+            Address, int
+        ] = CopyOnWriteDict()
+        self.contract_address_to_block_number: CopyOnWriteDict[
+            Address, int
+        ] = CopyOnWriteDict()
 
     def get_for_contract(self, contract_address: Address) -> BlockInfo:
         block_info = self.base
@@ -57,18 +62,22 @@ class BlockInfoCheater(Cheater):
         return stop
 
     def copy(self) -> Self:
-        return copy(self)
+        copied = copy(self)
+        copied.contract_address_to_block_timestamp = (
+            self.contract_address_to_block_timestamp.copy()
+        )
+        copied.contract_address_to_block_number = (
+            self.contract_address_to_block_number.copy()
+        )
+        return copied
 
     def apply(self, parent: Self) -> None:
-        parent.contract_address_to_block_timestamp = {
-            **parent.contract_address_to_block_timestamp,
-            **self.contract_address_to_block_timestamp,
-        }
-
-        parent.contract_address_to_block_number = {
-            **parent.contract_address_to_block_number,
-            **self.contract_address_to_block_number,
-        }
+        self.contract_address_to_block_timestamp.apply_changes(
+            parent.contract_address_to_block_timestamp
+        )
+        self.contract_address_to_block_number.apply_changes(
+            parent.contract_address_to_block_number
+        )
 
 
 def replace_in_marshmallow_dataclass(instance: Any, **changes: Any):
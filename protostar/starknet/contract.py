@@ -1,5 +1,5 @@
 import asyncio
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from starkware.starknet.testing.contract_utils import build_arguments
 from starkware.starknet.testing.objects import StarknetCallInfo
@@ -68,7 +68,7 @@ def estimate_gas(
     state: CachedState,
     starknet_general_config: StarknetGeneralConfig,
     resources_manager: ExecutionResourcesManager,
-    call_info: CallInfo,
+    call_infos: List[CallInfo],
 ) -> int:
     loop = asyncio.get_running_loop()
     sync_state = StateSyncifier(async_state=state, loop=loop)
@@ -76,7 +76,7 @@ def estimate_gas(
     resources = calculate_tx_resources(
         state=tracker_state,
         resources_manager=resources_manager,
-        call_infos=[call_info],
+        call_infos=call_infos,
         tx_type=TransactionType.INVOKE_FUNCTION,
     )
     estimated_gas = calculate_tx_fee(
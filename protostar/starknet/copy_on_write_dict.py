@@ -0,0 +1,135 @@
+from typing import (
+    Dict,
+    Generic,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+KeyT = TypeVar("KeyT")
+ValueT = TypeVar("ValueT")
+
+
+class _Deleted:
+    def __repr__(self) -> str:
+        return "<deleted>"
+
+
+_DELETED = _Deleted()
+
+Layer = Dict[KeyT, Union[ValueT, _Deleted]]
+
+
+class CopyOnWriteDict(MutableMapping[KeyT, ValueT], Generic[KeyT, ValueT]):
+    """
+    Dictionary, which can be copied in constant time.
+    A copy shares immutable layers of changes with the original, and writes only to its own top layer.
+    Changes made since the copy was created can be applied to the original in O(changes).
+    Values are not copied, so they shouldn't be modified in place.
+    """
+
+    MAX_LAYERS_COUNT = 8
+
+    def __init__(self, data: Optional[Mapping[KeyT, ValueT]] = None):
+        self._layers: Tuple[Layer, ...] = (dict(data),) if data else ()
+        self._top: Layer = {}
+        # Layers created after the copy
+        self._own_layers_start = len(self._layers)
+        self._length = len(data) if data else 0
+
+    def copy(self) -> "CopyOnWriteDict[KeyT, ValueT]":
+        self._freeze_top()
+        copied: CopyOnWriteDict[KeyT, ValueT] = CopyOnWriteDict()
+        copied._layers = self._layers
+        copied._own_layers_start = len(self._layers)
+        copied._length = self._length
+        return copied
+
+    def get_changes(self) -> Layer:
+        """
+        Returns keys set or deleted since the copy was created.
+        Deleted keys are mapped to a marker recognized by `apply_changes`.
+        """
+        changes: Layer = {}
+        for layer in self._layers[self._own_layers_start :]:
+            changes.update(layer)
+        changes.update(self._top)
+        return changes
+
+    def apply_changes(self, target: MutableMapping[KeyT, ValueT]) -> None:
+        for key, value in self.get_changes().items():
+            if isinstance(value, _Deleted):
+                target.pop(key, None)
+            else:
+                target[key] = value
+
+    def __getitem__(self, key: KeyT) -> ValueT:
+        value = self._lookup(key)
+        if isinstance(value, _Deleted):
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return not isinstance(self._lookup(key), _Deleted)
+
+    def __setitem__(self, key: KeyT, value: ValueT) -> None:
+        if key not in self:
+            self._length += 1
+        self._top[key] = value
+
+    def __delitem__(self, key: KeyT) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._length -= 1
+        self._top[key] = _DELETED
+
+    def __iter__(self) -> Iterator[KeyT]:
+        merged: Layer = {}
+        for layer in self._layers:
+            merged.update(layer)
+        merged.update(self._top)
+        return iter(
+            [key for key, value in merged.items() if not isinstance(value, _Deleted)]
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())})"
+
+    def _lookup(self, key: object) -> Union[ValueT, _Deleted]:
+        if key in self._top:
+            return self._top[key]  # type: ignore
+        for layer in reversed(self._layers):
+            if key in layer:
+                return layer[key]  # type: ignore
+        return _DELETED
+
+    def _freeze_top(self) -> None:
+        if not self._top:
+            return
+        self._layers = (*self._layers, self._top)
+        self._top = {}
+        if len(self._layers) > self.MAX_LAYERS_COUNT:
+            self._squash_layers()
+
+    def _squash_layers(self) -> None:
+        inherited: Layer = {}
+        for layer in self._layers[: self._own_layers_start]:
+            inherited.update(layer)
+        own: Layer = {}
+        for layer in self._layers[self._own_layers_start :]:
+            own.update(layer)
+        # Nothing is below the inherited layer, so deletions don't have to be remembered there
+        inherited = {
+            key: value
+            for key, value in inherited.items()
+            if not isinstance(value, _Deleted)
+        }
+        self._layers = tuple(layer for layer in (inherited, own) if layer)
+        self._own_layers_start = 1 if inherited else 0
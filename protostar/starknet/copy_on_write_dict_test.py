@@ -0,0 +1,82 @@
+import pytest
+
+from .copy_on_write_dict import CopyOnWriteDict
+
+
+def test_copy_is_independent():
+    original = CopyOnWriteDict({"a": 1, "b": 2})
+    copied = original.copy()
+
+    copied["a"] = 10
+    del copied["b"]
+    original["c"] = 3
+
+    assert dict(original) == {"a": 1, "b": 2, "c": 3}
+    assert dict(copied) == {"a": 10}
+    assert len(original) == 3
+    assert len(copied) == 1
+
+
+def test_applying_changes_to_original():
+    original = CopyOnWriteDict({"a": 1, "b": 2})
+    copied = original.copy()
+    copied["a"] = 10
+    copied["c"] = 3
+    del copied["b"]
+
+    copied.apply_changes(original)
+
+    assert dict(original) == {"a": 10, "c": 3}
+
+
+def test_applying_only_changes_made_after_copying():
+    original = CopyOnWriteDict({"a": 1})
+    original["b"] = 2
+    copied = original.copy()
+    copied["c"] = 3
+    target = {}
+
+    copied.apply_changes(target)
+
+    assert target == {"c": 3}
+
+
+def test_nested_copies():
+    original = CopyOnWriteDict({"a": 1})
+    copied = original.copy()
+    copied["b"] = 2
+    nested_copy = copied.copy()
+    nested_copy["c"] = 3
+    copied["d"] = 4
+
+    nested_copy.apply_changes(copied)
+
+    assert dict(copied) == {"a": 1, "b": 2, "c": 3, "d": 4}
+    assert dict(original) == {"a": 1}
+    assert copied.get_changes() == {"b": 2, "c": 3, "d": 4}
+
+
+def test_squashing_layers_keeps_content_and_changes():
+    original = CopyOnWriteDict({"a": 0})
+    copied = original.copy()
+    del copied["a"]
+    for index in range(CopyOnWriteDict.MAX_LAYERS_COUNT * 3):
+        copied[index] = index
+        copied.copy()
+
+    assert dict(copied) == {
+        index: index for index in range(CopyOnWriteDict.MAX_LAYERS_COUNT * 3)
+    }
+    assert "a" not in copied
+    assert dict(original) == {"a": 0}
+    target = {"a": 0}
+    copied.apply_changes(target)
+    assert target == dict(copied)
+
+
+def test_deleting_missing_key_raises_key_error():
+    copied = CopyOnWriteDict({"a": 1}).copy()
+    del copied["a"]
+
+    with pytest.raises(KeyError):
+        del copied["a"]
@@ -1,4 +1,6 @@
-from typing import Any, Callable, Dict, Union
+import json
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from starknet_py.utils.data_transformer.data_transformer import (
     CairoSerializer,
@@ -8,7 +10,7 @@ from starkware.starknet.public.abi import AbiType
 from starkware.starknet.public.abi_structs import identifier_manager_from_abi
 from typing_extensions import Literal
 
-from protostar.starknet.abi import find_abi_item
+from protostar.starknet.abi import AbiItemNotFoundException
 from protostar.protostar_exception import ProtostarException
 
 
@@ -22,24 +24,94 @@ FromPythonTransformer = Callable[[PythonData], CairoData]
 ToPythonTransformer = Callable[[CairoData], PythonData]
 
 
+class _AbiData:
+    """
+    Serializer and items of an ABI, which are expensive to build from scratch on every call.
+    """
+
+    def __init__(self, contract_abi: AbiType):
+        self._contract_abi = contract_abi
+        self._items: Dict[str, Dict] = {}
+        try:
+            for item in contract_abi:
+                self._items.setdefault(item["name"], item)
+        except TypeError as ex:
+            raise AbiItemNotFoundException(str(ex)) from ex
+        self._serializer: Optional[CairoSerializer] = None
+
+    def find_abi_item(self, name: str) -> Dict:
+        item = self._items.get(name)
+        if item is None:
+            raise AbiItemNotFoundException(f"Couldn't find '{name}' ABI")
+        return item
+
+    @property
+    def serializer(self) -> CairoSerializer:
+        if self._serializer is None:
+            self._serializer = CairoSerializer(
+                identifier_manager_from_abi(self._contract_abi)
+            )
+        return self._serializer
+
+
+class _AbiDataCache:
+    """
+    Finds ABI data by the identity of the ABI object first, and by the ABI content otherwise,
+    so contracts loaded many times share the data. ABIs are not modified after being loaded.
+    """
+
+    MAX_SIZE = 256
+
+    def __init__(self):
+        self._by_id: OrderedDict[int, Tuple[AbiType, _AbiData]] = OrderedDict()
+        self._by_fingerprint: OrderedDict[str, _AbiData] = OrderedDict()
+
+    def get(self, contract_abi: AbiType) -> _AbiData:
+        abi_id = id(contract_abi)
+        entry = self._by_id.get(abi_id)
+        # The ABI is kept in the entry, so its id cannot be reused by another object
+        if entry is not None and entry[0] is contract_abi:
+            self._by_id.move_to_end(abi_id)
+            return entry[1]
+
+        fingerprint = json.dumps(contract_abi, sort_keys=True)
+        abi_data = self._by_fingerprint.get(fingerprint)
+        if abi_data is None:
+            abi_data = _AbiData(contract_abi)
+            self._by_fingerprint[fingerprint] = abi_data
+            if len(self._by_fingerprint) > self.MAX_SIZE:
+                self._by_fingerprint.popitem(last=False)
+        else:
+            self._by_fingerprint.move_to_end(fingerprint)
+
+        self._by_id[abi_id] = (contract_abi, abi_data)
+        if len(self._by_id) > self.MAX_SIZE:
+            self._by_id.popitem(last=False)
+        return abi_data
+
+
+_abi_data_cache = _AbiDataCache()
+
+
 def from_python_transformer(
     contract_abi: AbiType, fn_name: str, mode: Literal["inputs", "outputs"]
 ) -> FromPythonTransformer:
-    fn_abi_item = find_abi_item(contract_abi, fn_name)
-    structure_transformer = CairoSerializer(identifier_manager_from_abi(contract_abi))
+    abi_data = _abi_data_cache.get(contract_abi)
+    fn_abi_item = abi_data.find_abi_item(fn_name)
+    structure_transformer = abi_data.serializer
+    felt_array_names = {
+        item["name"] for item in fn_abi_item.get(mode, []) if item["type"] == "felt*"
+    }
 
     def transform(data: PythonData) -> CairoData:
         try:
             for data_item_name, data_item_value in data.items():
-                for item in fn_abi_item[mode]:
-                    if (
-                        data_item_name == item["name"]
-                        and isinstance(data_item_value, dict)
-                        and item["type"] == "felt*"
-                    ):
-                        raise TypeError(
-                            f"invalid type 'dict' for felt* used for argument {data_item_name}"
-                        )
+                if data_item_name in felt_array_names and isinstance(
+                    data_item_value, dict
+                ):
+                    raise TypeError(
+                        f"invalid type 'dict' for felt* used for argument {data_item_name}"
+                    )
             return structure_transformer.from_python(fn_abi_item[mode], **data)[0]
         except (TypeError, ValueError) as ex:
             raise DataTransformerException(str(ex)) from ex
@@ -50,8 +122,9 @@ def from_python_transformer(
 def from_python_events_transformer(
     contract_abi: AbiType, event_name: str
 ) -> FromPythonTransformer:
-    event_abi_item = find_abi_item(contract_abi, event_name)
-    structure_transformer = CairoSerializer(identifier_manager_from_abi(contract_abi))
+    abi_data = _abi_data_cache.get(contract_abi)
+    event_abi_item = abi_data.find_abi_item(event_name)
+    structure_transformer = abi_data.serializer
 
     def transform(data: PythonData) -> CairoData:
         try:
@@ -65,8 +138,9 @@ def from_python_events_transformer(
 def to_python_transformer(
     contract_abi: AbiType, fn_name: str, mode: Literal["inputs", "outputs"]
 ) -> ToPythonTransformer:
-    fn_abi_item = find_abi_item(contract_abi, fn_name)
-    structure_transformer = CairoSerializer(identifier_manager_from_abi(contract_abi))
+    abi_data = _abi_data_cache.get(contract_abi)
+    fn_abi_item = abi_data.find_abi_item(fn_name)
+    structure_transformer = abi_data.serializer
 
     def transform(data: CairoData) -> PythonData:
         try:
@@ -80,8 +154,9 @@ def to_python_transformer(
 def to_python_events_transformer(
     contract_abi: AbiType, event_name: str
 ) -> ToPythonTransformer:
-    event_abi_item = find_abi_item(contract_abi, event_name)
-    structure_transformer = CairoSerializer(identifier_manager_from_abi(contract_abi))
+    abi_data = _abi_data_cache.get(contract_abi)
+    event_abi_item = abi_data.find_abi_item(event_name)
+    structure_transformer = abi_data.serializer
 
     def transform(data: CairoData) -> PythonData:
         try:
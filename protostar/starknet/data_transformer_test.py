@@ -0,0 +1,45 @@
+import copy
+
+import pytest
+
+from protostar.starknet.abi import AbiItemNotFoundException
+
+from .data_transformer import (
+    _AbiDataCache,
+    from_python_transformer,
+    to_python_transformer,
+)
+
+ABI = [
+    {
+        "inputs": [{"name": "a", "type": "felt"}, {"name": "b", "type": "felt*"}],
+        "name": "foo",
+        "outputs": [{"name": "res", "type": "felt"}],
+        "type": "function",
+    }
+]
+
+
+def test_sharing_abi_data_between_equal_abis():
+    cache = _AbiDataCache()
+
+    abi_data = cache.get(ABI)
+
+    assert cache.get(ABI) is abi_data
+    assert cache.get(copy.deepcopy(ABI)) is abi_data
+    assert cache.get(copy.deepcopy(ABI)).serializer is abi_data.serializer
+
+
+def test_transforming_data_with_cached_abi_data():
+    assert from_python_transformer(ABI, "foo", "inputs")({"a": 1, "b": [2, 3]}) == [
+        1,
+        2,
+        2,
+        3,
+    ]
+    assert to_python_transformer(ABI, "foo", "outputs")([42]) == {"res": 42}
+
+
+def test_missing_abi_item():
+    with pytest.raises(AbiItemNotFoundException):
+        from_python_transformer(ABI, "bar", "inputs")
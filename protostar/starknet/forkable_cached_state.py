@@ -0,0 +1,123 @@
+import copy
+from abc import ABC, abstractmethod
+from typing import Optional, TypeVar
+
+from starkware.starknet.business_logic.state.state import (
+    CachedState,
+    CompiledClassCache,
+    StateCache,
+)
+from starkware.starknet.business_logic.state.state_api import StateReader
+from starkware.starknet.business_logic.state.state_api_objects import BlockInfo
+
+from protostar.starknet.copy_on_write_dict import CopyOnWriteDict
+
+ForkableCachedStateT = TypeVar("ForkableCachedStateT", bound="ForkableCachedState")
+
+
+class _FrozenLayer(CachedState):
+    """
+    Writes of a forked state. The layer is shared by the state and its forks, and it is never modified.
+    """
+
+    def __init__(self, state: CachedState, cache: StateCache, depth: int):
+        compiled_classes = state.compiled_classes
+        if isinstance(compiled_classes, CopyOnWriteDict):
+            compiled_classes = compiled_classes.copy()
+        super().__init__(
+            block_info=state.block_info,
+            state_reader=state.state_reader,
+            compiled_class_cache=compiled_classes,
+        )
+        self.cache = cache
+        self.depth = depth
+
+
+class ForkableCachedState(CachedState, ABC):
+    """
+    Cached state, which can be forked in O(changes since the previous fork).
+    Writes of the forked state are moved to a frozen layer, which becomes the reader of the state and the fork.
+    The chain of frozen layers is flattened when it gets deep.
+    """
+
+    MAX_FROZEN_LAYERS_COUNT = 8
+
+    def __init__(
+        self,
+        block_info: BlockInfo,
+        state_reader: StateReader,
+        compiled_class_cache: Optional[CompiledClassCache] = None,
+    ):
+        if not isinstance(compiled_class_cache, CopyOnWriteDict):
+            compiled_class_cache = CopyOnWriteDict(compiled_class_cache)
+        super().__init__(
+            block_info=block_info,
+            state_reader=state_reader,
+            compiled_class_cache=compiled_class_cache,
+        )
+
+    def _copy(self: ForkableCachedStateT) -> ForkableCachedStateT:
+        # Compiled classes are shared, as the copy is applied to this state
+        return self._create_copy(
+            state_reader=self, compiled_class_cache=self.compiled_classes
+        )
+
+    def fork(self: ForkableCachedStateT) -> ForkableCachedStateT:
+        """
+        Returns an independent copy of this state.
+        """
+        if isinstance(self.state_reader, CachedState) and not isinstance(
+            self.state_reader, _FrozenLayer
+        ):
+            # The state is a copy, which is going to be applied to its parent
+            return copy.deepcopy(self)
+
+        self._freeze_writes()
+        compiled_classes = self.compiled_classes
+        assert isinstance(compiled_classes, CopyOnWriteDict)
+        return self._create_copy(
+            state_reader=self.state_reader,
+            compiled_class_cache=compiled_classes.copy(),
+        )
+
+    @abstractmethod
+    def _create_copy(
+        self: ForkableCachedStateT,
+        state_reader: StateReader,
+        compiled_class_cache: CompiledClassCache,
+    ) -> ForkableCachedStateT:
+        ...
+
+    def _freeze_writes(self) -> None:
+        # pylint: disable=protected-access
+        if not (
+            self.cache._class_hash_writes
+            or self.cache._compiled_class_hash_writes
+            or self.cache._nonce_writes
+            or self.cache._storage_writes
+        ):
+            return
+
+        depth = (
+            self.state_reader.depth + 1
+            if isinstance(self.state_reader, _FrozenLayer)
+            else 1
+        )
+        frozen_layer = _FrozenLayer(state=self, cache=self.cache, depth=depth)
+        if depth > self.MAX_FROZEN_LAYERS_COUNT:
+            frozen_layer = self._flatten(frozen_layer)
+        self.state_reader = frozen_layer
+        self.cache = StateCache()
+
+    @staticmethod
+    def _flatten(frozen_layer: _FrozenLayer) -> _FrozenLayer:
+        layers: list[_FrozenLayer] = []
+        reader: StateReader = frozen_layer
+        while isinstance(reader, _FrozenLayer):
+            layers.append(reader)
+            reader = reader.state_reader
+
+        cache = StateCache()
+        for layer in reversed(layers):
+            cache.update_writes_from_other(layer.cache)
+        return _FrozenLayer(state=layers[-1], cache=cache, depth=1)
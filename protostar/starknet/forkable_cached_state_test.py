@@ -0,0 +1,150 @@
+from starkware.starknet.business_logic.state.state import CompiledClassCache
+from starkware.starknet.business_logic.state.state_api import StateReader
+from starkware.starknet.business_logic.state.state_api_objects import BlockInfo
+from starkware.starknet.services.api.contract_class.contract_class import (
+    CompiledClassBase,
+)
+from typing_extensions import Self
+
+from .forkable_cached_state import ForkableCachedState, _FrozenLayer
+
+CONTRACT_ADDRESS = 123
+STORAGE_KEY = 1
+
+
+class EmptyStateReader(StateReader):
+    async def get_compiled_class(self, compiled_class_hash: int) -> CompiledClassBase:
+        raise KeyError(compiled_class_hash)
+
+    async def get_compiled_class_hash(self, class_hash: int) -> int:
+        return 0
+
+    async def get_class_hash_at(self, contract_address: int) -> bytes:
+        return bytes(32)
+
+    async def get_nonce_at(self, contract_address: int) -> int:
+        return 0
+
+    async def get_storage_at(self, contract_address: int, key: int) -> int:
+        return 0
+
+
+class ForkableState(ForkableCachedState):
+    def _create_copy(
+        self, state_reader: StateReader, compiled_class_cache: CompiledClassCache
+    ) -> Self:
+        return ForkableState(
+            block_info=self.block_info,
+            state_reader=state_reader,
+            compiled_class_cache=compiled_class_cache,
+        )
+
+
+def create_state() -> ForkableState:
+    return ForkableState(
+        block_info=BlockInfo.empty(sequencer_address=None),
+        state_reader=EmptyStateReader(),
+        compiled_class_cache={},
+    )
+
+
+def class_hash(value: int) -> bytes:
+    return value.to_bytes(32, "big")
+
+
+async def read_contract(state: ForkableCachedState) -> tuple[int, int, bytes]:
+    return (
+        await state.get_storage_at(CONTRACT_ADDRESS, STORAGE_KEY),
+        await state.get_nonce_at(CONTRACT_ADDRESS),
+        await state.get_class_hash_at(CONTRACT_ADDRESS),
+    )
+
+
+async def test_fork_writes_are_not_visible_to_parent():
+    parent = create_state()
+    await parent.set_storage_at(CONTRACT_ADDRESS, STORAGE_KEY, 1)
+
+    child = parent.fork()
+    await child.set_storage_at(CONTRACT_ADDRESS, STORAGE_KEY, 2)
+    await child.increment_nonce(CONTRACT_ADDRESS)
+    await child.deploy_contract(CONTRACT_ADDRESS, class_hash(3))
+
+    assert await read_contract(parent) == (1, 0, bytes(32))
+    assert await read_contract(child) == (2, 1, class_hash(3))
+
+
+async def test_parent_writes_after_fork_are_not_visible_to_fork():
+    parent = create_state()
+    await parent.set_storage_at(CONTRACT_ADDRESS, STORAGE_KEY, 1)
+
+    child = parent.fork()
+    await parent.set_storage_at(CONTRACT_ADDRESS, STORAGE_KEY, 2)
+    await parent.increment_nonce(CONTRACT_ADDRESS)
+    await parent.deploy_contract(CONTRACT_ADDRESS, class_hash(3))
+
+    assert await read_contract(parent) == (2, 1, class_hash(3))
+    assert await read_contract(child) == (1, 0, bytes(32))
+
+
+async def test_reading_state_after_flattening_frozen_layers():
+    state = create_state()
+    await state.deploy_contract(CONTRACT_ADDRESS, class_hash(1))
+    forks: list[ForkableState] = []
+
+    for value in range(ForkableCachedState.MAX_FROZEN_LAYERS_COUNT + 2):
+        await state.set_storage_at(CONTRACT_ADDRESS, STORAGE_KEY, value)
+        await state.set_storage_at(CONTRACT_ADDRESS, STORAGE_KEY + value + 1, value)
+        await state.increment_nonce(CONTRACT_ADDRESS)
+        forks.append(state.fork())
+
+    assert isinstance(state.state_reader, _FrozenLayer)
+    assert state.state_reader.depth < ForkableCachedState.MAX_FROZEN_LAYERS_COUNT
+
+    for value, fork in enumerate([*forks, state]):
+        expected_value = min(value, len(forks) - 1)
+        assert await read_contract(fork) == (
+            expected_value,
+            expected_value + 1,
+            class_hash(1),
+        )
+        for written_value in range(expected_value + 1):
+            assert (
+                await fork.get_storage_at(
+                    CONTRACT_ADDRESS, STORAGE_KEY + written_value + 1
+                )
+                == written_value
+            )
+
+
+async def test_compiled_classes_declared_after_fork_stay_in_declaring_state():
+    parent = create_state()
+    await parent.set_storage_at(CONTRACT_ADDRESS, STORAGE_KEY, 1)
+    parent.compiled_classes[1] = "parent class before fork"
+
+    child = parent.fork()
+    parent.compiled_classes[2] = "parent class after fork"
+    child.compiled_classes[3] = "child class"
+
+    assert dict(parent.compiled_classes) == {
+        1: "parent class before fork",
+        2: "parent class after fork",
+    }
+    assert dict(child.compiled_classes) == {
+        1: "parent class before fork",
+        3: "child class",
+    }
+
+
+async def test_forking_copy_applied_to_parent():
+    parent = create_state()
+    await parent.set_storage_at(CONTRACT_ADDRESS, STORAGE_KEY, 1)
+
+    with parent.copy_and_apply() as state_copy:
+        await state_copy.set_storage_at(CONTRACT_ADDRESS, STORAGE_KEY, 2)
+        fork = state_copy.fork()
+        await fork.set_storage_at(CONTRACT_ADDRESS, STORAGE_KEY, 3)
+        await fork.increment_nonce(CONTRACT_ADDRESS)
+        assert await read_contract(state_copy) == (2, 0, bytes(32))
+
+    assert await read_contract(parent) == (2, 0, bytes(32))
+    assert await read_contract(fork) == (3, 1, bytes(32))
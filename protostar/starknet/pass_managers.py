@@ -18,7 +18,6 @@ from starkware.cairo.lang.compiler.preprocessor.pass_manager import (
 from starkware.starknet.compiler.starknet_pass_manager import starknet_pass_manager
 from starkware.cairo.lang.compiler.preprocessor.default_pass_manager import (
     PreprocessorStage,
-    ModuleCollector,
 )
 from starkware.starknet.security.hints_whitelist import get_hints_whitelist
 from starkware.starknet.compiler.external_wrapper import (
@@ -30,16 +29,23 @@ from starkware.starknet.public.abi import AbiType
 from starkware.cairo.lang.compiler.ast.visitor import Visitor
 
 from protostar.cairo import PassManagerFactory, PassManagerConfig
+from protostar.cairo.parsed_module_cache import (
+    CachedModuleCollector,
+    use_parsed_module_cache,
+)
 
 
 class StarknetPassManagerFactory(PassManagerFactory):
     @staticmethod
     def build(config: PassManagerConfig) -> PassManager:
         read_module = get_module_reader(cairo_path=config.include_paths).read
-        return starknet_pass_manager(
-            DEFAULT_PRIME,
-            read_module,
-            disable_hint_validation=config.disable_hint_validation,
+        return use_parsed_module_cache(
+            starknet_pass_manager(
+                DEFAULT_PRIME,
+                read_module,
+                disable_hint_validation=config.disable_hint_validation,
+            ),
+            cache_io=config.cache_io,
         )
 
 
@@ -55,9 +61,10 @@ class TestCollectorPassManagerFactory(StarknetPassManagerFactory):
         manager = PassManager()
         manager.add_stage(
             "module_collector",
-            ModuleCollector(
+            CachedModuleCollector(
                 read_module=read_module,
                 additional_modules=[],
+                cache_io=config.cache_io,
             ),
         )
         manager.add_stage(
@@ -75,10 +82,13 @@ class ProtostarPassMangerFactory(StarknetPassManagerFactory):
     @staticmethod
     def build(config: PassManagerConfig) -> PassManager:
         read_module = get_module_reader(cairo_path=config.include_paths).read
-        manager = starknet_pass_manager(
-            DEFAULT_PRIME,
-            read_module,
-            disable_hint_validation=config.disable_hint_validation,
+        manager = use_parsed_module_cache(
+            starknet_pass_manager(
+                DEFAULT_PRIME,
+                read_module,
+                disable_hint_validation=config.disable_hint_validation,
+            ),
+            cache_io=config.cache_io,
         )
         hint_whitelist = (
             None if config.disable_hint_validation else get_hints_whitelist()
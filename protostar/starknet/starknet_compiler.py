@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List, Type, Union
+from typing import List, Set, Type, Union
 
 from starkware.cairo.lang.compiler.constants import MAIN_SCOPE
 from starkware.cairo.lang.compiler.identifier_manager import IdentifierManager
@@ -17,6 +17,7 @@ from starkware.starknet.services.api.contract_class.contract_class import (
 
 from protostar.protostar_exception import ProtostarException
 from protostar.cairo import PassManagerConfig, PassManagerFactory
+from protostar.cairo.parsed_module_cache import CachedModuleCollector
 
 from .pass_managers import TestCollectorPreprocessedProgram
 
@@ -100,6 +101,16 @@ class StarknetCompiler:
         assembled = self.compile_preprocessed_contract(preprocessed, add_debug_info)
         return assembled
 
+    def get_source_files(self) -> Set[Path]:
+        """
+        Returns files of all modules used by the last compilation.
+        """
+        _, module_collector = self.pass_manager.stages[
+            self.pass_manager.get_stage_index("module_collector")
+        ]
+        assert isinstance(module_collector, CachedModuleCollector)
+        return {Path(filename) for filename in module_collector.source_files}
+
     def get_function_names(
         self,
         file_path: Path,
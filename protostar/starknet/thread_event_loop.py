@@ -0,0 +1,35 @@
+import asyncio
+import os
+import threading
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+_thread_local = threading.local()
+
+
+def _forget_thread_event_loops():
+    # Loops of a forked process reference executor threads, which exist only in the parent process
+    global _thread_local  # pylint: disable=global-statement
+    _thread_local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_thread_event_loops)
+
+
+def get_thread_event_loop() -> asyncio.AbstractEventLoop:
+    loop = getattr(_thread_local, "event_loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_local.event_loop = loop
+    return loop
+
+
+def run_in_thread_event_loop(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Runs `coroutine` from synchronous code, e.g. a cheatcode called from a hint, in an event loop
+    kept for the current thread. Unlike `asyncio.run`, it doesn't create and close a new event loop on every call.
+    The thread must not be running an event loop already.
+    """
+    return get_thread_event_loop().run_until_complete(coroutine)
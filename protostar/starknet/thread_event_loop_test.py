@@ -0,0 +1,73 @@
+import asyncio
+import multiprocessing
+import threading
+from typing import Optional
+
+import pytest
+
+from .thread_event_loop import get_thread_event_loop, run_in_thread_event_loop
+
+
+async def get_running_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+async def fail():
+    raise ValueError("failure")
+
+
+def test_reusing_loop_in_thread():
+    first_loop = run_in_thread_event_loop(get_running_loop())
+    second_loop = run_in_thread_event_loop(get_running_loop())
+
+    assert first_loop is second_loop
+    assert first_loop is get_thread_event_loop()
+
+
+def test_using_separate_loop_per_thread():
+    loops = []
+    thread = threading.Thread(
+        target=lambda: loops.append(run_in_thread_event_loop(get_running_loop()))
+    )
+    thread.start()
+    thread.join()
+
+    assert loops[0] is not run_in_thread_event_loop(get_running_loop())
+
+
+def test_reraising_exception():
+    with pytest.raises(ValueError, match="failure"):
+        run_in_thread_event_loop(fail())
+
+    assert not get_thread_event_loop().is_closed()
+
+
+async def run_in_executor() -> int:
+    return await asyncio.get_running_loop().run_in_executor(None, lambda: 42)
+
+
+def run_in_executor_in_forked_process() -> Optional[int]:
+    def target():
+        assert run_in_thread_event_loop(run_in_executor()) == 42
+
+    process = multiprocessing.get_context("fork").Process(target=target)
+    process.start()
+    process.join(timeout=30)
+    if process.is_alive():
+        process.terminate()
+    return process.exitcode
+
+
+def test_using_new_loop_in_forked_process():
+    exit_codes = []
+
+    def thread_target():
+        # The executor of the loop has an idle thread, which the forked process doesn't inherit
+        run_in_thread_event_loop(run_in_executor())
+        exit_codes.append(run_in_executor_in_forked_process())
+
+    thread = threading.Thread(target=thread_target)
+    thread.start()
+    thread.join()
+
+    assert exit_codes == [0]
@@ -22,7 +22,9 @@ from .test_results import (
 )
 from .test_runner import TestRunner
 from .testing_summary import TestingSummary
-from .test_scheduler import TestScheduler
+from .test_scheduler import SchedulingReport, TestScheduler
+from .test_durations import TestDurations
 from .test_shared_tests_state import SharedTestsState
+from .test_worker_pool import TestWorkerPool
 from .testing_seed import determine_testing_seed
 from .hook import Hook
@@ -32,15 +32,16 @@ class MockCallCheatcode(Cheatcode):
                 Address.from_user_input(contract_address), fn_name, ret_data
             )
 
-        if contract_address not in self.cheatable_state.mocked_calls_map:
-            self.cheatable_state.mocked_calls_map[address] = {}
-
-        if selector in self.cheatable_state.mocked_calls_map[address]:
+        mocked_calls = self.cheatable_state.mocked_calls_map.get(address, {})
+        if selector in mocked_calls:
             raise CheatcodeException(
                 self,
                 f"'{fn_name}' in the contract with address {contract_address} has been already mocked",
             )
-        self.cheatable_state.mocked_calls_map[address][selector] = ret_data
+        self.cheatable_state.mocked_calls_map[address] = {
+            **mocked_calls,
+            selector: ret_data,
+        }
 
         def clear_mock():
             if contract_address not in self.cheatable_state.mocked_calls_map:
@@ -53,7 +54,13 @@ class MockCallCheatcode(Cheatcode):
                     self,
                     f"Couldn't find mocked selector {selector} for an address {contract_address}.",
                 )
-            del self.cheatable_state.mocked_calls_map[contract_address][selector]
+            self.cheatable_state.mocked_calls_map[contract_address] = {
+                mocked_selector: mocked_ret_data
+                for mocked_selector, mocked_ret_data in self.cheatable_state.mocked_calls_map[
+                    contract_address
+                ].items()
+                if mocked_selector != selector
+            }
 
         return clear_mock
 
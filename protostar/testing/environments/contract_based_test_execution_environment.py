@@ -96,7 +96,7 @@ class ContractBasedTestExecutionEnvironment(
                 if self.state.config.gas_estimation_enabled:
                     estimated_fee = estimate_gas(
                         state=self.state.starknet.state.state,
-                        call_info=execution_result.call_info,
+                        call_infos=[execution_result.call_info],
                         resources_manager=execution_result.resources_manager,
                         starknet_general_config=self.state.starknet.state.general_config,
                     )
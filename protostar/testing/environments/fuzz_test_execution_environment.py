@@ -1,7 +1,7 @@
 import asyncio
 import dataclasses
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from hypothesis import example, given, seed, settings
 from hypothesis.database import ExampleDatabase, InMemoryExampleDatabase
@@ -25,11 +25,20 @@ from protostar.testing.fuzzing.fuzz_input_exception_metadata import (
     FuzzInputExceptionMetadata,
 )
 from protostar.testing.fuzzing.hypothesis.aio import wrap_in_sync
+from protostar.testing.fuzzing.hypothesis.example_database import (
+    FuzzShardExampleDatabase,
+)
 from protostar.testing.fuzzing.hypothesis.reporter import (
     HYPOTHESIS_VERBOSITY,
     protostar_reporter,
 )
 from protostar.testing.fuzzing.hypothesis.runs_counter import RunsCounter
+from protostar.testing.fuzzing.parallel_fuzzing import (
+    FuzzShard,
+    FuzzShardResult,
+    create_fuzz_shards,
+    run_fuzz_shards,
+)
 from protostar.testing.fuzzing.strategy_collector import collect_search_strategies
 from protostar.testing.starkware.execution_resources_summary import (
     ExecutionResourcesSummary,
@@ -37,6 +46,7 @@ from protostar.testing.starkware.execution_resources_summary import (
 from protostar.testing.starkware.contract_based_test_execution_state import (
     ContractBasedTestExecutionState,
 )
+from protostar.testing.testing_seed import Seed
 
 
 @dataclass
@@ -45,12 +55,17 @@ class FuzzTestExecutionResult(TestExecutionResult):
 
 
 class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
-    def __init__(self, state: ContractBasedTestExecutionState):
+    def __init__(
+        self,
+        state: ContractBasedTestExecutionState,
+        example_database: Optional[ExampleDatabase] = None,
+    ):
         super().__init__(state)
         if self.state.config.profiling:
             raise ProtostarException("Fuzz tests cannot be profiled")
         self.initial_state = state
         self.given_strategies: dict[str, SearchStrategy] = {}
+        self._example_database = example_database
 
     async def execute(
         self, function_identifier: OffsetOrName
@@ -66,7 +81,7 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
 
         execution_resources: List[ExecutionResourcesSummary] = []
 
-        database = InMemoryExampleDatabase()
+        database = self._example_database or InMemoryExampleDatabase()
         runs_counter = RunsCounter(budget=self.state.config.fuzz_max_examples)
 
         if (
@@ -91,12 +106,19 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
 
         def test_thread():
             with with_reporter(protostar_reporter):
-                self.build_and_run_test(
-                    function_name=function_identifier,
-                    database=database,
-                    execution_resources=execution_resources,
-                    runs_counter=runs_counter,
-                )
+                if self.given_strategies and self.state.config.fuzz_workers_count > 1:
+                    self.run_test_in_shards(
+                        function_name=function_identifier,
+                        execution_resources=execution_resources,
+                        runs_counter=runs_counter,
+                    )
+                else:
+                    self.build_and_run_test(
+                        function_name=function_identifier,
+                        database=database,
+                        execution_resources=execution_resources,
+                        runs_counter=runs_counter,
+                    )
 
         try:
             with self.state.output_recorder.redirect("test"):
@@ -150,13 +172,86 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
         func = given(**self.given_strategies)(func)
         return func
 
+    def run_test_in_shards(
+        self,
+        function_name: str,
+        execution_resources: List[ExecutionResourcesSummary],
+        runs_counter: RunsCounter,
+    ):
+        """
+        Splits the example budget between processes, each one fuzzing with a seed derived from
+        the testing seed. Results are merged in the order of shards, as if a single process
+        executed them.
+        """
+        shards = create_fuzz_shards(
+            seed=self.state.config.seed,
+            budget=runs_counter.budget,
+            shards_count=self.state.config.fuzz_workers_count,
+        )
+        shard_results = run_fuzz_shards(
+            shards,
+            run_shard=lambda shard: self.run_test_shard(function_name, shard),
+        )
+
+        output_recorder = self.initial_state.output_recorder
+        for shard_result in shard_results:
+            print(shard_result.stdout, end="")
+            for (name, run_no), capture in shard_result.captures.items():
+                output_recorder.record((name, runs_counter.count + run_no)).write(
+                    capture
+                )
+            runs_counter.count += shard_result.runs_count
+            execution_resources.extend(shard_result.execution_resources)
+
+            if shard_result.error is not None:
+                raise shard_result.error
+            if shard_result.failure is not None:
+                raise HypothesisFailureSmugglingError(
+                    error=shard_result.failure,
+                    inputs=shard_result.failure_inputs or {},
+                )
+
+    def run_test_shard(self, function_name: str, shard: FuzzShard) -> FuzzShardResult:
+        runs_counter = RunsCounter(budget=shard.budget)
+        result = FuzzShardResult()
+        try:
+            with with_reporter(protostar_reporter):
+                self.build_and_run_test(
+                    function_name=function_name,
+                    database=FuzzShardExampleDatabase(
+                        self._example_database, shard_index=shard.index
+                    )
+                    if self._example_database
+                    else InMemoryExampleDatabase(),
+                    execution_resources=result.execution_resources,
+                    runs_counter=runs_counter,
+                    testing_seed=shard.seed,
+                    # Examples are executed once, by the first shard
+                    examples_enabled=shard.index == 0,
+                )
+        except HypothesisFailureSmugglingError as escape_err:
+            result.failure = escape_err.error
+            result.failure_inputs = escape_err.inputs
+        result.runs_count = runs_counter.count
+        result.captures = {
+            name: capture
+            for name, capture in self.initial_state.output_recorder.get_captures().items()
+            if isinstance(name, tuple)
+        }
+        return result
+
     def build_and_run_test(
         self,
         function_name: str,
         database: ExampleDatabase,
         execution_resources: List[ExecutionResourcesSummary],
         runs_counter: RunsCounter,
+        testing_seed: Optional[Seed] = None,
+        examples_enabled: bool = True,
     ):
+        decorate_with_examples = (
+            self.decorate_with_examples if examples_enabled else _identity
+        )
         try:
             settings_instance = settings(
                 database=database,
@@ -167,8 +262,8 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
                 verbosity=HYPOTHESIS_VERBOSITY,
             )
 
-            @self.decorate_with_examples
-            @seed(self.state.config.seed)
+            @decorate_with_examples
+            @seed(self.state.config.seed if testing_seed is None else testing_seed)
             @settings_instance
             @self.decorate_with_given
             async def test(**inputs: Any):
@@ -212,6 +307,10 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
             raise FuzzingError(str(ex)) from ex
 
 
+def _identity(target_func: Callable) -> Callable:
+    return target_func
+
+
 @dataclass
 class HypothesisFailureSmugglingError(Exception):
     """
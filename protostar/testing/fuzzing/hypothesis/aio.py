@@ -3,13 +3,15 @@ import functools
 import inspect
 from typing import Callable, Awaitable, Any
 
+from protostar.starknet.thread_event_loop import get_thread_event_loop
+
 
 def wrap_in_sync(func: Callable[..., Awaitable[Any]]):
     """
     Return a sync wrapper around an async function executing it in separate event loop.
 
     Separate event loop is used, because Hypothesis engine is running in current executor
-    and is effectively blocking it.
+    and is effectively blocking it. The loop is kept for the thread, so it is reused by all examples.
 
     Partially borrowed from pytest-asyncio.
     """
@@ -19,7 +21,7 @@ def wrap_in_sync(func: Callable[..., Awaitable[Any]]):
         coro = func(*args, **kwargs)
         assert inspect.isawaitable(coro)
 
-        loop = asyncio.new_event_loop()
+        loop = get_thread_event_loop()
         task = asyncio.ensure_future(coro, loop=loop)
         try:
             loop.run_until_complete(task)
@@ -0,0 +1,61 @@
+from typing import Iterable
+
+from hypothesis.database import DirectoryBasedExampleDatabase, ExampleDatabase
+
+from protostar.self.cache_io import CacheIO
+from protostar.self.content_hash import hash_content
+from protostar.testing.test_suite import TestCase
+
+
+class FuzzExampleDatabases:
+    """
+    Hypothesis example databases in the cache directory, one per test case.
+    Hypothesis saves failing and interesting inputs there, and replays them before generating
+    new ones, so a regression is found by the first examples of the next run.
+    Each example is stored in its own file, which is written atomically, so many workers can use
+    the same database. Shards of a fuzz test use it through `FuzzShardExampleDatabase`.
+    """
+
+    _NAMESPACE = "fuzz_examples"
+
+    def __init__(self, cache_io: CacheIO):
+        self._cache_io = cache_io
+
+    def get(self, test_case: TestCase) -> ExampleDatabase:
+        # Every test case is executed by the same Hypothesis test function,
+        # so its key doesn't tell test cases apart
+        test_case_key = hash_content(
+            str(test_case.test_path.resolve()), test_case.test_fn_name
+        )
+        return DirectoryBasedExampleDatabase(
+            str(self._cache_io.get_directory(f"{self._NAMESPACE}/{test_case_key}"))
+        )
+
+
+class FuzzShardExampleDatabase(ExampleDatabase):
+    """
+    Keeps examples of a fuzz shard apart from examples of other shards of the same test case.
+    Shards run at the same time, so a shard could otherwise replay a failure another shard has
+    just saved, and the result would depend on timing. The first shard uses the keys of
+    the wrapped database, so it replays examples saved by runs without shards.
+    """
+
+    def __init__(self, database: ExampleDatabase, shard_index: int):
+        super().__init__()
+        self._database = database
+        self._key_suffix = b"" if shard_index == 0 else f".shard{shard_index}".encode()
+
+    def save(self, key: bytes, value: bytes) -> None:
+        self._database.save(self._shard_key(key), value)
+
+    def fetch(self, key: bytes) -> Iterable[bytes]:
+        return self._database.fetch(self._shard_key(key))
+
+    def delete(self, key: bytes, value: bytes) -> None:
+        self._database.delete(self._shard_key(key), value)
+
+    def move(self, src: bytes, dest: bytes, value: bytes) -> None:
+        self._database.move(self._shard_key(src), self._shard_key(dest), value)
+
+    def _shard_key(self, key: bytes) -> bytes:
+        return key + self._key_suffix
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+from hypothesis.database import InMemoryExampleDatabase
+
+from protostar.self.cache_io import CacheIO
+from protostar.testing.test_suite import TestCase
+
+from .example_database import FuzzExampleDatabases, FuzzShardExampleDatabase
+
+
+def test_persisting_examples_between_runs(tmp_path: Path):
+    test_case = TestCase(test_path=tmp_path / "test_main.cairo", test_fn_name="test_a")
+    FuzzExampleDatabases(CacheIO(tmp_path)).get(test_case).save(b"key", b"example")
+
+    database = FuzzExampleDatabases(CacheIO(tmp_path)).get(test_case)
+
+    assert list(database.fetch(b"key")) == [b"example"]
+
+
+def test_separating_examples_of_test_cases(tmp_path: Path):
+    databases = FuzzExampleDatabases(CacheIO(tmp_path))
+    test_path = tmp_path / "test_main.cairo"
+    databases.get(TestCase(test_path=test_path, test_fn_name="test_a")).save(
+        b"key", b"example"
+    )
+
+    database = databases.get(TestCase(test_path=test_path, test_fn_name="test_b"))
+
+    assert not list(database.fetch(b"key"))
+
+
+def test_separating_examples_of_fuzz_shards():
+    database = InMemoryExampleDatabase()
+    first_shard_database = FuzzShardExampleDatabase(database, shard_index=0)
+    second_shard_database = FuzzShardExampleDatabase(database, shard_index=1)
+
+    first_shard_database.save(b"key", b"first")
+    second_shard_database.save(b"key", b"second")
+    second_shard_database.move(b"key", b"other_key", b"second")
+
+    assert list(database.fetch(b"key")) == [b"first"]
+    assert list(first_shard_database.fetch(b"key")) == [b"first"]
+    assert not list(second_shard_database.fetch(b"key"))
+    assert list(second_shard_database.fetch(b"other_key")) == [b"second"]
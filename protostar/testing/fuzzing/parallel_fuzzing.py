@@ -0,0 +1,214 @@
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from io import StringIO
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from protostar.protostar_exception import ProtostarException
+from protostar.starknet import ReportedException
+from protostar.testing.starkware.execution_resources_summary import (
+    ExecutionResourcesSummary,
+)
+from protostar.testing.testing_seed import Seed
+
+# How often shards, which exited without sending a result, are looked for
+LIVENESS_CHECK_INTERVAL = 1.0
+
+
+@dataclass(frozen=True)
+class FuzzShard:
+    """
+    Part of the example budget of a fuzz test, executed in a separate process.
+    """
+
+    index: int
+    seed: Seed
+    budget: int
+
+
+@dataclass
+class FuzzShardResult:
+    runs_count: int = 0
+    execution_resources: List[ExecutionResourcesSummary] = field(default_factory=list)
+    captures: Dict[Tuple[str, int], str] = field(default_factory=dict)
+    stdout: str = ""
+    failure: Optional[ReportedException] = None
+    failure_inputs: Optional[Dict[str, Any]] = None
+    error: Optional[BaseException] = None
+
+
+def derive_shard_seed(seed: Seed, shard_index: int) -> Seed:
+    if shard_index == 0:
+        return seed
+    digest = hashlib.sha256(f"{seed}:{shard_index}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:4], byteorder="little", signed=False)
+
+
+def create_fuzz_shards(seed: Seed, budget: int, shards_count: int) -> List[FuzzShard]:
+    """
+    Splits the example budget into at most `shards_count` shards.
+    The shards depend only on the arguments, so results are reproducible for a fixed seed.
+    """
+    shards_count = max(1, min(shards_count, budget))
+    return [
+        FuzzShard(
+            index=shard_index,
+            seed=derive_shard_seed(seed, shard_index),
+            budget=budget // shards_count
+            + (1 if shard_index < budget % shards_count else 0),
+        )
+        for shard_index in range(shards_count)
+    ]
+
+
+def run_fuzz_shards(
+    shards: List[FuzzShard],
+    run_shard: Callable[[FuzzShard], FuzzShardResult],
+) -> List[FuzzShardResult]:
+    """
+    Executes each shard in a forked process.
+    A failing shard shrinks its input on its own. Shards after the first failing one are stopped,
+    and their results are dropped, so the reported failure doesn't depend on which process
+    finished first. A shard process, which exits without sending a result, fails its shard.
+    The calling process can be multithreaded, so shard processes reset the state they inherit
+    from other threads, e.g. event loops, before running `run_shard`.
+    """
+    context = multiprocessing.get_context("fork")
+    processes: Dict[int, Any] = {}
+    connections: Dict[Connection, int] = {}
+    for shard in shards:
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_run_shard_in_process,
+            args=(run_shard, shard, sender),
+            daemon=True,
+        )
+        process.start()
+        sender.close()
+        processes[shard.index] = process
+        connections[receiver] = shard.index
+
+    results: Dict[int, FuzzShardResult] = {}
+    first_failed_index: Optional[int] = None
+    try:
+        while connections:
+            ready_connections = wait(list(connections), timeout=LIVENESS_CHECK_INTERVAL)
+            if not ready_connections:
+                ready_connections = _find_connections_of_exited_shards(
+                    processes, connections
+                )
+            for connection in ready_connections:
+                shard_index = connections.pop(connection)  # type: ignore
+                results[shard_index] = _receive_result(connection, shard_index)
+                if _is_failed(results[shard_index]) and (
+                    first_failed_index is None or shard_index < first_failed_index
+                ):
+                    first_failed_index = shard_index
+                    _stop_shards_after(shard_index, processes, connections)
+    finally:
+        for process in processes.values():
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+    return [
+        results[shard.index]
+        for shard in shards
+        if first_failed_index is None or shard.index <= first_failed_index
+    ]
+
+
+def _run_shard_in_process(
+    run_shard: Callable[[FuzzShard], FuzzShardResult],
+    shard: FuzzShard,
+    connection: Connection,
+):
+    _exit_with_parent_process()
+    _reset_state_inherited_from_threads()
+    stdout = StringIO()
+    sys.stdout = stdout
+    try:
+        result = run_shard(shard)
+    except BaseException as ex:  # pylint: disable=broad-except
+        result = FuzzShardResult(error=ex)
+    result.stdout = stdout.getvalue()
+    try:
+        connection.send(result)
+    except Exception as ex:  # pylint: disable=broad-except
+        # E.g. a value in the exception cannot be pickled
+        connection.send(
+            FuzzShardResult(
+                runs_count=result.runs_count,
+                stdout=result.stdout,
+                error=ProtostarException(
+                    f"Fuzz test results couldn't be sent from a fuzzing process: {ex}"
+                ),
+            )
+        )
+    finally:
+        connection.close()
+
+
+def _exit_with_parent_process():
+    # The test worker can be terminated at any moment, e.g. on the `--exit-first`
+    parent_pid = os.getppid()
+
+    def watch_parent_process():
+        while os.getppid() == parent_pid:
+            time.sleep(1)
+        os._exit(1)  # pylint: disable=protected-access
+
+    threading.Thread(target=watch_parent_process, daemon=True).start()
+
+
+def _reset_state_inherited_from_threads():
+    # Event loops of the forking thread reference executors, whose threads don't exist in this process
+    asyncio.set_event_loop_policy(None)
+
+
+def _find_connections_of_exited_shards(
+    processes: Dict[int, Any], connections: Dict[Connection, int]
+) -> List[Connection]:
+    # The pipe of an exited shard stays open, if a process started by the shard inherited it
+    return [
+        connection
+        for connection, shard_index in connections.items()
+        if not processes[shard_index].is_alive() and not connection.poll()
+    ]
+
+
+def _receive_result(connection: Connection, shard_index: int) -> FuzzShardResult:
+    try:
+        if not connection.poll():
+            raise EOFError()
+        return connection.recv()
+    except EOFError:
+        return FuzzShardResult(
+            error=ProtostarException(
+                f"Fuzzing process {shard_index} exited unexpectedly."
+            )
+        )
+    finally:
+        connection.close()
+
+
+def _is_failed(result: FuzzShardResult) -> bool:
+    return result.failure is not None or result.error is not None
+
+
+def _stop_shards_after(
+    shard_index: int,
+    processes: Dict[int, Any],
+    connections: Dict[Connection, int],
+):
+    for connection, index in list(connections.items()):
+        if index > shard_index:
+            del connections[connection]
+            connection.close()
+            processes[index].terminate()
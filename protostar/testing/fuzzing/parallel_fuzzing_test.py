@@ -0,0 +1,70 @@
+import os
+
+from protostar.starknet import SimpleReportedException
+
+from .parallel_fuzzing import (
+    FuzzShard,
+    FuzzShardResult,
+    create_fuzz_shards,
+    run_fuzz_shards,
+)
+
+
+def test_splitting_budget_between_shards():
+    shards = create_fuzz_shards(seed=42, budget=10, shards_count=3)
+
+    assert [shard.budget for shard in shards] == [4, 3, 3]
+    assert shards[0].seed == 42
+    assert len({shard.seed for shard in shards}) == 3
+    assert shards == create_fuzz_shards(seed=42, budget=10, shards_count=3)
+
+
+def test_not_creating_shards_without_examples():
+    shards = create_fuzz_shards(seed=42, budget=2, shards_count=8)
+
+    assert [shard.budget for shard in shards] == [1, 1]
+
+
+def run_shard(shard: FuzzShard) -> FuzzShardResult:
+    print(f"shard {shard.index}")
+    result = FuzzShardResult(
+        runs_count=shard.budget, captures={("test", 1): f"{shard.index}"}
+    )
+    if shard.index >= 1:
+        result.failure = SimpleReportedException(f"failure {shard.index}")
+        result.failure_inputs = {"a": shard.index}
+    return result
+
+
+def test_reporting_first_failure_in_order_of_shards():
+    shards = create_fuzz_shards(seed=42, budget=10, shards_count=3)
+
+    results = run_fuzz_shards(shards, run_shard)
+
+    assert [result.stdout for result in results] == ["shard 0\n", "shard 1\n"]
+    assert results[0].failure is None
+    assert results[1].failure == SimpleReportedException("failure 1")
+    assert results[1].failure_inputs == {"a": 1}
+
+
+def test_failing_shard_which_exited_without_result():
+    release_reader, release_writer = os.pipe()
+
+    def run_shard_leaving_pipe_open(shard: FuzzShard) -> FuzzShardResult:
+        if shard.index == 0 and os.fork() == 0:
+            # The grandchild keeps the result pipe open, until the test releases it
+            os.close(release_writer)
+            os.read(release_reader, 1)
+            os._exit(0)  # pylint: disable=protected-access
+        os._exit(1)  # pylint: disable=protected-access
+
+    try:
+        results = run_fuzz_shards(
+            create_fuzz_shards(seed=42, budget=10, shards_count=2),
+            run_shard_leaving_pipe_open,
+        )
+    finally:
+        os.close(release_writer)
+        os.close(release_reader)
+
+    assert "exited unexpectedly" in str(results[0].error)
@@ -1,4 +1,5 @@
 import dataclasses
+import pickle
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -70,5 +71,48 @@ class ContractBasedTestExecutionState(TestExecutionState):
             contract_path_resolver=base.contract_path_resolver,
         )
 
+    def to_snapshot(self) -> bytes:
+        """
+        Serializes the state without compilers, which are provided again by `from_snapshot`.
+        Raises `pickle.PicklingError`, `TypeError` or `AttributeError` if some value,
+        e.g. one stored in the test context, cannot be serialized.
+        """
+        return pickle.dumps(
+            {
+                "starknet": self.starknet,
+                "contract": self.contract,
+                "stopwatch": self.stopwatch,
+                "output_recorder": self.output_recorder,
+                "context": self.context,
+                "config": self.config,
+            },
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        snapshot: bytes,
+        test_config: TestConfig,
+        cairo0_project_compiler: Cairo0ProjectCompiler,
+        contract_path_resolver: ContractPathResolver,
+    ) -> Self:
+        fields = pickle.loads(snapshot)
+        return cls(
+            contract=fields["contract"],
+            starknet=fields["starknet"],
+            stopwatch=fields["stopwatch"],
+            output_recorder=fields["output_recorder"],
+            context=fields["context"],
+            # `__setup__` can only change the configuration of fuzzing
+            config=dataclasses.replace(
+                fields["config"],
+                seed=test_config.seed,
+                fuzz_workers_count=test_config.fuzz_workers_count,
+            ),
+            cairo0_project_compiler=cairo0_project_compiler,
+            contract_path_resolver=contract_path_resolver,
+        )
+
     def determine_test_mode(self, test_case: TestCase):
         self.config.determine_mode(test_case=test_case, contract=self.contract)
@@ -0,0 +1,87 @@
+import pickle
+from pathlib import Path
+from typing import Iterable, Optional
+
+from protostar.self.cache_io import CacheIO
+from protostar.self.cairo_lang_version import get_cairo_lang_version
+from protostar.self.content_hash import ContentHash, ContentHasher, hash_content
+from protostar.self.protostar_package_version import get_protostar_package_version
+
+from .test_config import TestConfig
+from .test_suite import TestSuite
+
+
+class SuiteSetupCache:
+    """
+    Persistent cache of test suite snapshots taken right after `__setup__`, so contracts deployed there
+    are deployed once, and every worker loads the snapshot instead.
+    An entry is valid as long as Cairo sources on the cairo path, the configuration file,
+    the test configuration and the Protostar version stay the same.
+    Other inputs of `__setup__`, e.g. compiled artifacts or environment variables read in hints,
+    are not tracked, and snapshots are unpickled, so the cache has to be enabled explicitly.
+    """
+
+    _NAMESPACE = "suite_setup"
+    _KEY_LENGTH = 64
+    _FORMAT_VERSION = "1"
+
+    def __init__(
+        self,
+        cache_io: CacheIO,
+        source_directories: Iterable[Path],
+        configuration_file_path: Optional[Path] = None,
+    ):
+        self._cache_io = cache_io
+        self._source_directories = sorted(
+            {path.resolve() for path in source_directories}
+        )
+        self._configuration_file_path = configuration_file_path
+        self._sources_hash: Optional[ContentHash] = None
+
+    def get(self, test_suite: TestSuite, test_config: TestConfig) -> Optional[bytes]:
+        entry_path = self._cache_io.cache_path / self._entry_name(test_suite)
+        if not entry_path.exists():
+            return None
+
+        snapshot = entry_path.read_bytes()
+        key = self._compute_key(test_suite, test_config).encode("ascii")
+        if snapshot[: self._KEY_LENGTH] != key:
+            return None
+        return snapshot[self._KEY_LENGTH :]
+
+    def put(self, test_suite: TestSuite, test_config: TestConfig, snapshot: bytes):
+        key = self._compute_key(test_suite, test_config).encode("ascii")
+        self._cache_io.write_bytes(self._entry_name(test_suite), key + snapshot)
+
+    def _entry_name(self, test_suite: TestSuite) -> str:
+        return f"{self._NAMESPACE}/{hash_content(str(test_suite.test_path.resolve()))}.pickle"
+
+    def _compute_key(
+        self, test_suite: TestSuite, test_config: TestConfig
+    ) -> ContentHash:
+        return (
+            ContentHasher()
+            .update(self._FORMAT_VERSION)
+            .update(str(pickle.HIGHEST_PROTOCOL))
+            .update(get_cairo_lang_version())
+            .update(get_protostar_package_version())
+            .update(self._get_sources_hash())
+            .update_file(test_suite.test_path.resolve())
+            .update(test_suite.setup_fn_name or "")
+            .update(str(test_config.max_steps))
+            .update(str(test_config.gas_estimation_enabled))
+            .update(str(test_config.profiling))
+            .hexdigest()
+        )
+
+    def _get_sources_hash(self) -> ContentHash:
+        # Contracts deployed in `__setup__` can import any file on the cairo path
+        if self._sources_hash is None:
+            hasher = ContentHasher()
+            for directory in self._source_directories:
+                if directory.is_dir():
+                    hasher.update_directory(directory, ".cairo")
+            if self._configuration_file_path and self._configuration_file_path.exists():
+                hasher.update_file(self._configuration_file_path)
+            self._sources_hash = hasher.hexdigest()
+        return self._sources_hash
@@ -0,0 +1,50 @@
+from pathlib import Path
+
+from protostar.self.cache_io import CacheIO
+
+from .suite_setup_cache import SuiteSetupCache
+from .test_config import TestConfig
+from .test_suite import TestSuite
+
+
+def create_test_suite(project_root_path: Path) -> TestSuite:
+    test_path = project_root_path / "tests" / "test_main.cairo"
+    test_path.parent.mkdir(parents=True, exist_ok=True)
+    test_path.write_text("func __setup__() {}", encoding="utf-8")
+    return TestSuite(test_path=test_path, test_cases=[], setup_fn_name="__setup__")
+
+
+def create_cache(project_root_path: Path) -> SuiteSetupCache:
+    return SuiteSetupCache(
+        cache_io=CacheIO(project_root_path),
+        source_directories=[project_root_path],
+    )
+
+
+def test_reading_written_snapshot(tmp_path: Path):
+    test_suite = create_test_suite(tmp_path)
+    create_cache(tmp_path).put(test_suite, TestConfig(seed=1), b"snapshot")
+
+    snapshot = create_cache(tmp_path).get(test_suite, TestConfig(seed=2))
+
+    assert snapshot == b"snapshot"
+
+
+def test_invalidating_snapshot_when_project_source_changes(tmp_path: Path):
+    test_suite = create_test_suite(tmp_path)
+    contract_path = tmp_path / "src" / "main.cairo"
+    contract_path.parent.mkdir()
+    contract_path.write_text("func foo() {}", encoding="utf-8")
+    create_cache(tmp_path).put(test_suite, TestConfig(), b"snapshot")
+
+    contract_path.write_text("func bar() {}", encoding="utf-8")
+
+    assert create_cache(tmp_path).get(test_suite, TestConfig()) is None
+
+
+def test_invalidating_snapshot_when_test_config_changes(tmp_path: Path):
+    test_suite = create_test_suite(tmp_path)
+    cache = create_cache(tmp_path)
+    cache.put(test_suite, TestConfig(max_steps=100), b"snapshot")
+
+    assert cache.get(test_suite, TestConfig(max_steps=200)) is None
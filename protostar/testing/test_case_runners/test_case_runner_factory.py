@@ -1,6 +1,11 @@
+from typing import Optional
+
 from protostar.testing.environments.fuzz_test_execution_environment import (
     FuzzTestExecutionEnvironment,
 )
+from protostar.testing.fuzzing.hypothesis.example_database import (
+    FuzzExampleDatabases,
+)
 from protostar.testing.starkware.contract_based_test_execution_state import (
     ContractBasedTestExecutionState,
 )
@@ -16,8 +21,13 @@ from ..environments.contract_based_test_execution_environment import (
 
 
 class TestCaseRunnerFactory:
-    def __init__(self, state: ContractBasedTestExecutionState) -> None:
+    def __init__(
+        self,
+        state: ContractBasedTestExecutionState,
+        fuzz_example_databases: Optional[FuzzExampleDatabases] = None,
+    ) -> None:
         self._state = state
+        self._fuzz_example_databases = fuzz_example_databases
 
     def make(self, test_case: TestCase) -> TestCaseRunner:
         mode = self._state.config.mode
@@ -27,7 +37,10 @@ class TestCaseRunnerFactory:
         if mode in [TestMode.FUZZ, TestMode.PARAMETERIZED]:
             return FuzzTestCaseRunner(
                 fuzz_test_execution_environment=FuzzTestExecutionEnvironment(
-                    self._state
+                    self._state,
+                    example_database=self._fuzz_example_databases.get(test_case)
+                    if self._fuzz_example_databases
+                    else None,
                 ),
                 test_case=test_case,
                 output_recorder=self._state.output_recorder,
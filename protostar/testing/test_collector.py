@@ -1,3 +1,4 @@
+import multiprocessing
 import re
 from collections import defaultdict
 from dataclasses import dataclass
@@ -76,13 +77,17 @@ def fnmatch_any(name: str, pats: Iterable[str]) -> bool:
 TestSuiteInfoDict = Dict[TestSuitePath, TestSuiteInfo]
 
 
+FunctionNames = Union[list[str], list[tuple[str, AvailableGas]]]
+
+
 class FunctionNameGetter(Protocol):
-    def __call__(
-        self, file_path: Path
-    ) -> Union[list[str], list[tuple[str, AvailableGas]]]:
+    def __call__(self, file_path: Path) -> FunctionNames:
         ...
 
 
+_COLLECTION_ERRORS = (PreprocessorError, LocationError, CairoBindingException)
+
+
 class TestCollector:
     class Result:
         def __init__(
@@ -106,8 +111,17 @@ class TestCollector:
     def __init__(
         self,
         get_suite_function_names: FunctionNameGetter,
+        workers_count: int = 1,
     ) -> None:
+        """
+        With `workers_count` greater than 1, function names of test suites are collected by forked processes.
+        `get_suite_function_names` can't rely on state shared with the main process then.
+        """
         self._get_suite_function_names = get_suite_function_names
+        self._workers_count = workers_count
+        self._prefetched_function_names: Dict[
+            Path, Union[FunctionNames, Exception]
+        ] = {}
 
     supported_test_suite_filename_patterns = [
         re.compile(r"^test_.*\.cairo"),
@@ -126,7 +140,11 @@ class TestCollector:
         targets: List[Target],
         ignored_targets: Optional[List[Target]] = None,
         default_test_suite_glob: Optional[str] = None,
+        test_suite_paths: Optional[Set[Path]] = None,
     ) -> "TestCollector.Result":
+        """
+        `test_suite_paths` restricts the collection to the given (resolved) paths of test suites.
+        """
         start_time = time()
 
         parsed_targets = self.parse_targets(set(targets), default_test_suite_glob)
@@ -143,6 +161,12 @@ class TestCollector:
             test_case_globs_dict,
             ignored_test_case_globs_dict,
         )
+        if test_suite_paths is not None:
+            filtered_test_case_globs_dict = {
+                test_suite_path: test_case_globs
+                for test_suite_path, test_case_globs in filtered_test_case_globs_dict.items()
+                if test_suite_path.resolve() in test_suite_paths
+            }
 
         test_suite_info_dict = self.build_test_suite_info_dict(
             filtered_test_case_globs_dict,
@@ -254,6 +278,7 @@ class TestCollector:
         test_suites: List[TestSuite] = []
         broken_test_suites: List[BrokenTestSuiteResult] = []
 
+        self._prefetch_function_names(list(test_suite_info_dict))
         for test_suite_info in test_suite_info_dict.values():
             try:
                 test_suites.append(
@@ -261,7 +286,7 @@ class TestCollector:
                         test_suite_info,
                     )
                 )
-            except (PreprocessorError, LocationError, CairoBindingException) as err:
+            except _COLLECTION_ERRORS as err:
                 broken_test_suites.append(
                     BrokenTestSuiteResult(
                         file_path=test_suite_info.path,
@@ -272,11 +297,38 @@ class TestCollector:
 
         return test_suites, broken_test_suites
 
+    def _prefetch_function_names(self, test_suite_paths: List[TestSuitePath]):
+        processes_count = min(self._workers_count, len(test_suite_paths))
+        if processes_count <= 1:
+            return
+
+        # Forked processes inherit the getter, which usually holds a compiler, so it isn't pickled
+        # Tests are collected before workers start, so the only other thread is the fork-safe `ActivityIndicator`
+        with multiprocessing.get_context("fork").Pool(
+            processes=processes_count,
+            initializer=_init_collecting_process,
+            initargs=(self._get_suite_function_names,),
+        ) as pool:
+            self._prefetched_function_names = dict(
+                zip(
+                    test_suite_paths,
+                    pool.map(_collect_function_names, test_suite_paths, chunksize=1),
+                )
+            )
+
+    def _get_function_names(self, test_suite_path: TestSuitePath) -> FunctionNames:
+        if test_suite_path not in self._prefetched_function_names:
+            return self._get_suite_function_names(test_suite_path)
+        function_names = self._prefetched_function_names.pop(test_suite_path)
+        if isinstance(function_names, Exception):
+            raise function_names
+        return function_names
+
     def _build_test_suite_from_test_suite_info(
         self,
         test_suite_info: TestSuiteInfo,
     ) -> TestSuite:
-        function_names = self._get_suite_function_names(test_suite_info.path)
+        function_names = self._get_function_names(test_suite_info.path)
 
         names: list[str] = []
         gas: list[AvailableGas] = []
@@ -340,3 +392,22 @@ class TestCollector:
         if function_names.count(hook_name) == 1:
             return hook_name
         return None
+
+
+_function_name_getter: Optional[FunctionNameGetter] = None
+
+
+# Note: These functions have to be top-level functions, because they are pickled by multiprocessing.
+def _init_collecting_process(get_suite_function_names: FunctionNameGetter):
+    global _function_name_getter  # pylint: disable=global-statement
+    _function_name_getter = get_suite_function_names
+
+
+def _collect_function_names(
+    test_suite_path: TestSuitePath,
+) -> Union[FunctionNames, Exception]:
+    assert _function_name_getter is not None
+    try:
+        return _function_name_getter(test_suite_path)
+    except _COLLECTION_ERRORS as err:
+        return err
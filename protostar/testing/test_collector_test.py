@@ -1,5 +1,6 @@
 # pylint: disable=unused-argument
 
+import os
 from pathlib import Path
 from typing import List
 
@@ -104,6 +105,26 @@ def test_returning_broken_test_suites(project_root: Path):
     assert len(result.broken_test_suites) > 0
 
 
+def test_collecting_tests_in_many_processes(project_root: Path):
+    collecting_pid = os.getpid()
+
+    def get_function_names(file_path: Path) -> List[str]:
+        if file_path.name == "bar_test.cairo":
+            raise PreprocessorError("")
+        assert os.getpid() != collecting_pid
+        return ["test_case_a", "test_case_b", "run"]
+
+    test_collector = TestCollector(get_function_names, workers_count=2)
+    result = test_collector.collect(targets=[str(project_root)])
+
+    assert_tested_suites(result.test_suites, ["test_foo.cairo", "test_foo.cairo"])
+    assert [
+        broken_test_suite.file_path.name
+        for broken_test_suite in result.broken_test_suites
+    ] == ["bar_test.cairo"]
+    assert result.test_cases_count == 4
+
+
 def test_collecting_specific_file(
     function_name_getter: FunctionNameGetterFixture, project_root: Path
 ):
@@ -127,6 +148,19 @@ def test_collecting_specific_function(
     assert result.test_cases_count == 1
 
 
+def test_collecting_only_given_test_suites(
+    function_name_getter: FunctionNameGetterFixture, project_root: Path
+):
+    test_collector = TestCollector(function_name_getter)
+
+    result = test_collector.collect(
+        targets=[str(project_root)],
+        test_suite_paths={(project_root / "bar" / "bar_test.cairo").resolve()},
+    )
+
+    assert_tested_suites(result.test_suites, ["bar_test.cairo"])
+
+
 def test_finding_setup_function(project_root: Path):
     def get_function_names(file_path: Path) -> List[str]:
         return ["test_main", "__setup__"]
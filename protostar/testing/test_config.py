@@ -95,6 +95,7 @@ class TestConfig:
     max_steps: Optional[int] = None
     gas_estimation_enabled: Optional[bool] = False
     fuzz_max_examples: int = 100
+    fuzz_workers_count: int = 1
     fuzz_declared_strategies: dict[str, StrategyDescriptor] = field(
         default_factory=dict
     )
@@ -0,0 +1,129 @@
+from collections import defaultdict
+from pathlib import Path
+from statistics import mean
+from typing import Dict, Optional
+
+from protostar.self.cache_io import CacheIO
+
+from .test_results import TimedTestCaseResult
+from .test_suite import TestSuite
+from .testing_summary import TestingSummary
+
+DEFAULT_TEST_CASE_DURATION = 1.0
+
+
+def _test_case_key(test_path: Path, test_case_name: str) -> str:
+    return f"{test_path.resolve()}::{test_case_name}"
+
+
+def _test_suite_key(test_path: Path) -> str:
+    return str(test_path.resolve())
+
+
+class TestDurations:
+    """
+    Execution times of test cases from previous runs, used for scheduling.
+    Durations not updated for `MAX_STALE_RUNS` runs, e.g. of deleted test cases, are pruned.
+    The mean test case duration of each suite is kept as well, to estimate suites whose
+    test cases are all new, e.g. after renaming.
+    """
+
+    CACHE_NAME = "test_durations"
+    MAX_STALE_RUNS = 100
+
+    def __init__(
+        self,
+        test_case_durations: Optional[Dict[str, float]] = None,
+        test_suite_mean_durations: Optional[Dict[str, float]] = None,
+        last_runs: Optional[Dict[str, int]] = None,
+        runs_count: int = 0,
+    ):
+        self.test_case_durations: Dict[str, float] = test_case_durations or {}
+        self.test_suite_mean_durations: Dict[str, float] = (
+            test_suite_mean_durations or {}
+        )
+        self.last_runs: Dict[str, int] = last_runs or {}
+        self.runs_count = runs_count
+
+    @classmethod
+    def read(cls, cache_io: CacheIO) -> "TestDurations":
+        cached = cache_io.read(cls.CACHE_NAME) or {}
+        return cls(
+            test_case_durations=cached.get("test_cases"),
+            test_suite_mean_durations=cached.get("test_suites_mean"),
+            last_runs=cached.get("last_runs"),
+            runs_count=cached.get("runs_count", 0),
+        )
+
+    def write(self, cache_io: CacheIO):
+        cache_io.write(
+            self.CACHE_NAME,
+            {
+                "test_cases": self.test_case_durations,
+                "test_suites_mean": self.test_suite_mean_durations,
+                "last_runs": self.last_runs,
+                "runs_count": self.runs_count,
+            },
+        )
+
+    def update(self, testing_summary: TestingSummary):
+        self.runs_count += 1
+        suite_durations: Dict[str, list[float]] = defaultdict(list)
+        for test_result in testing_summary.test_results:
+            if isinstance(test_result, TimedTestCaseResult):
+                test_case_key = _test_case_key(
+                    test_result.file_path, test_result.test_case_name
+                )
+                self.test_case_durations[test_case_key] = test_result.execution_time
+                suite_durations[_test_suite_key(test_result.file_path)].append(
+                    test_result.execution_time
+                )
+                self.last_runs[test_case_key] = self.runs_count
+        for suite_key, durations in suite_durations.items():
+            self.test_suite_mean_durations[suite_key] = mean(durations)
+            self.last_runs[suite_key] = self.runs_count
+        self._prune()
+
+    def _prune(self):
+        stale_keys = [
+            key
+            for key, last_run in self.last_runs.items()
+            if self.runs_count - last_run >= self.MAX_STALE_RUNS
+        ]
+        for key in stale_keys:
+            del self.last_runs[key]
+            self.test_case_durations.pop(key, None)
+            self.test_suite_mean_durations.pop(key, None)
+
+    def estimate_test_suite_cost(self, test_suite: TestSuite) -> float:
+        """
+        Sums known durations of the suite's test cases. Durations of new test cases are
+        approximated with the average duration of known test cases of the suite, if there are any,
+        the suite's mean duration from previous runs or the average duration of all known test cases.
+        """
+        known_durations: list[float] = []
+        unknown_count = 0
+        for test_case in test_suite.test_cases:
+            duration = self.test_case_durations.get(
+                _test_case_key(test_suite.test_path, test_case.test_fn_name)
+            )
+            if duration is None:
+                unknown_count += 1
+            else:
+                known_durations.append(duration)
+
+        if unknown_count == 0:
+            return sum(known_durations)
+        if known_durations:
+            fallback_duration = mean(known_durations)
+        else:
+            fallback_duration = self.test_suite_mean_durations.get(
+                _test_suite_key(test_suite.test_path),
+                self._get_average_test_case_duration(),
+            )
+        return sum(known_durations) + unknown_count * fallback_duration
+
+    def _get_average_test_case_duration(self) -> float:
+        if not self.test_case_durations:
+            return DEFAULT_TEST_CASE_DURATION
+        return mean(self.test_case_durations.values())
@@ -0,0 +1,94 @@
+from pathlib import Path
+
+from .test_collector import TestCollector
+from .test_durations import DEFAULT_TEST_CASE_DURATION, TestDurations
+from .test_results import PassedTestCaseResult
+from .test_suite import TestCase, TestSuite
+from .testing_summary import TestingSummary
+
+
+def make_test_suite(test_path: Path, test_case_names: list[str]) -> TestSuite:
+    return TestSuite(
+        test_path=test_path,
+        test_cases=[
+            TestCase(test_path=test_path, test_fn_name=name) for name in test_case_names
+        ],
+    )
+
+
+def make_testing_summary(
+    test_path: Path, durations: dict[str, float]
+) -> TestingSummary:
+    return TestingSummary(
+        initial_test_results=[
+            PassedTestCaseResult(
+                file_path=test_path,
+                test_case_name=name,
+                captured_stdout={},
+                execution_time=duration,
+                execution_resources=None,
+            )
+            for name, duration in durations.items()
+        ],
+        testing_seed=0,
+        test_collector_result=TestCollector.Result(test_suites=[]),
+    )
+
+
+def test_estimating_cost_without_history():
+    test_suite = make_test_suite(Path("a_test.cairo"), ["test_a", "test_b"])
+
+    assert (
+        TestDurations().estimate_test_suite_cost(test_suite)
+        == 2 * DEFAULT_TEST_CASE_DURATION
+    )
+
+
+def test_new_test_cases_are_estimated_with_known_durations():
+    test_path = Path("a_test.cairo")
+    durations = TestDurations(
+        test_case_durations={
+            f"{test_path.resolve()}::test_a": 2.0,
+            f"{test_path.resolve()}::test_b": 4.0,
+        }
+    )
+
+    assert (
+        durations.estimate_test_suite_cost(
+            make_test_suite(test_path, ["test_a", "test_b", "test_new"])
+        )
+        == 9.0
+    )
+    assert (
+        durations.estimate_test_suite_cost(
+            make_test_suite(Path("other_test.cairo"), ["test_a"])
+        )
+        == 3.0
+    )
+
+
+def test_renamed_test_cases_are_estimated_with_suite_mean_duration():
+    test_path = Path("a_test.cairo")
+    durations = TestDurations()
+    durations.update(make_testing_summary(test_path, {"test_a": 2.0, "test_b": 4.0}))
+    durations.update(make_testing_summary(Path("other_test.cairo"), {"test_c": 9.0}))
+
+    assert (
+        durations.estimate_test_suite_cost(
+            make_test_suite(test_path, ["test_renamed_a", "test_renamed_b"])
+        )
+        == 6.0
+    )
+
+
+def test_durations_not_updated_for_long_are_pruned():
+    test_path = Path("a_test.cairo")
+    durations = TestDurations()
+    durations.update(make_testing_summary(test_path, {"test_deleted": 2.0}))
+
+    for _ in range(TestDurations.MAX_STALE_RUNS - 1):
+        durations.update(make_testing_summary(test_path, {"test_kept": 1.0}))
+    assert f"{test_path.resolve()}::test_deleted" in durations.test_case_durations
+
+    durations.update(make_testing_summary(test_path, {"test_kept": 1.0}))
+    assert durations.test_case_durations == {f"{test_path.resolve()}::test_kept": 1.0}
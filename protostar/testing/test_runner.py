@@ -1,9 +1,10 @@
 import asyncio
+import pickle
 import traceback
 from dataclasses import dataclass
 from logging import getLogger
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Coroutine, List, Optional, TypeVar
 
 from starkware.starknet.services.api.contract_class.contract_class import (
     DeprecatedCompiledClass,
@@ -19,14 +20,17 @@ from protostar.configuration_file.configuration_file_factory import (
     ConfigurationFileFactory,
 )
 from protostar.protostar_exception import ProtostarException
+from protostar.self.cache_io import CacheIO
 from protostar.starknet.pass_managers import TestSuitePassMangerFactory
 from protostar.starknet import StarknetCompiler, StarknetCompilerConfig
 from protostar.contract_path_resolver import ContractPathResolver
 
 from .environments.setup_execution_environment import SetupExecutionEnvironment
+from .fuzzing.hypothesis.example_database import FuzzExampleDatabases
 from .starkware.contract_based_test_execution_state import (
     ContractBasedTestExecutionState,
 )
+from .suite_setup_cache import SuiteSetupCache
 from .test_case_runners.setup_case_runner import run_setup_case
 from .test_case_runners.test_case_runner_factory import TestCaseRunnerFactory
 from .test_config import TestConfig
@@ -44,6 +48,33 @@ from .testing_seed import Seed
 
 logger = getLogger()
 
+RunnerT = TypeVar("RunnerT")
+
+# Event loop reused by every test suite executed in the worker process
+_worker_event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_in_worker_event_loop(coroutine: Coroutine[Any, Any, None]) -> None:
+    global _worker_event_loop  # pylint: disable=global-statement
+    if _worker_event_loop is None or _worker_event_loop.is_closed():
+        _worker_event_loop = asyncio.new_event_loop()
+    _worker_event_loop.run_until_complete(coroutine)
+
+
+def initialize_worker_runner(
+    runner_factory: Callable[["TestRunner.WorkerConfig"], RunnerT],
+    config: "TestRunner.WorkerConfig",
+) -> Optional[RunnerT]:
+    """
+    Creates the runner in the pool initializer. An exception raised there would make the pool
+    restart the worker process forever, so the runner creation is retried and reported
+    when the first test suite is executed instead.
+    """
+    try:
+        return runner_factory(config)
+    except Exception:  # pylint: disable=broad-except
+        return None
+
 
 # pylint: disable=too-many-instance-attributes
 class TestRunner:
@@ -57,15 +88,20 @@ class TestRunner:
         include_paths: Optional[List[str]] = None,
         profiling: bool = False,
         gas_estimation_enabled: bool = False,
+        setup_cache_enabled: bool = False,
+        fuzz_workers_count: int = 1,
     ):
         self._gas_estimation_enabled = gas_estimation_enabled
+        self._fuzz_workers_count = fuzz_workers_count
         self.shared_tests_state = shared_tests_state
         self.profiling = profiling
         include_paths = include_paths or []
 
         self.tests_compiler = StarknetCompiler(
             config=StarknetCompilerConfig(
-                include_paths=include_paths, disable_hint_validation=True
+                include_paths=include_paths,
+                disable_hint_validation=True,
+                cache_io=CacheIO(project_root_path),
             ),
             pass_manager_factory=TestSuitePassMangerFactory,
         )
@@ -88,34 +124,72 @@ class TestRunner:
             project_root_path=project_root_path,
             configuration_file=configuration_file,
         )
+        self.fuzz_example_databases = FuzzExampleDatabases(CacheIO(project_root_path))
+        # Profiled test cases have to execute the whole test suite
+        self.suite_setup_cache = (
+            SuiteSetupCache(
+                cache_io=CacheIO(project_root_path),
+                source_directories=[Path(path) for path in include_paths],
+                configuration_file_path=configuration_file.get_filepath(),
+            )
+            if setup_cache_enabled and not profiling
+            else None
+        )
 
     @dataclass
-    class WorkerArgs:
-        test_suite: TestSuite
+    class WorkerConfig:
         shared_tests_state: SharedTestsState
         include_paths: List[str]
         disable_hint_validation_in_user_contracts: bool
         profiling: bool
-        testing_seed: Seed
         project_root_path: Path
         cwd: Path
         active_profile_name: Optional[str]
-        max_steps: Optional[int]
         gas_estimation_enabled: bool
+        setup_cache_enabled: bool = False
+        fuzz_workers_count: int = 1
+
+    @dataclass
+    class WorkerArgs:
+        test_suite: TestSuite
+        testing_seed: Seed
+        max_steps: Optional[int]
+        worker_config: "TestRunner.WorkerConfig"
+        # Incremented by the watch mode whenever sources change, so warm workers notice it
+        sources_version: int = 0
+
+        @property
+        def shared_tests_state(self) -> SharedTestsState:
+            return self.worker_config.shared_tests_state
+
+    # Runner reused by every test suite executed in the worker process
+    _worker_runner: Optional["TestRunner"] = None
+
+    @classmethod
+    def from_worker_config(cls, config: "TestRunner.WorkerConfig") -> "TestRunner":
+        return cls(
+            shared_tests_state=config.shared_tests_state,
+            include_paths=config.include_paths,
+            project_root_path=config.project_root_path,
+            disable_hint_validation_in_user_contracts=config.disable_hint_validation_in_user_contracts,
+            profiling=config.profiling,
+            cwd=config.cwd,
+            active_profile_name=config.active_profile_name,
+            gas_estimation_enabled=config.gas_estimation_enabled,
+            setup_cache_enabled=config.setup_cache_enabled,
+            fuzz_workers_count=config.fuzz_workers_count,
+        )
+
+    @classmethod
+    def initialize_worker(cls, config: "TestRunner.WorkerConfig"):
+        cls._worker_runner = initialize_worker_runner(cls.from_worker_config, config)
 
     @classmethod
     def worker(cls, args: "TestRunner.WorkerArgs"):
-        asyncio.run(
-            cls(
-                shared_tests_state=args.shared_tests_state,
-                include_paths=args.include_paths,
-                project_root_path=args.project_root_path,
-                disable_hint_validation_in_user_contracts=args.disable_hint_validation_in_user_contracts,
-                profiling=args.profiling,
-                cwd=args.cwd,
-                active_profile_name=args.active_profile_name,
-                gas_estimation_enabled=args.gas_estimation_enabled,
-            ).run_test_suite(
+        if cls._worker_runner is None:
+            cls._worker_runner = cls.from_worker_config(args.worker_config)
+        run_in_worker_event_loop(
+            cls._worker_runner.run_test_suite(
                 test_suite=args.test_suite,
                 testing_seed=args.testing_seed,
                 max_steps=args.max_steps,
@@ -133,20 +207,25 @@ class TestRunner:
             profiling=self.profiling,
             max_steps=max_steps,
             gas_estimation_enabled=self._gas_estimation_enabled,
+            fuzz_workers_count=self._fuzz_workers_count,
         )
 
         try:
-            compiled_test = self.tests_compiler.compile_contract(
-                test_suite.test_path,
-                add_debug_info=True,
+            execution_state = self._load_execution_state_snapshot(
+                test_suite, test_config
             )
+            if not execution_state:
+                compiled_test = self.tests_compiler.compile_contract(
+                    test_suite.test_path,
+                    add_debug_info=True,
+                )
 
-            execution_state = await self._build_execution_state(
-                test_contract=compiled_test,
-                test_suite=test_suite,
-                test_config=test_config,
-                contract_path=test_suite.test_path,
-            )
+                execution_state = await self._build_execution_state(
+                    test_contract=compiled_test,
+                    test_suite=test_suite,
+                    test_config=test_config,
+                    contract_path=test_suite.test_path,
+                )
             if not execution_state:
                 return
             await self._invoke_test_cases(
@@ -204,6 +283,9 @@ class TestRunner:
             if test_suite.setup_fn_name:
                 env = SetupExecutionEnvironment(execution_state)
                 await env.execute(test_suite.setup_fn_name)
+                self._save_execution_state_snapshot(
+                    test_suite, test_config, execution_state
+                )
 
             return execution_state
         except StarkException as ex:
@@ -217,6 +299,40 @@ class TestRunner:
 
             return None
 
+    def _load_execution_state_snapshot(
+        self, test_suite: TestSuite, test_config: TestConfig
+    ) -> Optional[ContractBasedTestExecutionState]:
+        if not self.suite_setup_cache or not test_suite.setup_fn_name:
+            return None
+        snapshot = self.suite_setup_cache.get(test_suite, test_config)
+        if snapshot is None:
+            return None
+        try:
+            return ContractBasedTestExecutionState.from_snapshot(
+                snapshot,
+                test_config=test_config,
+                cairo0_project_compiler=self.cairo0_project_compiler,
+                contract_path_resolver=self.contract_path_resolver,
+            )
+        # Snapshots written by a different version of Protostar or its dependencies
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+    def _save_execution_state_snapshot(
+        self,
+        test_suite: TestSuite,
+        test_config: TestConfig,
+        execution_state: ContractBasedTestExecutionState,
+    ):
+        if not self.suite_setup_cache:
+            return
+        try:
+            snapshot = execution_state.to_snapshot()
+        # The test suite is still executed, its setup is just not reused by the next run
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        self.suite_setup_cache.put(test_suite, test_config, snapshot)
+
     async def _invoke_test_cases(
         self,
         test_suite: TestSuite,
@@ -240,6 +356,8 @@ class TestRunner:
 
         state.determine_test_mode(test_case)
 
-        test_case_runner_factory = TestCaseRunnerFactory(state)
+        test_case_runner_factory = TestCaseRunnerFactory(
+            state, fuzz_example_databases=self.fuzz_example_databases
+        )
         test_case_runner = test_case_runner_factory.make(test_case)
         return await test_case_runner.run()
@@ -1,6 +1,8 @@
 import multiprocessing
-import signal
 import dataclasses
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Optional
 
@@ -8,6 +10,14 @@ from .test_results import TestResult
 from .test_collector import TestCollector
 from .test_runner import TestRunner
 from .test_shared_tests_state import SharedTestsState
+from .test_suite_sharding import (
+    TestSuiteCostEstimator,
+    count_test_cases,
+    order_longest_first,
+    predict_makespan,
+    shard_test_suites,
+)
+from .test_worker_pool import TestWorkerPool, WorkerInitializer
 from .testing_seed import Seed
 
 if TYPE_CHECKING:
@@ -28,6 +38,15 @@ def make_path_relative_if_possible(test_result: TestResult, path: Path) -> TestR
     return test_result
 
 
+@dataclass(frozen=True)
+class SchedulingReport:
+    workers_count: int
+    test_suites_count: int
+    estimated_total_work: float
+    predicted_makespan: float
+    actual_makespan: float
+
+
 class TestScheduler:
     def __init__(
         self,
@@ -36,9 +55,11 @@ class TestScheduler:
             [TestRunner.WorkerArgs],
             None,
         ],
+        worker_initializer: Optional[WorkerInitializer] = None,
     ):
         self._live_logger = live_logger
         self._worker = worker
+        self._worker_initializer = worker_initializer
 
     def run(
         self,
@@ -54,53 +75,112 @@ class TestScheduler:
         active_profile_name: Optional[str],
         gas_estimation_enabled: bool,
         on_exit_first: Callable[[], None],
-    ):
-        with multiprocessing.Manager() as manager:
-            shared_tests_state = SharedTestsState(
-                test_collector_result=test_collector_result, manager=manager
-            )
-            setups: list[TestRunner.WorkerArgs] = [
-                TestRunner.WorkerArgs(
-                    test_suite,
-                    shared_tests_state=shared_tests_state,
-                    include_paths=include_paths,
-                    disable_hint_validation_in_user_contracts=disable_hint_validation,
-                    profiling=profiling,
-                    testing_seed=testing_seed,
-                    max_steps=max_steps,
-                    project_root_path=project_root_path,
-                    active_profile_name=active_profile_name,
-                    cwd=cwd,
-                    gas_estimation_enabled=gas_estimation_enabled,
-                )
-                for test_suite in test_collector_result.test_suites
-            ]
+        split_suites: bool = False,
+        estimate_test_suite_cost: TestSuiteCostEstimator = count_test_cases,
+        send_passed_stdout: bool = True,
+        workers_count: Optional[int] = None,
+        setup_cache_enabled: bool = False,
+        fuzz_workers_count: int = 1,
+        worker_pool: Optional[TestWorkerPool] = None,
+        sources_version: int = 0,
+    ) -> Optional[SchedulingReport]:
+        """
+        If `worker_pool` is provided, test suites are executed by its warm workers,
+        and the worker configuration arguments are ignored in favor of the pool's configuration.
+        Interrupting such a run terminates the pool and reraises `KeyboardInterrupt`.
+        """
+        if worker_pool:
+            workers_count = worker_pool.processes_count
+        workers_count = workers_count or multiprocessing.cpu_count()
+        test_suites = test_collector_result.test_suites
+        if split_suites:
+            test_suites = shard_test_suites(test_suites, workers_count=workers_count)
+        test_suites = order_longest_first(
+            test_suites, estimate_cost=estimate_test_suite_cost
+        )
+        estimated_costs = [
+            estimate_test_suite_cost(test_suite) for test_suite in test_suites
+        ]
 
-            # A test case was broken
-            if exit_first and shared_tests_state.any_failed_or_broken():
-                on_exit_first()
-                return
+        if worker_pool:
+            worker_config = worker_pool.worker_config
+            worker_config.shared_tests_state.reset(test_collector_result)
+        else:
+            worker_config = TestRunner.WorkerConfig(
+                shared_tests_state=SharedTestsState(
+                    test_collector_result=test_collector_result,
+                    send_passed_stdout=send_passed_stdout,
+                ),
+                include_paths=include_paths,
+                disable_hint_validation_in_user_contracts=disable_hint_validation,
+                profiling=profiling,
+                project_root_path=project_root_path,
+                active_profile_name=active_profile_name,
+                cwd=cwd,
+                gas_estimation_enabled=gas_estimation_enabled,
+                setup_cache_enabled=setup_cache_enabled,
+                fuzz_workers_count=fuzz_workers_count,
+            )
+        shared_tests_state = worker_config.shared_tests_state
+        setups: list[TestRunner.WorkerArgs] = [
+            TestRunner.WorkerArgs(
+                test_suite,
+                testing_seed=testing_seed,
+                max_steps=max_steps,
+                worker_config=worker_config,
+                sources_version=sources_version,
+            )
+            for test_suite in test_suites
+        ]
+        # Every worker process is initialized eagerly, so there is no point in having idle ones
+        processes_count = (
+            worker_pool.processes_count
+            if worker_pool
+            else max(1, min(workers_count, len(setups)))
+        )
 
-            try:
-                with multiprocessing.Pool(
-                    processes=multiprocessing.cpu_count(),
-                    initializer=_init_worker,
-                ) as pool:
-                    results = pool.map_async(self._worker, setups)
-                    self._live_logger.log(
-                        shared_tests_state,
-                        test_collector_result,
-                    )
-                    if exit_first and shared_tests_state.any_failed_or_broken():
-                        pool.terminate()
-                        return
+        # A test case was broken
+        if exit_first and shared_tests_state.any_failed_or_broken():
+            on_exit_first()
+            return None
 
-                    results.get()
-            except KeyboardInterrupt:
-                return
+        try:
+            with (
+                nullcontext(worker_pool)
+                if worker_pool
+                else TestWorkerPool(
+                    worker_config,
+                    processes_count=processes_count,
+                    worker_initializer=self._worker_initializer,
+                )
+            ) as pool:
+                start_time = time.perf_counter()
+                # Suites are ordered longest first
+                results = pool.imap_unordered(self._worker, setups)
+                self._live_logger.log(
+                    shared_tests_state,
+                    test_collector_result,
+                )
+                if exit_first and shared_tests_state.any_failed_or_broken():
+                    pool.terminate()
+                    return None
 
+                for _ in results:
+                    pass
+                actual_makespan = time.perf_counter() - start_time
+        except KeyboardInterrupt:
+            if worker_pool:
+                # Workers would keep running the queued suites, and the caller has to stop as well
+                worker_pool.terminate()
+                raise
+            return None
 
-# Note: This function has to be top-level function, because it is being pickled by multiprocessing.
-def _init_worker():
-    # Prevent showing a stacktrace on CMD/CTRL+C.
-    signal.signal(signal.SIGINT, signal.SIG_IGN)
+        return SchedulingReport(
+            workers_count=processes_count,
+            test_suites_count=len(test_suites),
+            estimated_total_work=sum(estimated_costs),
+            predicted_makespan=predict_makespan(
+                estimated_costs, workers_count=processes_count
+            ),
+            actual_makespan=actual_makespan,
+        )
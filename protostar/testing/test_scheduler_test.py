@@ -0,0 +1,54 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from .test_collector import TestCollector
+from .test_runner import TestRunner
+from .test_scheduler import TestScheduler
+from .test_shared_tests_state import SharedTestsState
+from .test_worker_pool import TestWorkerPool
+
+
+def do_nothing(_args: TestRunner.WorkerArgs):
+    pass
+
+
+def test_interrupting_run_with_external_worker_pool(mocker: MockerFixture):
+    test_collector_result = TestCollector.Result(test_suites=[])
+    worker_pool = TestWorkerPool(
+        TestRunner.WorkerConfig(
+            shared_tests_state=SharedTestsState(test_collector_result),
+            include_paths=[],
+            disable_hint_validation_in_user_contracts=False,
+            profiling=False,
+            project_root_path=Path(),
+            cwd=Path(),
+            active_profile_name=None,
+            gas_estimation_enabled=False,
+        ),
+        processes_count=1,
+    )
+    live_logger: Any = mocker.MagicMock()
+    live_logger.log.side_effect = KeyboardInterrupt()
+    scheduler = TestScheduler(live_logger=live_logger, worker=do_nothing)
+
+    with pytest.raises(KeyboardInterrupt):
+        scheduler.run(
+            test_collector_result=test_collector_result,
+            include_paths=[],
+            disable_hint_validation=False,
+            profiling=False,
+            exit_first=False,
+            testing_seed=0,
+            max_steps=None,
+            project_root_path=Path(),
+            cwd=Path(),
+            active_profile_name=None,
+            gas_estimation_enabled=False,
+            on_exit_first=mocker.MagicMock(),
+            worker_pool=worker_pool,
+        )
+
+    assert worker_pool.is_terminated
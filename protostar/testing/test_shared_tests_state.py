@@ -1,29 +1,108 @@
 import ctypes
-from multiprocessing.managers import SyncManager
+import dataclasses
+import multiprocessing
+import queue
+import time
+from collections import deque
+from multiprocessing.context import get_spawning_popen
+from typing import Deque, Optional
+from uuid import uuid4
 
 from .test_collector import TestCollector
-from .test_results import AcceptableResult, TestResult
+from .test_results import AcceptableResult, TestCaseResult, TestResult
+
+# Shared states received by the worker process from the pool initializer, by id
+_inherited_shared_tests_states: dict[str, "SharedTestsState"] = {}
+
+
+def _get_inherited_shared_tests_state(state_id: str) -> "SharedTestsState":
+    return _inherited_shared_tests_states[state_id]
 
 
 class SharedTestsState:
+    """
+    Channel for sending test results from workers to the main process.
+    Results are sent through a pipe in batches, a batch is flushed when it gets big or old enough.
+    Pipe ends and the failure flag can only be inherited by worker processes, so the state has
+    to be passed to the pool initializer. Afterwards, it is pickled as a reference.
+    """
+
+    MAX_BATCH_SIZE = 64
+    MAX_BATCH_AGE = 0.1
+
     def __init__(
         self,
         test_collector_result: "TestCollector.Result",
-        manager: SyncManager,
+        send_passed_stdout: bool = True,
     ) -> None:
-        self._shared_queue = manager.Queue()
-        self._any_failed_or_broken_shared_value = manager.Value(
+        self._id = uuid4().hex
+        self._send_passed_stdout = send_passed_stdout
+        self._reader, self._writer = multiprocessing.Pipe(duplex=False)
+        self._write_lock = multiprocessing.Lock()
+        self._any_failed_or_broken_shared_value = multiprocessing.Value(
             ctypes.c_bool,
             (len(test_collector_result.broken_test_suites) > 0),
+            lock=False,
+        )
+        self._received_results: Deque[TestResult] = deque()
+        self._pending_results: list[TestResult] = []
+        self._last_flush_time = time.perf_counter()
+
+    def __reduce_ex__(self, protocol):
+        if get_spawning_popen() is None:
+            return _get_inherited_shared_tests_state, (self._id,)
+        return super().__reduce_ex__(protocol)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_received_results"] = deque()
+        state["_pending_results"] = []
+        return state
+
+    def reset(self, test_collector_result: "TestCollector.Result") -> None:
+        """
+        Prepares the state for another run in the same worker processes.
+        Results left over from the previous run are discarded.
+        """
+        self._any_failed_or_broken_shared_value.value = (
+            len(test_collector_result.broken_test_suites) > 0
         )
+        self._received_results.clear()
+        while self._reader.poll():
+            self._reader.recv()
 
-    def get_result(self) -> TestResult:
-        return self._shared_queue.get(block=True, timeout=20000)
+    def register_in_worker(self) -> None:
+        _inherited_shared_tests_states[self._id] = self
+
+    def get_result(self, timeout: Optional[float] = 20000) -> TestResult:
+        if not self._received_results:
+            if not self._reader.poll(timeout):
+                # Mimics `queue.Queue.get`
+                raise queue.Empty()
+            self._received_results.extend(self._reader.recv())
+        return self._received_results.popleft()
 
     def put_result(self, item: TestResult) -> None:
-        if not isinstance(item, AcceptableResult):
+        is_acceptable = isinstance(item, AcceptableResult)
+        if not is_acceptable:
             self._any_failed_or_broken_shared_value.value = True
-        self._shared_queue.put(item)
+        elif not self._send_passed_stdout and isinstance(item, TestCaseResult):
+            item = dataclasses.replace(item, captured_stdout={})
+        self._pending_results.append(item)
+
+        if (
+            not is_acceptable
+            or len(self._pending_results) >= self.MAX_BATCH_SIZE
+            or time.perf_counter() - self._last_flush_time >= self.MAX_BATCH_AGE
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending_results:
+            with self._write_lock:
+                self._writer.send(self._pending_results)
+            self._pending_results = []
+        self._last_flush_time = time.perf_counter()
 
     def any_failed_or_broken(self) -> bool:
         return self._any_failed_or_broken_shared_value.value
@@ -0,0 +1,81 @@
+import multiprocessing
+import queue
+from pathlib import Path
+
+import pytest
+
+from .test_collector import TestCollector
+from .test_results import FailedTestCaseResult, PassedTestCaseResult
+from .test_shared_tests_state import SharedTestsState
+
+
+def make_passed_result(test_case_name: str) -> PassedTestCaseResult:
+    return PassedTestCaseResult(
+        file_path=Path("test_suite.cairo"),
+        test_case_name=test_case_name,
+        captured_stdout={"test": "output"},
+        execution_time=0.0,
+        execution_resources=None,
+    )
+
+
+def put_results(shared_tests_state: SharedTestsState):
+    for index in range(3):
+        shared_tests_state.put_result(make_passed_result(f"test_{index}"))
+    shared_tests_state.flush()
+
+
+def test_results_are_sent_in_batches():
+    shared_tests_state = SharedTestsState(TestCollector.Result(test_suites=[]))
+
+    put_results(shared_tests_state)
+
+    assert [
+        shared_tests_state.get_result(timeout=1).test_case_name for _ in range(3)
+    ] == ["test_0", "test_1", "test_2"]
+
+
+def test_passed_stdout_is_not_sent_unless_requested():
+    shared_tests_state = SharedTestsState(
+        TestCollector.Result(test_suites=[]), send_passed_stdout=False
+    )
+    failed_result = FailedTestCaseResult(
+        file_path=Path("test_suite.cairo"),
+        test_case_name="test_failed",
+        captured_stdout={"test": "output"},
+        execution_time=0.0,
+        exception=Exception(),
+    )
+
+    shared_tests_state.put_result(make_passed_result("test_passed"))
+    shared_tests_state.put_result(failed_result)
+
+    assert shared_tests_state.get_result(timeout=1).captured_stdout == {}
+    assert shared_tests_state.get_result(timeout=1).captured_stdout == {
+        "test": "output"
+    }
+    assert shared_tests_state.any_failed_or_broken()
+
+
+def test_state_is_shared_with_pool_workers():
+    shared_tests_state = SharedTestsState(TestCollector.Result(test_suites=[]))
+
+    with multiprocessing.Pool(
+        processes=2,
+        initializer=SharedTestsState.register_in_worker,
+        initargs=(shared_tests_state,),
+    ) as pool:
+        pool.map(put_results, [shared_tests_state] * 2)
+
+    assert len([shared_tests_state.get_result(timeout=1) for _ in range(6)]) == 6
+
+
+def test_reset_discards_results_of_previous_run():
+    shared_tests_state = SharedTestsState(TestCollector.Result(test_suites=[]))
+    put_results(shared_tests_state)
+    shared_tests_state.get_result(timeout=1)
+
+    shared_tests_state.reset(TestCollector.Result(test_suites=[]))
+
+    with pytest.raises(queue.Empty):
+        shared_tests_state.get_result(timeout=0.1)
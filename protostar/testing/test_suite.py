@@ -59,6 +59,24 @@ class TestSuite:
     def collect_test_case_names(self) -> List[str]:
         return [tc.test_fn_name for tc in self.test_cases]
 
+    def split(self, shards_count: int) -> List["TestSuite"]:
+        """
+        Splits test cases into at most `shards_count` suites of similar size.
+        Each shard keeps the suite setup hook, so it is executed once per shard.
+        """
+        shards_count = max(1, min(shards_count, len(self.test_cases)))
+        return [
+            self._with_test_cases(self.test_cases[shard_index::shards_count])
+            for shard_index in range(shards_count)
+        ]
+
+    def _with_test_cases(self, test_cases: TestCases) -> "TestSuite":
+        return TestSuite(
+            test_path=self.test_path,
+            test_cases=test_cases,
+            setup_fn_name=self.setup_fn_name,
+        )
+
 
 class Cairo1TestSuite(TestSuite):
     def __init__(
@@ -67,10 +85,15 @@ class Cairo1TestSuite(TestSuite):
         test_cases: TestCases,
         sierra_output: str,
         setup_fn_name: Optional[str] = None,
+        compiled_test_cases: Optional[TestCases] = None,
     ):
         super().__init__(test_path, [], setup_fn_name)
         self.test_cases = test_cases
         self.sierra_output = sierra_output
+        # Shards of a suite are compiled with all test cases of the suite, so they share the same CASM
+        self.compiled_test_cases = (
+            compiled_test_cases if compiled_test_cases is not None else test_cases
+        )
 
     @classmethod
     def from_test_suite(cls, test_suite: TestSuite, sierra_output: str) -> Self:
@@ -81,6 +104,15 @@ class Cairo1TestSuite(TestSuite):
             sierra_output=sierra_output,
         )
 
+    def _with_test_cases(self, test_cases: TestCases) -> "TestSuite":
+        return Cairo1TestSuite(
+            test_path=self.test_path,
+            test_cases=test_cases,
+            sierra_output=self.sierra_output,
+            setup_fn_name=self.setup_fn_name,
+            compiled_test_cases=self.compiled_test_cases,
+        )
+
     def add_offsets_to_cases(self, offset_map: dict[str, Offset]):
         for test_case in self.test_cases:
             assert isinstance(
@@ -0,0 +1,55 @@
+import heapq
+import math
+from typing import Callable, List
+
+from .test_suite import TestSuite
+
+TestSuiteCostEstimator = Callable[[TestSuite], float]
+
+MIN_SHARD_SIZE = 4
+
+
+def count_test_cases(test_suite: TestSuite) -> float:
+    return len(test_suite.test_cases)
+
+
+def shard_test_suites(
+    test_suites: List[TestSuite],
+    workers_count: int,
+    min_shard_size: int = MIN_SHARD_SIZE,
+) -> List[TestSuite]:
+    """
+    Splits suites that have more test cases than the average amount of work per worker,
+    so a single big suite doesn't keep one worker busy while the others are idle.
+    """
+    test_cases_count = sum(len(test_suite.test_cases) for test_suite in test_suites)
+    shard_size = max(
+        min_shard_size, math.ceil(test_cases_count / max(workers_count, 1))
+    )
+
+    shards: List[TestSuite] = []
+    for test_suite in test_suites:
+        shards_count = math.ceil(len(test_suite.test_cases) / shard_size)
+        if shards_count > 1:
+            shards.extend(test_suite.split(shards_count))
+        else:
+            shards.append(test_suite)
+    return shards
+
+
+def order_longest_first(
+    test_suites: List[TestSuite],
+    estimate_cost: TestSuiteCostEstimator = count_test_cases,
+) -> List[TestSuite]:
+    return sorted(test_suites, key=estimate_cost, reverse=True)
+
+
+def predict_makespan(costs: List[float], workers_count: int) -> float:
+    """
+    Simulates handing out work items one by one, in the given order, to the first idle worker.
+    """
+    workers_finish_times = [0.0] * max(workers_count, 1)
+    heapq.heapify(workers_finish_times)
+    for cost in costs:
+        heapq.heappush(workers_finish_times, heapq.heappop(workers_finish_times) + cost)
+    return max(workers_finish_times)
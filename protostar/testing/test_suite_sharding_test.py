@@ -0,0 +1,84 @@
+from pathlib import Path
+
+from .test_collector import TestCollector
+from .test_results import BrokenTestSuiteResult
+from .test_suite import TestCase, TestSuite
+from .test_suite_sharding import (
+    order_longest_first,
+    predict_makespan,
+    shard_test_suites,
+)
+from .testing_summary import TestingSummary
+
+
+def make_test_suite(name: str, test_cases_count: int) -> TestSuite:
+    test_path = Path(f"{name}_test.cairo")
+    return TestSuite(
+        test_path=test_path,
+        test_cases=[
+            TestCase(test_path=test_path, test_fn_name=f"test_{i}")
+            for i in range(test_cases_count)
+        ],
+        setup_fn_name="__setup__",
+    )
+
+
+def test_big_suite_is_split_and_small_suites_are_kept():
+    big_suite = make_test_suite("big", 100)
+    small_suite = make_test_suite("small", 4)
+
+    shards = shard_test_suites([big_suite, small_suite], workers_count=8)
+
+    big_suite_shards = [
+        shard for shard in shards if shard.test_path == big_suite.test_path
+    ]
+    assert len(big_suite_shards) == 8
+    assert sorted(
+        name for shard in big_suite_shards for name in shard.collect_test_case_names()
+    ) == sorted(big_suite.collect_test_case_names())
+    assert all(shard.setup_fn_name == "__setup__" for shard in big_suite_shards)
+    assert small_suite in shards
+
+
+def test_shards_are_not_smaller_than_min_shard_size():
+    shards = shard_test_suites([make_test_suite("a", 10)], workers_count=32)
+
+    assert [len(shard.test_cases) for shard in shards] == [4, 3, 3]
+
+
+def test_order_longest_first():
+    suites = [make_test_suite("a", 1), make_test_suite("b", 5), make_test_suite("c", 3)]
+
+    assert [len(suite.test_cases) for suite in order_longest_first(suites)] == [5, 3, 1]
+
+
+def test_predict_makespan():
+    assert predict_makespan([5, 4, 3, 3, 1], workers_count=2) == 8
+    assert predict_makespan([], workers_count=2) == 0
+
+
+def test_broken_suite_is_counted_once_for_all_shards():
+    test_suite = make_test_suite("broken", 8)
+    shards = test_suite.split(2)
+    testing_summary = TestingSummary(
+        initial_test_results=[],
+        testing_seed=0,
+        test_collector_result=TestCollector.Result(test_suites=[test_suite]),
+    )
+
+    testing_summary.extend(
+        [
+            BrokenTestSuiteResult(
+                file_path=shard.test_path,
+                test_case_names=shard.collect_test_case_names(),
+                exception=ValueError(),
+            )
+            for shard in shards
+        ]
+    )
+
+    assert len(testing_summary.broken_suites) == 1
+    assert sorted(testing_summary.broken_suites[0].test_case_names) == sorted(
+        test_suite.collect_test_case_names()
+    )
+    assert testing_summary.test_results == testing_summary.broken_suites
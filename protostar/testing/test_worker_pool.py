@@ -0,0 +1,95 @@
+import functools
+import multiprocessing
+import signal
+from typing import Callable, Iterator, Optional
+
+from .test_runner import TestRunner
+
+WorkerInitializer = Callable[[TestRunner.WorkerConfig], None]
+
+
+class TestWorkerPool:
+    """
+    Worker processes, which initialize their runners once with `worker_initializer`.
+    The pool can be reused by many scheduler runs, e.g. in the watch mode.
+    """
+
+    def __init__(
+        self,
+        worker_config: TestRunner.WorkerConfig,
+        processes_count: int,
+        worker_initializer: Optional[WorkerInitializer] = None,
+    ):
+        self.worker_config = worker_config
+        self.processes_count = processes_count
+        self.is_terminated = False
+        # Daemonic processes cannot start processes fuzzing a single test
+        context = (
+            _NonDaemonicWorkerContext()
+            if worker_config.fuzz_workers_count > 1
+            else multiprocessing.get_context()
+        )
+        self._pool = context.Pool(
+            processes=processes_count,
+            initializer=_init_worker,
+            initargs=(worker_config, worker_initializer),
+        )
+
+    def imap_unordered(
+        self,
+        worker: Callable[[TestRunner.WorkerArgs], None],
+        setups: list[TestRunner.WorkerArgs],
+    ) -> Iterator[None]:
+        # Suites are handed out one by one, so they are started in the given order
+        return self._pool.imap_unordered(
+            functools.partial(_run_worker, worker), setups, chunksize=1
+        )
+
+    def terminate(self) -> None:
+        self.is_terminated = True
+        self._pool.terminate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.terminate()
+
+
+class _NonDaemonicWorkerProcess(multiprocessing.get_context().Process):  # type: ignore
+    """
+    The pool marks workers as daemonic. Workers are terminated by the pool anyway.
+    """
+
+    @property
+    def daemon(self) -> bool:
+        return False
+
+    @daemon.setter
+    def daemon(self, _value: bool):
+        pass
+
+
+class _NonDaemonicWorkerContext(type(multiprocessing.get_context())):  # type: ignore
+    Process = _NonDaemonicWorkerProcess
+
+
+# Note: This function has to be top-level function, because it is being pickled by multiprocessing.
+def _init_worker(
+    worker_config: TestRunner.WorkerConfig,
+    worker_initializer: Optional[WorkerInitializer],
+):
+    # Prevent showing a stacktrace on CMD/CTRL+C.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    worker_config.shared_tests_state.register_in_worker()
+    if worker_initializer:
+        worker_initializer(worker_config)
+
+
+def _run_worker(
+    worker: Callable[[TestRunner.WorkerArgs], None], args: TestRunner.WorkerArgs
+):
+    try:
+        worker(args)
+    finally:
+        args.shared_tests_state.flush()
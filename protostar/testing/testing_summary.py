@@ -1,6 +1,7 @@
+import dataclasses
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from protostar.protostar_exception import ProtostarExceptionSilent
 from protostar.testing.test_collector import TestCollector
@@ -44,8 +45,13 @@ class TestingSummary:
         self.extend(initial_test_results)
 
     def extend(self, test_results: List[TestResult]):
-        self.test_results += test_results
         for case_result in test_results:
+            if isinstance(
+                case_result, BrokenTestSuiteResult
+            ) and self._merge_broken_suite(case_result):
+                continue
+
+            self.test_results.append(case_result)
             self.test_suites_mapping[case_result.file_path].append(case_result)
 
             if isinstance(case_result, PassedTestCaseResult):
@@ -59,6 +65,32 @@ class TestingSummary:
             if isinstance(case_result, SkippedTestCaseResult):
                 self.explicitly_skipped.append(case_result)
 
+    def find_broken_suite(self, file_path: Path) -> Optional[BrokenTestSuiteResult]:
+        for broken_suite in self.broken_suites:
+            if broken_suite.file_path == file_path:
+                return broken_suite
+        return None
+
+    def _merge_broken_suite(self, broken_suite: BrokenTestSuiteResult) -> bool:
+        """
+        Shards of a split suite are executed separately, so each of them reports the suite as broken.
+        Such reports are merged into the first one, so the suite is counted once.
+        """
+        reported = self.find_broken_suite(broken_suite.file_path)
+        if reported is None:
+            return False
+        merged = dataclasses.replace(
+            reported,
+            test_case_names=reported.test_case_names + broken_suite.test_case_names,
+        )
+        for results in (
+            self.test_results,
+            self.test_suites_mapping[reported.file_path],
+            self.broken_suites,
+        ):
+            results[results.index(reported)] = merged
+        return True
+
     def get_skipped_test_cases_count(self) -> int:
         return _calculate_skipped(
             broken_count=len(self.broken),
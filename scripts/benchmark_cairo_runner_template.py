@@ -0,0 +1,54 @@
+import dataclasses
+from time import perf_counter
+
+from starkware.cairo.common.cairo_function_runner import CairoFunctionRunner
+from starkware.cairo.lang.compiler.cairo_compile import compile_cairo
+from starkware.cairo.lang.compiler.program import Program
+from starkware.crypto.signature.signature import FIELD_PRIME
+
+from protostar.cairo.cairo_function_runner_facade import (
+    RUNNER_LAYOUT,
+    CairoRunnerTemplate,
+)
+
+CAIRO_CODE = """
+func add(a, b) -> (res: felt) {
+    return (res=a + b);
+}
+"""
+
+# Roughly the size of a test suite compiled to CASM
+PROGRAM_PADDING_SIZE = 20_000
+RUNS_COUNT = 20
+
+
+def compile_program() -> Program:
+    program = compile_cairo(CAIRO_CODE, prime=FIELD_PRIME)
+    return dataclasses.replace(
+        program, data=[*program.data, *([0] * PROGRAM_PADDING_SIZE)]
+    )
+
+
+def benchmark_runner_creation():
+    program = compile_program()
+
+    start = perf_counter()
+    for _ in range(RUNS_COUNT):
+        runner = CairoFunctionRunner(program=program, layout=RUNNER_LAYOUT)
+        runner.load_data(runner.program_base, program.data)
+    cold_runner_time = (perf_counter() - start) / RUNS_COUNT
+
+    start = perf_counter()
+    runner_template = CairoRunnerTemplate(program)
+    for _ in range(RUNS_COUNT):
+        runner_template.create_runner()
+    template_runner_time = (perf_counter() - start) / RUNS_COUNT
+
+    print(
+        f"Runner creation per test: {cold_runner_time * 1000:.3f}ms without template, "
+        f"{template_runner_time * 1000:.3f}ms with template"
+    )
+
+
+if __name__ == "__main__":
+    benchmark_runner_creation()
@@ -237,7 +237,11 @@ class ProtostarFixture:
         return await self._deploy_account_command.run(args)
 
     async def test_cairo0(
-        self, targets: list[str], last_failed: bool = False, estimate_gas: bool = False
+        self,
+        targets: list[str],
+        last_failed: bool = False,
+        estimate_gas: bool = False,
+        workers: Optional[int] = None,
     ) -> TestingSummary:
         args = Namespace()
         args.target = targets
@@ -252,6 +256,9 @@ class ProtostarFixture:
         args.last_failed = last_failed
         args.max_steps = None
         args.estimate_gas = estimate_gas
+        args.workers = workers
+        args.setup_cache = False
+        args.fuzz_workers = 1
 
         return await self._test_cairo0_command.run(args)
 
@@ -394,6 +401,8 @@ class ProtostarFixture:
         self,
         target: Union[str, Path],
         cairo_path: Optional[list[Path]] = None,
+        seed: Optional[int] = None,
+        fuzz_workers_count: int = 1,
     ) -> TestingSummary:
         """
         Runs test runner safely, without assertions on state of the summary and cache mechanism
@@ -415,12 +424,15 @@ class ProtostarFixture:
             targets=targets,
             messenger=messenger_factory.human(),
             cairo_path=cairo_path,
+            seed=seed,
+            fuzz_workers_count=fuzz_workers_count,
         )
 
     async def test(
         self,
         target: Union[str, Path],
         linked_libraries: Optional[list[Tuple[Path, PackageName]]] = None,
+        estimate_gas: bool = False,
     ) -> TestingSummary:
         """
         Runs test runner safely, without assertions on state of the summary and cache mechanism
@@ -442,6 +454,7 @@ class ProtostarFixture:
             targets=targets,
             messenger=messenger_factory.human(),
             linked_libraries=linked_libraries,
+            gas_estimation_enabled=estimate_gas,
         )
 
     def _parse(
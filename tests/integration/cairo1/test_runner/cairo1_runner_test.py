@@ -1,7 +1,11 @@
 from pathlib import Path
 
 import pytest
+from starkware.cairo.lang.vm.cairo_pie import ExecutionResources
 
+import protostar.cairo.bindings.cairo_bindings as cairo1
+from protostar.cairo.cairo1_test_suite_parser import ProtostarCasm
+from protostar.cairo.cairo_function_runner_facade import CairoRunnerFacade
 from tests.integration._conftest import ProtostarFixture
 from tests.integration.conftest import (
     CreateProtostarProjectFixture,
@@ -28,6 +32,47 @@ async def test_cairo_1_runner(protostar: ProtostarFixture, datadir: Path):
     )
 
 
+async def test_cairo_1_runner_reports_execution_resources(
+    protostar: ProtostarFixture, datadir: Path
+):
+    test_path = datadir / "test_cairo1_builtins.cairo"
+    testing_summary = await protostar.test(test_path, estimate_gas=True)
+
+    assert len(testing_summary.passed) == 1
+    execution_resources = testing_summary.passed[0].execution_resources
+    assert execution_resources is not None
+    assert str(execution_resources.n_steps) == str(
+        _run_test_case_directly(test_path, "test_using_builtins").n_steps
+    )
+    builtins = execution_resources.builtin_name_to_count_map
+    assert str(builtins["pedersen_builtin"]) == "1"
+    assert str(builtins["bitwise_builtin"]) == "1"
+    assert str(builtins["ec_op_builtin"]) == "0"
+    assert execution_resources.estimated_gas is not None
+
+
+def _run_test_case_directly(test_path: Path, test_case_name: str) -> ExecutionResources:
+    test_collector_output = cairo1.collect_tests(
+        input_path=test_path,
+        linked_libraries=[(test_path, "test")],
+    )
+    assert test_collector_output.sierra_output
+    protostar_casm_json = cairo1.compile_protostar_sierra_to_casm(
+        named_tests=test_collector_output.collected_tests,
+        input_data=test_collector_output.sierra_output,
+    )
+    assert protostar_casm_json
+    protostar_casm = ProtostarCasm.from_json(protostar_casm_json)
+    cairo_runner_facade = CairoRunnerFacade(program=protostar_casm.program)
+    (offset,) = [
+        offset
+        for name, offset in protostar_casm.offset_map.items()
+        if name.endswith(f"::{test_case_name}")
+    ]
+    cairo_runner_facade.run_from_offset(offset=offset)
+    return cairo_runner_facade.get_execution_resources()
+
+
 async def test_cairo_1_runner_with_external_lib(
     protostar: ProtostarFixture, datadir: Path
 ):
@@ -0,0 +1,9 @@
+extern type Bitwise;
+extern fn bitwise(a: u128, b: u128) -> (u128, u128, u128) implicits(Bitwise) nopanic;
+
+#[test]
+fn test_using_builtins() {
+    pedersen(1, 2);
+    bitwise(1_u128, 1_u128);
+    assert(1 == 1, 'simple check');
+}
@@ -1,6 +1,7 @@
 import pytest
 from pytest import CaptureFixture
 
+from protostar.protostar_exception import ProtostarException
 from tests.data.contracts import EMPTY_TEST
 from tests.integration.conftest import (
     CreateProtostarProjectFixture,
@@ -35,3 +36,10 @@ async def test_gas_estimation_for_empty_function(
     )
 
     assert "gas=4556" in capsys.readouterr().out
+
+
+async def test_rejecting_no_workers(protostar_project: ProtostarProjectFixture):
+    with pytest.raises(ProtostarException):
+        await protostar_project.protostar.test_cairo0(
+            targets=["::test_increase_balance"], workers=0
+        )
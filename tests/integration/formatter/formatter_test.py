@@ -138,6 +138,25 @@ async def test_formatter_ignore_broken(protostar: ProtostarFixture):
     }
 
 
+async def test_formatter_skipping_files_formatted_previously(
+    protostar: ProtostarFixture,
+):
+    protostar.format(["to_format"])
+    results = FormattingResultCollector()
+
+    summary = protostar.format(
+        ["to_format"], check=True, verbose=True, on_formatting_result=results
+    )
+
+    assert len(summary.broken) == 1
+    assert len(summary.correct) == 3
+    assert len(summary.incorrect) == 0
+    assert results.count_by_type_and_check() == {
+        (BrokenFormattingResult, True): 1,
+        (CorrectFormattingResult, True): 3,
+    }
+
+
 def assert_contents_equal(filepath1: str, filepath2: str):
     assert Path(filepath1).read_text() == Path(filepath2).read_text()
 
@@ -1,8 +1,18 @@
 from pathlib import Path
+from typing import Any, Dict, Tuple
 
-from protostar.testing.test_results import PassedFuzzTestCaseResult
+from protostar.testing.fuzzing.fuzz_input_exception_metadata import (
+    FuzzInputExceptionMetadata,
+)
+from protostar.testing.test_output_recorder import OutputName
+from protostar.testing.test_results import (
+    FailedFuzzTestCaseResult,
+    PassedFuzzTestCaseResult,
+    TestCaseResult,
+)
 from protostar.testing.test_config import TestConfig
 from tests.integration.conftest import (
+    CreateProtostarProjectFixture,
     RunCairo0TestRunnerFixture,
     assert_cairo_test_cases,
 )
@@ -157,3 +167,79 @@ async def test_parameterized_with_examples_tests(
     passed_list.sort()
     # TestConfig().fuzz_max_examples is a default value for max examples
     assert passed_list == [1, 2, 7, TestConfig().fuzz_max_examples]
+
+
+async def test_fuzzing_in_many_processes(
+    create_protostar_project: CreateProtostarProjectFixture,
+):
+    first_results = await run_fuzz_workers_test(create_protostar_project)
+    second_results = await run_fuzz_workers_test(create_protostar_project)
+
+    passed, failed = first_results
+    assert passed.fuzz_runs_count == 10
+    assert_run_captures(passed, runs_count=10)
+    assert failed.fuzz_runs_count is not None
+    assert failed.exception.execution_info["fuzz_runs"] == failed.fuzz_runs_count
+    assert FuzzInputExceptionMetadata({"a": 10}) in failed.exception.metadata
+    assert_run_captures(failed, runs_count=failed.fuzz_runs_count)
+    # The shrunk input is executed last
+    assert failed.captured_stdout[("test", failed.fuzz_runs_count)] == "a = 10\n"
+    assert summarize_fuzz_results(first_results) == summarize_fuzz_results(
+        second_results
+    )
+
+
+async def run_fuzz_workers_test(
+    create_protostar_project: CreateProtostarProjectFixture,
+) -> Tuple[PassedFuzzTestCaseResult, FailedFuzzTestCaseResult]:
+    # Every run uses a new project, so examples saved by the other run are not replayed
+    with create_protostar_project() as protostar_project:
+        protostar_project.create_files(
+            {"tests/test_fuzz.cairo": Path(__file__).parent / "fuzz_workers_test.cairo"}
+        )
+        testing_summary = (
+            await protostar_project.protostar.run_cairo0_test_runner_cairo0(
+                "tests/test_fuzz.cairo", seed=10, fuzz_workers_count=2
+            )
+        )
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=["test_fuzz_pass"],
+        expected_failed_test_cases_names=["test_fuzz_fails"],
+    )
+    (passed,) = testing_summary.passed
+    (failed,) = testing_summary.failed
+    assert isinstance(passed, PassedFuzzTestCaseResult)
+    assert isinstance(failed, FailedFuzzTestCaseResult)
+    return passed, failed
+
+
+def assert_run_captures(test_case_result: TestCaseResult, runs_count: int):
+    run_captures = get_run_captures(test_case_result)
+    assert sorted(run_captures) == [
+        ("test", run_no) for run_no in range(1, runs_count + 1)
+    ]
+    assert all(capture.startswith("a = ") for capture in run_captures.values())
+
+
+def get_run_captures(test_case_result: TestCaseResult) -> Dict[OutputName, str]:
+    return {
+        name: capture
+        for name, capture in test_case_result.captured_stdout.items()
+        if isinstance(name, tuple)
+    }
+
+
+def summarize_fuzz_results(
+    results: Tuple[PassedFuzzTestCaseResult, FailedFuzzTestCaseResult]
+) -> Tuple[Any, ...]:
+    passed, failed = results
+    return (
+        passed.fuzz_runs_count,
+        get_run_captures(passed),
+        failed.fuzz_runs_count,
+        get_run_captures(failed),
+        [metadata.format() for metadata in failed.exception.metadata],
+        failed.exception.execution_info,
+    )
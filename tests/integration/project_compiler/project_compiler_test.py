@@ -2,6 +2,7 @@ import json
 from pathlib import Path
 
 import pytest
+from pytest_mock import MockerFixture
 
 from protostar.compiler import Cairo0ProjectCompiler
 from protostar.compiler.project_compiler_exceptions import CompilationException
@@ -91,3 +92,30 @@ def test_handling_not_existing_main_files(tmp_path: Path, datadir: Path):
 
     with pytest.raises(StarknetCompiler.FileNotFoundException):
         project_compiler.compile_project(output_dir=tmp_path)
+
+
+def test_compiling_unchanged_contract_once(datadir: Path, mocker: MockerFixture):
+    project_root_path = datadir / "importing"
+    compile_contract_spy = mocker.spy(StarknetCompiler, "compile_contract")
+    contract_paths = [project_root_path / "entry_point.cairo"]
+    config = ProjectCompilerConfig(relative_cairo_path=[project_root_path / "modules"])
+
+    def compile_contract():
+        return create_project_compiler(
+            project_root_path=project_root_path,
+            configuration_file=FakeConfigurationFile(),
+        ).compile_contract_from_contract_source_paths(contract_paths, config)
+
+    compiled_contract = compile_contract()
+    cached_compiled_contract = compile_contract()
+    assert compile_contract_spy.call_count == 1
+    assert cached_compiled_contract.abi == compiled_contract.abi
+
+    imported_module_path = (
+        project_root_path / "modules" / "some_lib" / "constants.cairo"
+    )
+    imported_module_path.write_text(
+        imported_module_path.read_text("utf-8") + "\n", "utf-8"
+    )
+    compile_contract()
+    assert compile_contract_spy.call_count == 2